@@ -0,0 +1,57 @@
+"""Benchmark YamlSource loaders on a large settings file.
+
+Usage: python benchmarks/yaml_source.py [NUMBER_OF_SECTIONS]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from concrete_settings.contrib.sources import YamlSource
+
+
+def make_settings_yaml(sections: int) -> str:
+    lines = []
+    for i in range(sections):
+        lines.append(f'SECTION_{i}:')
+        lines.append(f'  NAME: section-{i}')
+        lines.append(f'  ENABLED: {"true" if i % 2 else "false"}')
+        lines.append(f'  TIMEOUT: {i * 0.5}')
+        lines.append(f'  RETRIES: {i % 7}')
+        lines.append('  HOSTS:')
+        for j in range(5):
+            lines.append(f'    - host-{i}-{j}.example.com')
+        lines.append('  OPTIONS:')
+        for j in range(5):
+            lines.append(f'    OPTION_{j}: "value {j}"')
+    return '\n'.join(lines) + '\n'
+
+
+def bench(path: str, use_libyaml: bool, number: int) -> float:
+    YamlSource.use_libyaml = use_libyaml
+    loader_name = YamlSource.loader().__name__
+    seconds = min(
+        timeit.repeat(lambda: YamlSource._read_file(path), number=number, repeat=3)
+    )
+    per_load = seconds / number
+    print(f'{loader_name:>14}: {per_load * 1000:9.2f} ms per load')
+    return per_load
+
+
+def main():
+    sections = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False) as f:
+        f.write(make_settings_yaml(sections))
+    try:
+        size_kb = os.path.getsize(f.name) / 1024
+        print(f'Loading {sections} sections ({size_kb:.0f} KiB) YAML file')
+        pure = bench(f.name, use_libyaml=False, number=3)
+        fast = bench(f.name, use_libyaml=True, number=3)
+        print(f'{"speedup":>14}: {pure / fast:9.1f}x')
+    finally:
+        os.remove(f.name)
+
+
+if __name__ == '__main__':
+    main()
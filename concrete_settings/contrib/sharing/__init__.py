@@ -0,0 +1,9 @@
+from .memory import (  # noqa: F401 # imported but unused
+    MemoryUsage,
+    SettingsMemoryProbe,
+    process_memory_usage,
+)
+from .shared_memory import (  # noqa: F401 # imported but unused
+    SharedSettings,
+    SharedSettingsPublisher,
+)
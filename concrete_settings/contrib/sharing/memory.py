@@ -0,0 +1,120 @@
+"""Measuring memory shared between forked processes (Linux only).
+
+After fork, the memory pages of the parent process are shared
+with the child until either process writes to them. Writing
+a single reference count of an object is enough to copy its page.
+"""
+import mmap
+import struct
+from array import array
+from typing import Any, Dict, Iterator, List, NamedTuple, Set, Union
+
+from concrete_settings.exceptions import ConcreteSettingsError
+from concrete_settings.setting import PropertySetting
+from concrete_settings.settings import Settings
+
+_PAGE_SIZE = mmap.PAGESIZE
+
+# /proc/<pid>/pagemap entry flags
+_PAGEMAP_ENTRY = struct.Struct('<Q')
+_PAGE_PRESENT = 1 << 63
+_PAGE_EXCLUSIVELY_MAPPED = 1 << 56
+
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+
+class MemoryUsage(NamedTuple):
+    """Resident memory in bytes."""
+
+    shared: int
+    private: int
+
+
+def process_memory_usage(pid: Union[int, str] = 'self') -> MemoryUsage:
+    """Return the shared and private resident memory of a process."""
+    usage = {}
+    for line in _read_proc(f'/proc/{pid}/smaps_rollup').decode().splitlines()[1:]:
+        key, _, value = line.partition(':')
+        usage[key] = int(value.split()[0]) * 1024
+
+    return MemoryUsage(
+        shared=usage['Shared_Clean'] + usage['Shared_Dirty'],
+        private=usage['Private_Clean'] + usage['Private_Dirty'],
+    )
+
+
+class SettingsMemoryProbe:
+    """Measures whether the memory pages of settings objects are shared.
+
+    Create the probe in the parent process before fork
+    and call :meth:`measure` in the forked process.
+
+    The probe records the pages which hold the settings objects,
+    the nested settings, the values and the items of the values
+    which are builtin containers. The records are kept outside
+    of the objects, so measuring does not write to the measured pages.
+    Only the fixed-size part of the objects is taken into account,
+    e.g. the items array of a list is not.
+    """
+
+    def __init__(self, settings: Settings):
+        pages: Set[int] = set()
+        for obj in _settings_objects(settings):
+            start = id(obj)
+            end = start + type(obj).__basicsize__ - 1
+            pages.update(range(start // _PAGE_SIZE, end // _PAGE_SIZE + 1))
+        self._pages = array('Q', sorted(pages))
+
+    def measure(self) -> MemoryUsage:
+        """Return the size of shared and private pages of the settings objects
+        in the current process."""
+        shared = private = 0
+        with _open_proc('/proc/self/pagemap') as pagemap:
+            for page in self._pages:
+                pagemap.seek(page * _PAGEMAP_ENTRY.size)
+                (entry,) = _PAGEMAP_ENTRY.unpack(pagemap.read(_PAGEMAP_ENTRY.size))
+                if not entry & _PAGE_PRESENT:
+                    continue
+                if entry & _PAGE_EXCLUSIVELY_MAPPED:
+                    private += _PAGE_SIZE
+                else:
+                    shared += _PAGE_SIZE
+        return MemoryUsage(shared=shared, private=private)
+
+
+def _settings_objects(settings: Settings) -> Iterator[Any]:
+    # keeps the objects alive, so that their ids are not reused
+    seen: Dict[int, Any] = {}
+    stack: List[Any] = [settings]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen[id(obj)] = obj
+        yield obj
+
+        if isinstance(obj, Settings):
+            stack.append(obj.__dict__)
+            for name, setting in obj.settings_attributes():
+                # property settings values are computed on access
+                if not isinstance(setting, PropertySetting):
+                    stack.append(getattr(obj, name))
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, _CONTAINER_TYPES):
+            stack.extend(obj)
+
+
+def _read_proc(path: str) -> bytes:
+    with _open_proc(path) as f:
+        return f.read()
+
+
+def _open_proc(path: str):
+    try:
+        return open(path, 'rb')
+    except FileNotFoundError as e:
+        raise ConcreteSettingsError(
+            f'Measuring shared memory requires Linux: {path} is not available'
+        ) from e
@@ -0,0 +1,252 @@
+"""Sharing resolved settings between processes via shared memory.
+
+A publisher (e.g. the master process of a pre-fork server) resolves
+settings once and publishes them as a snapshot in a shared memory block.
+Worker processes attach to the published settings instead of
+resolving their own copies.
+
+Publishing writes a new data block and switches a small control block
+to it. The control block holds a generation counter, which is
+guarded by a sequence lock, so that readers never observe
+a half-written control block.
+"""
+import functools
+import struct
+import time
+from typing import Any, Generic, Optional, Set, Tuple, Type, TypeVar
+
+from concrete_settings.exceptions import ConcreteSettingsError
+from concrete_settings.settings import Settings
+from concrete_settings.snapshot import decode_snapshot, snapshot_chunks
+
+SettingsT = TypeVar('SettingsT', bound=Settings)
+
+CONTROL_MAGIC = b'CSSHM001'
+
+# magic, sequence number, data block name length, data block name
+_CONTROL = struct.Struct('<8sQH238s')
+_SEQUENCE_OFFSET = 8
+_SEQUENCE = struct.Struct('<Q')
+
+_MAX_READ_ATTEMPTS = 100
+
+# Names of the blocks created by publishers of this process
+_published_names: Set[str] = set()
+
+
+class SharedSettingsError(ConcreteSettingsError):
+    pass
+
+
+class SharedSettingsPublisher:
+    """Publishes settings to shared memory under the given name.
+
+    The publisher owns the shared memory blocks and unlinks them
+    when closed. The data block of a superseded generation is unlinked
+    right away: the processes which have it attached keep
+    the memory mapped until they detach.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.generation = 0
+        self._control = _create(name, _CONTROL.size)
+        _CONTROL.pack_into(self._control.buf, 0, CONTROL_MAGIC, 0, 0, b'')
+        self._data: Optional[Any] = None
+
+    def publish(self, settings: Settings) -> int:
+        """Publish settings as a new generation, return the generation number."""
+        chunks = snapshot_chunks(settings)
+        size = sum(memoryview(chunk).nbytes for chunk in chunks)
+
+        generation = self.generation + 1
+        data = _create(f'{self.name}-{generation}', size)
+        offset = 0
+        for chunk in chunks:
+            chunk_size = memoryview(chunk).nbytes
+            data.buf[offset:offset + chunk_size] = memoryview(chunk).cast('B')
+            offset += chunk_size
+
+        data_name = data.name.lstrip('/').encode()
+        sequence = generation * 2
+        # odd sequence number marks the control block being written
+        _SEQUENCE.pack_into(self._control.buf, _SEQUENCE_OFFSET, sequence - 1)
+        _CONTROL.pack_into(
+            self._control.buf, 0, CONTROL_MAGIC, sequence - 1, len(data_name), data_name
+        )
+        _SEQUENCE.pack_into(self._control.buf, _SEQUENCE_OFFSET, sequence)
+
+        previous, self._data = self._data, data
+        self.generation = generation
+        if previous is not None:
+            _unlink(previous)
+        return generation
+
+    def close(self):
+        """Unlink the shared memory blocks."""
+        for block in (self._data, self._control):
+            if block is not None:
+                _unlink(block)
+        self._data = None
+        self._control = None
+
+    def __enter__(self) -> 'SharedSettingsPublisher':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SharedSettings(Generic[SettingsT]):
+    """Settings attached to shared memory published by :class:`SharedSettingsPublisher`.
+
+    The settings are frozen. Values serialized as out-of-band pickle
+    buffers (e.g. NumPy arrays) refer to the shared memory directly
+    and are read-only, other values are unpickled into the process memory.
+    """
+
+    def __init__(self, settings_cls: Type[SettingsT], name: str):
+        self.settings_cls = settings_cls
+        self.name = name
+        self.generation = 0
+
+        self._control = _attach(name)
+        magic = bytes(self._control.buf[:len(CONTROL_MAGIC)])
+        if magic != CONTROL_MAGIC:
+            self._control.close()
+            raise SharedSettingsError(f'{name} is not a shared settings memory block')
+
+        self._settings: Optional[SettingsT] = None
+        self._block: Optional[Any] = None
+        self.refresh()
+
+    @property
+    def settings(self) -> SettingsT:
+        """The settings of the latest attached generation."""
+        if self._settings is None:
+            raise SharedSettingsError(f'No settings have been published to {self.name}')
+        return self._settings
+
+    def changed(self) -> bool:
+        """Return True if a new generation has been published since the last refresh."""
+        (sequence,) = _SEQUENCE.unpack_from(self._control.buf, _SEQUENCE_OFFSET)
+        return sequence // 2 != self.generation or sequence % 2 == 1
+
+    def refresh(self) -> bool:
+        """Attach to the latest generation if it has changed.
+
+        Return True if new settings have been attached."""
+        for _ in range(_MAX_READ_ATTEMPTS):
+            generation, data_name = self._read_control()
+            if generation == self.generation:
+                return False
+
+            try:
+                block = _attach(data_name)
+            except FileNotFoundError:
+                # superseded by a newer generation in the meantime
+                continue
+
+            settings = decode_snapshot(self.settings_cls, block.buf, self.name)
+            settings._freeze()
+
+            previous_block = self._block
+            self._settings = settings
+            self._block = block
+            self.generation = generation
+            if previous_block is not None:
+                _detach(previous_block)
+            return True
+
+        raise SharedSettingsError(f'Could not read shared settings {self.name}')
+
+    def close(self):
+        """Detach from shared memory.
+
+        The blocks still referenced by the settings values
+        are detached when the values are garbage collected."""
+        self._settings = None
+        if self._block is not None:
+            _detach(self._block)
+            self._block = None
+        self._control.close()
+
+    def __enter__(self) -> 'SharedSettings[SettingsT]':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _read_control(self) -> Tuple[int, str]:
+        for _ in range(_MAX_READ_ATTEMPTS):
+            buf = self._control.buf
+            (sequence_before,) = _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)
+            if sequence_before % 2 == 1:
+                time.sleep(0)
+                continue
+
+            _, _, name_len, name = _CONTROL.unpack_from(buf, 0)
+            (sequence_after,) = _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)
+            if sequence_before == sequence_after:
+                return sequence_before // 2, name[:name_len].decode()
+
+        raise SharedSettingsError(f'Could not read shared settings {self.name}')
+
+
+def _create(name: str, size: int) -> Any:
+    block = _shared_memory_module().SharedMemory(name=name, create=True, size=size)
+    _published_names.add(block.name)
+    return block
+
+
+def _unlink(block: Any):
+    block.close()
+    block.unlink()
+    _published_names.discard(block.name)
+
+
+def _attach(name: str) -> Any:
+    block_cls = _attached_block_class()
+    try:
+        return block_cls(name=name, track=False)
+    except TypeError:
+        pass
+
+    # Python < 3.13: prevent the resource tracker of an attaching
+    # process from unlinking the block when the process exits
+    block = block_cls(name=name)
+    if block.name not in _published_names:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(block._name, 'shared_memory')
+    return block
+
+
+def _detach(block: Any):
+    try:
+        block.close()
+    except BufferError:
+        # The memory is still referenced by values of older settings.
+        # The mapping is released when the values are garbage collected.
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _attached_block_class() -> Type:
+    shared_memory = _shared_memory_module()
+
+    class AttachedBlock(shared_memory.SharedMemory):  # type: ignore
+        def __del__(self):
+            _detach(self)
+
+    return AttachedBlock
+
+
+def _shared_memory_module():
+    try:
+        from multiprocessing import shared_memory
+    except ImportError as e:  # pragma: no cover
+        raise ConcreteSettingsError(
+            'Sharing settings via shared memory requires Python 3.8 or higher'
+        ) from e
+    return shared_memory
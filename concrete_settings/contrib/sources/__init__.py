@@ -2,3 +2,5 @@ from .yaml_source import YamlSource  # noqa: F401 # imported but unused
 from .json_source import JsonSource  # noqa: F401 # imported but unused
 from .envvar_source import EnvVarSource  # noqa: F401 # imported but unused
 from .python_source import PythonSource  # noqa: F401 # imported but unused
+from .http_source import HttpSource  # noqa: F401 # imported but unused
+from .dotenv_source import DotEnvSource  # noqa: F401 # imported but unused
@@ -0,0 +1,189 @@
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from concrete_settings.exceptions import ConcreteSettingsError
+from concrete_settings.sources import (
+    FileSource,
+    NotFound,
+    StringSourceMixin,
+    register_source,
+)
+
+from .envvar_source import env_key
+
+# A value is either a string or a sequence of strings
+# and ${VAR} references, which are expanded on load.
+_Value = Union[str, Tuple[Union[str, '_Reference'], ...]]
+
+_ENTRY = re.compile(
+    r'''
+    [ \t]*
+    (?:
+        (?:export[ \t]+)?
+        (?P<key>[A-Za-z_][A-Za-z0-9_]*)
+        [ \t]*=[ \t]*
+        (?:
+            '(?P<single>[^']*)'[ \t]*(?:\#[^\n]*)?
+          | "(?P<double>(?:\\.|[^"\\])*)"[ \t]*(?:\#[^\n]*)?
+          | (?P<bare>[^\n]*)
+        )
+      | (?:\#[^\n]*)?
+    )
+    \r?(?:\n|\Z)
+    ''',
+    re.VERBOSE,
+)
+
+_INLINE_COMMENT = re.compile(r'[ \t]#.*')
+_REFERENCE = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}')
+_ESCAPE_OR_REFERENCE = re.compile(r'\\(.)|\$\{([A-Za-z_][A-Za-z0-9_]*)\}', re.DOTALL)
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class _Reference:
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+@register_source
+class DotEnvSource(StringSourceMixin, FileSource):
+    """Reads settings from a ``.env`` file.
+
+    Nested settings are looked up by the same names as in
+    :class:`EnvVarSource`, e.g. ``DB_HOST``.
+    ``${VAR}`` references are expanded with the values defined
+    earlier in the file or with environmental variables.
+    """
+
+    extensions = ['.env']
+
+    # variables are named by settings paths, e.g. DB_HOST
+    nested_documents = False
+
+    def __init__(self, path: str, *, expand: bool = True):
+        super().__init__(path)
+        self.expand = expand
+
+    def read(self, setting, parents: Tuple[str, ...] = ()) -> Union[Type[NotFound], Any]:
+        self.prefetch()
+
+        val = self._data.get(env_key(parents, setting.name))  # type: ignore
+        if val is None:
+            return NotFound
+        return self.convert_value(val, setting.type_hint)
+
+    def _load_data(self) -> Dict[str, str]:
+        # The parsed entries are cached, references
+        # to environmental variables are expanded on every load.
+        if self.cache is None:
+            entries = self._parse_entries(self.path)
+        else:
+            entries = self.cache.get(
+                self.path, self._parse_entries, self._cache_variant()
+            )
+        return _expand(entries)
+
+    def _parse_file(self, path: str) -> Dict[str, Any]:
+        return _expand(self._parse_entries(path))
+
+    def _parse_entries(self, path: str) -> List[Tuple[str, _Value]]:
+        with open(path) as f:
+            return parse_dotenv(f.read(), self.expand, path)
+
+    def _cache_variant(self) -> Tuple:
+        return (self.__class__, self.expand)
+
+
+def parse_dotenv(
+    text: str, expand: bool = True, path: Optional[str] = None
+) -> List[Tuple[str, _Value]]:
+    """Parse contents of a .env file in a single pass.
+
+    Return (key, value) pairs in order of appearance.
+    Values containing ``${VAR}`` references are returned
+    as tuples of strings and references if `expand` is True."""
+    entries: List[Tuple[str, _Value]] = []
+    pos = 0
+    end = len(text)
+    while pos < end:
+        match = _ENTRY.match(text, pos)
+        if match is None or match.end() == pos:
+            line_no = text.count('\n', 0, pos) + 1
+            raise ConcreteSettingsError(
+                f'Error parsing {path or ".env"} at line {line_no}: '
+                f'{text[pos:].splitlines()[0]!r}'
+            )
+        pos = match.end()
+
+        key = match.group('key')
+        if key is None:
+            continue
+
+        single, double, bare = match.group('single', 'double', 'bare')
+        value: _Value
+        if single is not None:
+            value = single
+        elif double is not None:
+            value = _parse_double_quoted(double, expand)
+        else:
+            bare = _INLINE_COMMENT.sub('', bare).strip()
+            value = _parse_bare(bare) if expand else bare
+        entries.append((key, value))
+    return entries
+
+
+def _expand(entries: List[Tuple[str, _Value]]) -> Dict[str, str]:
+    data: Dict[str, str] = {}
+    for key, value in entries:
+        if not isinstance(value, str):
+            value = ''.join(
+                part
+                if isinstance(part, str)
+                else data.get(part.name, os.environ.get(part.name, ''))
+                for part in value
+            )
+        data[key] = value
+    return data
+
+
+def _parse_double_quoted(value: str, expand: bool) -> _Value:
+    if '\\' not in value and (not expand or '${' not in value):
+        return value
+
+    parts: List[Union[str, _Reference]] = []
+    pos = 0
+    for match in _ESCAPE_OR_REFERENCE.finditer(value):
+        parts.append(value[pos:match.start()])
+        escaped, name = match.groups()
+        if escaped is not None:
+            parts.append(_ESCAPES.get(escaped, escaped))
+        elif expand:
+            parts.append(_Reference(name))
+        else:
+            parts.append(match.group())
+        pos = match.end()
+    parts.append(value[pos:])
+    return _join_parts(parts)
+
+
+def _parse_bare(value: str) -> _Value:
+    if '${' not in value:
+        return value
+
+    parts: List[Union[str, _Reference]] = []
+    pos = 0
+    for match in _REFERENCE.finditer(value):
+        parts.append(value[pos:match.start()])
+        parts.append(_Reference(match.group(1)))
+        pos = match.end()
+    parts.append(value[pos:])
+    return _join_parts(parts)
+
+
+def _join_parts(parts: List[Union[str, _Reference]]) -> _Value:
+    if all(isinstance(part, str) for part in parts):
+        return ''.join(parts)  # type: ignore
+    return tuple(part for part in parts if part != '')
@@ -1,3 +1,4 @@
+import functools
 import os
 from typing import Any, Tuple, Optional, Union, Type
 
@@ -9,6 +10,15 @@ from concrete_settings.sources import (
     NotFound)
 
 
+@functools.lru_cache(maxsize=None)
+def env_key(parents: Tuple[str, ...], name: str) -> str:
+    """Return the variable name of a setting, e.g. ``DB_HOST``
+       for setting ``HOST`` nested in ``db`` settings.
+
+       The names are computed once per setting path."""
+    return '_'.join((*map(str.upper, parents), name))
+
+
 @register_source
 class EnvVarSource(StringSourceMixin, Source):
     def __init__(self):
@@ -22,9 +32,7 @@ class EnvVarSource(StringSourceMixin, Source):
             return None
 
     def read(self, setting, parents: Tuple[str, ...] = ()) -> Union[Type[NotFound], Any]:
-        parents_upper = map(str.upper, parents)
-        key = '_'.join((*parents_upper, setting.name))
-        val = os.environ.get(key)
+        val = os.environ.get(env_key(parents, setting.name))
 
         if val is None:
             return NotFound
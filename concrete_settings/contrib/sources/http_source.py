@@ -0,0 +1,178 @@
+import http.client
+import json
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from urllib.parse import urlsplit
+
+from concrete_settings.exceptions import ConcreteSettingsError
+from concrete_settings.sources import (
+    AnySource,
+    NotFound,
+    Source,
+    register_source,
+    unshared_value,
+)
+
+_PoolKey = Tuple[str, str]
+
+
+class ConnectionPool:
+    """A thread-safe pool of keep-alive HTTP(S) connections."""
+
+    def __init__(self, max_idle_per_host: int = 4, timeout: float = 10.0):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+
+        self._idle: Dict[_PoolKey, List[http.client.HTTPConnection]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(
+        self, scheme: str, netloc: str
+    ) -> Iterator[Tuple[http.client.HTTPConnection, bool]]:
+        """Yield a `(connection, reused)` pair.
+
+        The connection is returned to the pool unless an exception is raised."""
+        key = (scheme, netloc)
+        with self._lock:
+            idle = self._idle[key]
+            conn = idle.pop() if idle else None
+
+        reused = conn is not None
+        if conn is None:
+            conn = self._connect(scheme, netloc)
+
+        try:
+            yield conn, reused
+        except BaseException:
+            conn.close()
+            raise
+
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self):
+        with self._lock:
+            connections = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for conn in connections:
+            conn.close()
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+
+@register_source
+class HttpSource(Source):
+    """Reads settings from a JSON document served over HTTP(S).
+
+    The whole document is fetched with a single request, no matter
+    how many settings are read from the source.
+    Responses carrying an ``ETag`` are cached, so that fetching
+    an unchanged document costs a ``304 Not Modified`` response.
+    """
+
+    #: Connections pool shared by all HTTP sources
+    pool = ConnectionPool()
+
+    #: Cached documents: {url: (etag, document)}
+    response_cache: Dict[str, Tuple[str, Any]] = {}
+    _response_cache_lock = threading.Lock()
+
+    def __init__(self, url: str, *, headers: Optional[Dict[str, str]] = None):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ConcreteSettingsError(f'Unsupported URL scheme in {url}')
+
+        self.url = url
+        self.headers = headers or {}
+        self._data: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def get_source(src: AnySource) -> Optional['HttpSource']:
+        if isinstance(src, HttpSource):
+            return src
+        if isinstance(src, str) and src.startswith(('http://', 'https://')):
+            return HttpSource(src)
+        return None
+
+    def read(self, setting, parents: Tuple[str, ...] = ()) -> Union[Type[NotFound], Any]:
+        self.prefetch()
+
+        d = self._data
+        for key in parents:
+            d = d[key]  # type: ignore
+
+        # cached documents are shared by all the sources of the URL
+        return unshared_value(d.get(setting.name, NotFound))  # type: ignore
+
+    def prefetch(self):
+        if self._data is None:
+            self._data = self._fetch()
+
+    def _fetch(self) -> Dict[str, Any]:
+        cached = self.response_cache.get(self.url)
+
+        headers = {'Accept': 'application/json', **self.headers}
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+
+        status, etag, body = self._request(headers)
+
+        if status == 304 and cached is not None:
+            return cached[1]
+
+        if status != 200:
+            raise ConcreteSettingsError(
+                f'Error fetching settings from {self.url}: HTTP status {status}'
+            )
+
+        try:
+            document = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, json.decoder.JSONDecodeError) as e:
+            raise ConcreteSettingsError(
+                f'Error parsing JSON from {self.url}: {e}'
+            ) from e
+
+        if etag:
+            with self._response_cache_lock:
+                self.response_cache[self.url] = (etag, document)
+        return document
+
+    def _request(self, headers: Dict[str, str]) -> Tuple[int, Optional[str], bytes]:
+        parts = urlsplit(self.url)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+
+        try:
+            with self.pool.connection(parts.scheme, parts.netloc) as (conn, reused):
+                try:
+                    return self._send(conn, target, headers)
+                except (http.client.RemoteDisconnected, ConnectionError):
+                    # the server could have closed an idle keep-alive connection
+                    if not reused:
+                        raise
+                    conn.close()
+                    return self._send(conn, target, headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise ConcreteSettingsError(
+                f'Error fetching settings from {self.url}: {e}'
+            ) from e
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPConnection, target: str, headers: Dict[str, str]
+    ) -> Tuple[int, Optional[str], bytes]:
+        conn.request('GET', target, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+        return response.status, response.getheader('ETag'), body
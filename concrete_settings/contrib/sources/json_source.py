@@ -1,32 +1,13 @@
 import json
 
-from typing import Any, Tuple, Union, Type
-
 from concrete_settings.exceptions import ConcreteSettingsError
-from concrete_settings.sources import FileSource, register_source, NotFound
+from concrete_settings.sources import FileSource, register_source
 
 
 @register_source
 class JsonSource(FileSource):
     extensions = ['.json', '.js']
 
-    def __init__(self, path):
-        super().__init__(path)
-        self._data = None
-
-    def read(
-        self, setting, parents: Tuple[str, ...] = ()
-    ) -> Union[Type[NotFound], Any]:
-        if self._data is None:
-            self._data = self._read_file(self.path)
-
-        d = self._data
-        for key in parents:
-            d = d[key]
-
-        val = d.get(setting.name, NotFound)
-        return val
-
     @staticmethod
     def _read_file(path):
         try:
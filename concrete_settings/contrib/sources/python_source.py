@@ -1,33 +1,35 @@
 import importlib.util
 from pathlib import Path
-from typing import Any, Tuple, Union, Type
+from types import CodeType
+from typing import Optional
 
-from concrete_settings.sources import FileSource, register_source, NotFound
+from concrete_settings.sources import FileCache, FileSource, register_source
 
 
 @register_source
 class PythonSource(FileSource):
     extensions = ['.py']
 
-    def __init__(self, path):
-        super().__init__(path)
-        self._data = None
+    #: Cache of compiled settings modules code.
+    #: Code is compiled on every read when set to ``None``.
+    code_cache: Optional[FileCache] = FileCache(max_entries=64)
 
-    def read(self, setting, parents: Tuple[str, ...] = ()) -> Union[Type[NotFound], Any]:
-        if self._data is None:
-            self._data = self._read_file(self.path)
+    @classmethod
+    def _read_file(cls, path: str):
+        module_name = Path(path).stem
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)  # type: ignore
 
-        d = self._data
-        for key in parents:
-            d = d[key]
+        if cls.code_cache is None:
+            code = cls._compile(path)
+        else:
+            code = cls.code_cache.get(path, cls._compile)
 
-        val = d.get(setting.name, NotFound)
-        return val
+        exec(code, vars(module))
+        return vars(module)
 
     @staticmethod
-    def _read_file(path: str):
-        module_name = Path(path).stem
-        spec = importlib.util.spec_from_file_location(module_name, path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)  # type: ignore
-        return vars(module)
+    def _compile(path: str) -> CodeType:
+        with open(path, 'rb') as f:
+            source = f.read()
+        return compile(source, path, 'exec', dont_inherit=True)
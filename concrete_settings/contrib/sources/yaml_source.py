@@ -1,14 +1,20 @@
-from typing import Any, Tuple, Union, Type
+from typing import Any, Dict, Optional, Tuple
 
 from concrete_settings.exceptions import ConcreteSettingsError
-from concrete_settings.sources import FileSource, register_source, NotFound
+from concrete_settings.sources import FileSource, register_source
 
 
 @register_source
 class YamlSource(FileSource):
     extensions = ['.yml', '.yaml']
 
-    def __init__(self, path):
+    #: Use the fast libyaml-based loader when PyYAML is built with libyaml
+    use_libyaml = True
+
+    #: Document key which holds the profile name in a multi-document file
+    profile_key = 'profile'
+
+    def __init__(self, path, profile: Optional[str] = None):
         try:
             import yaml  # noqa: F401 # imported but unused
         except ImportError as e:
@@ -18,29 +24,77 @@ class YamlSource(FileSource):
                 'Perhaps you have forgotten to install PyYAML?'
             ) from e
         super().__init__(path)
-        self._data = None
+        self.profile = profile
 
-    def read(self, setting, parents: Tuple[str, ...] = ()) -> Union[Type[NotFound], Any]:
-        if self._data is None:
-            self._data = self._read_file(self.path)
+    @classmethod
+    def loader(cls):
+        """Return the YAML loader class used to parse files."""
+        import yaml
 
-        d = self._data
+        if cls.use_libyaml:
+            return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        return yaml.SafeLoader
 
-        for key in parents:
-            d = d[key]
+    def _parse_file(self, path: str) -> Dict[str, Any]:
+        if self.profile is None:
+            return self._read_file(path)
+        return self._read_profile(path, self.profile)
 
-        val = d.get(setting.name, NotFound)
-        return val
+    def _cache_variant(self) -> Tuple:
+        return (*super()._cache_variant(), self.profile)
 
-    @staticmethod
-    def _read_file(path):
+    @classmethod
+    def _read_file(cls, path):
         import yaml
 
         try:
             with open(path) as f:
                 raw_data = f.read()
-                return yaml.safe_load(raw_data) or {}
+                return yaml.load(raw_data, Loader=cls.loader()) or {}
+        except FileNotFoundError as e:
+            raise ConcreteSettingsError(f"Source file {path} was not found") from e
+        except yaml.YAMLError as e:
+            raise ConcreteSettingsError(f"Error parsing YAML from {path}: {e}") from e
+
+    @classmethod
+    def _read_profile(cls, path: str, profile: str) -> Dict[str, Any]:
+        """Read the document of the given profile from a multi-document file.
+
+        Documents are composed one by one, but only the matching
+        document is constructed. Documents which follow it are not parsed."""
+        import yaml
+
+        try:
+            with open(path) as f:
+                loader = cls.loader()(f)
+                try:
+                    while loader.check_node():
+                        node = loader.get_node()
+                        if cls._document_profile(node) == profile:
+                            document = loader.construct_document(node)
+                            del document[cls.profile_key]
+                            return document
+                finally:
+                    loader.dispose()
         except FileNotFoundError as e:
             raise ConcreteSettingsError(f"Source file {path} was not found") from e
         except yaml.YAMLError as e:
             raise ConcreteSettingsError(f"Error parsing YAML from {path}: {e}") from e
+
+        raise ConcreteSettingsError(f'Profile "{profile}" was not found in {path}')
+
+    @classmethod
+    def _document_profile(cls, node) -> Optional[str]:
+        import yaml
+
+        if not isinstance(node, yaml.MappingNode):
+            return None
+
+        for key_node, value_node in node.value:
+            if (
+                isinstance(key_node, yaml.ScalarNode)
+                and key_node.value == cls.profile_key
+                and isinstance(value_node, yaml.ScalarNode)
+            ):
+                return value_node.value
+        return None
@@ -0,0 +1 @@
+from .file_watcher import FileWatcher  # noqa: F401 # imported but unused
@@ -0,0 +1,341 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from concrete_settings.exceptions import ConcreteSettingsError, ValidationError
+from concrete_settings.settings import Settings
+from concrete_settings.sources import FileSource, NotFound, get_source
+from concrete_settings.sources.strategies import Strategy, default as default_strategy
+
+logger = logging.getLogger(__name__)
+
+DocumentPath = Tuple[str, ...]
+
+_MISSING = object()
+
+
+class FileWatcher:
+    """Watch a settings file and re-apply its changes to a Settings object.
+
+    The watcher assumes that ``settings`` has already been updated from
+    the file. When the file changes, the new document is compared
+    to the previously applied one and only the settings
+    which correspond to the changed keys are updated and validated.
+
+    All changes are staged on copies of the affected Settings objects
+    and are swapped in only if validation succeeds,
+    so readers observe either the old or the new configuration.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        path: Union[str, Path],
+        strategies: Optional[Dict[str, Strategy]] = None,
+        *,
+        interval: float = 1.0,
+        on_change: Optional[Callable[[List[str]], Any]] = None,
+        on_error: Optional[Callable[[Exception], Any]] = None,
+        use_inotify: Optional[bool] = None,
+    ):
+        self.settings = settings
+        self.path = str(path)
+        self.strategies = strategies if strategies is not None else {}
+        self.interval = interval
+        self.on_change = on_change
+        self.on_error = on_error
+
+        if use_inotify is None:
+            use_inotify = _Inotify.is_available()
+        self.use_inotify = use_inotify
+
+        source = get_source(self.path)
+        if not isinstance(source, FileSource):
+            raise ConcreteSettingsError(f'Cannot watch a non-file source "{path}"')
+        if not source.nested_documents:
+            # changed values are looked up in the parsed file by settings paths
+            raise ConcreteSettingsError(
+                f'Cannot watch "{path}": {type(source).__name__} '
+                'files are not structured as settings'
+            )
+        self._source = source
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._stamp = self._file_stamp()
+        self._document = self._read_document()
+
+    def start(self):
+        assert self._thread is None, 'Watcher has already been started'
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f'FileWatcher({self.path})', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FileWatcher':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def check(self) -> List[str]:
+        """Reload the file if it has been modified since the last check.
+
+        Return names of the updated settings."""
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return []
+
+        self._stamp = stamp
+        return self.reload()
+
+    def reload(self) -> List[str]:
+        """Re-read the file and apply the changed values to settings.
+
+        Return names of the updated settings."""
+        with self._lock:
+            document = self._read_document()
+            changed_paths = diff_documents(self._document, document)
+            if not changed_paths:
+                self._document = document
+                return []
+
+            updated: List[str] = []
+            staged = _stage_changes(
+                self.settings,
+                document,
+                _ChangedPaths(changed_paths),
+                self.settings._strategies_table(self.strategies),
+                (),
+                updated,
+            )
+            if staged is not None:
+                self.settings._commit(staged)
+            self._document = document
+
+        if updated:
+            logger.debug('Reloaded settings %s from %s', updated, self.path)
+            if self.on_change is not None:
+                self.on_change(updated)
+        return updated
+
+    def _run(self):
+        inotify = _Inotify(self.path) if self.use_inotify else None
+        try:
+            while not self._stop_event.is_set():
+                if inotify is not None:
+                    inotify.wait(self.interval)
+                else:
+                    self._stop_event.wait(self.interval)
+
+                if self._stop_event.is_set():
+                    break
+
+                try:
+                    self.check()
+                except Exception as e:
+                    if self.on_error is not None:
+                        self.on_error(e)
+                    else:
+                        logger.exception('Error reloading settings from %s', self.path)
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def _read_document(self) -> Dict[str, Any]:
+        # bypass FileSource.cache: mtime granularity of the file
+        # system could hide a change which has just been detected
+        return self._source._parse_file(self.path)
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def diff_documents(
+    old: Dict[str, Any], new: Dict[str, Any], parents: DocumentPath = ()
+) -> Set[DocumentPath]:
+    """Return paths of keys whose values differ in the two documents.
+
+    Nested dictionaries are compared key by key, so the deepest
+    differing paths are returned."""
+    changed = set()
+    for key in old.keys() | new.keys():
+        old_val = old.get(key, _MISSING)
+        new_val = new.get(key, _MISSING)
+        path = (*parents, key)
+
+        if isinstance(old_val, dict) and isinstance(new_val, dict):
+            changed |= diff_documents(old_val, new_val, path)
+        elif type(old_val) is not type(new_val) or old_val != new_val:
+            changed.add(path)
+    return changed
+
+
+class _ChangedPaths:
+    def __init__(self, paths: Set[DocumentPath]):
+        self._paths = paths
+        self._prefixes = {path[:i] for path in paths for i in range(len(path) + 1)}
+
+    def affects(self, path: DocumentPath) -> bool:
+        """Return True if path, one of its ancestors or descendants has changed"""
+        if path in self._prefixes:
+            return True
+        return any(path[:i] in self._paths for i in range(1, len(path)))
+
+
+def _lookup(document: Dict[str, Any], path: DocumentPath) -> Any:
+    d: Any = document
+    for key in path:
+        if not isinstance(d, dict) or key not in d:
+            return NotFound
+        d = d[key]
+    return d
+
+
+def _stage_changes(
+    settings: Settings,
+    document: Dict[str, Any],
+    changed_paths: _ChangedPaths,
+    strategies: Dict[DocumentPath, Strategy],
+    parents: DocumentPath,
+    updated: List[str],
+) -> Optional[Settings]:
+    """Apply changes to a copy of settings.
+
+    Return the validated copy or None if the settings are not affected."""
+    staged: Optional[Settings] = None
+    staged_names = []
+
+    for name, setting in settings.settings_attributes():
+        path = (*parents, name)
+        if not changed_paths.affects(path):
+            continue
+
+        if isinstance(setting, Settings):
+            nested_staged = _stage_changes(
+                getattr(settings, name),
+                document,
+                changed_paths,
+                strategies,
+                path,
+                updated,
+            )
+            if nested_staged is None:
+                continue
+            staged = staged or settings._shallow_copy()
+            setattr(staged, name, nested_staged)
+        else:
+            new_val = _lookup(document, path)
+            if new_val is NotFound:
+                # a removed key does not alter the current value,
+                # which corresponds to Settings.update() behavior
+                continue
+
+            update_strategy = strategies.get(path, default_strategy)
+
+            staged = staged or settings._shallow_copy()
+            current_val = getattr(staged, name)
+            setattr(staged, name, update_strategy(current_val, new_val))
+            staged_names.append(name)
+            updated.append('.'.join(path))
+
+    if staged is not None:
+        _validate_staged(staged, staged_names, parents)
+    return staged
+
+
+def _validate_staged(staged: Settings, names: List[str], parents: DocumentPath):
+    staged._is_being_validated = True
+    try:
+        for name in names:
+            setting = getattr(type(staged), name)
+            staged._validate_setting(name, setting, raise_exception=True)
+        staged.validate()
+    except ValidationError as e:
+        for parent in reversed(parents):
+            e.prepend_source(parent)
+        raise
+    finally:
+        staged._is_being_validated = False
+
+
+class _Inotify:
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    _libc = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        return cls._load_libc() is not None
+
+    @classmethod
+    def _load_libc(cls):
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+                libc.inotify_init1
+            except (OSError, AttributeError):
+                return None
+            cls._libc = libc
+        return cls._libc
+
+    def __init__(self, path: str):
+        libc = self._load_libc()
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1() failed')
+
+        # Watch the directory rather than the file itself:
+        # editors and deployment tools often replace the file.
+        directory = os.path.dirname(os.path.abspath(path)).encode()
+        wd = libc.inotify_add_watch(self._fd, directory, self.WATCH_MASK)
+        if wd < 0:
+            os.close(self._fd)
+            errno = ctypes.get_errno()
+            raise OSError(errno, f'inotify_add_watch() failed for {path}')
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a file system event occurs or timeout expires."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+
+        try:
+            while os.read(self._fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self._fd)
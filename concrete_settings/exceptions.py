@@ -9,6 +9,10 @@ class StructureError(ConcreteSettingsError):
     """Raised when an inconsistency in settings inheritance hierarchy is detected."""
 
 
+class FrozenSettingsError(ConcreteSettingsError, AttributeError):
+    """Raised when a setting of frozen settings is assigned."""
+
+
 SettingName = str
 
 # fmt: off
@@ -0,0 +1,86 @@
+"""Stable digests of settings values.
+
+See :meth:`Settings.fingerprint() <concrete_settings.Settings.fingerprint>`.
+
+Values are encoded canonically before hashing: builtin containers
+are encoded item by item, the items of dicts and sets are sorted
+by their encoding, other values are encoded by their type name and ``repr()``.
+Thus the digest of a value does not depend on the dict insertion order,
+on hash randomization or on the process.
+
+A settings fingerprint combines the digests of (name, value) pairs
+by addition modulo 2**256, so that the digest of a changed setting
+is replaced without rehashing the other settings.
+"""
+import hashlib
+import struct
+from decimal import Decimal
+from typing import Any, Dict, Set
+
+_MODULUS = 2 ** 256
+
+_LENGTH = struct.Struct('<Q')
+
+_REPR_TYPES = (bool, int, float, complex, Decimal, type(None))
+
+
+class FingerprintState:
+    """Digests of the values of a settings object."""
+
+    __slots__ = ('owner_id', 'digests', 'dirty', 'total')
+
+    def __init__(self, owner_id: int, dirty: Set[str]):
+        # the state is shared by shallow copies of the settings object,
+        # it is valid for the original object only
+        self.owner_id = owner_id
+        # {setting name: digest of (name, value)}
+        self.digests: Dict[str, int] = {}
+        # names of the settings which have been set since the last update
+        self.dirty = dirty
+        # sum of the digests modulo 2**256
+        self.total = 0
+
+
+def setting_digest(name: str, value: Any) -> int:
+    """Return the digest of the (setting name, value) pair as an integer."""
+    digest = hashlib.sha256(name.encode())
+    digest.update(b'\0')
+    digest.update(encode_value(value))
+    return int.from_bytes(digest.digest(), 'little')
+
+
+def combine(total: int, digest: int) -> int:
+    return (total + digest) % _MODULUS
+
+
+def remove(total: int, digest: int) -> int:
+    return (total - digest) % _MODULUS
+
+
+def total_bytes(total: int) -> bytes:
+    return total.to_bytes(32, 'little')
+
+
+def encode_value(value: Any) -> bytes:
+    """Return the canonical encoding of a value."""
+    if isinstance(value, str):
+        return _tagged(b's', value.encode('utf-8', 'surrogatepass'))
+    if isinstance(value, (bytes, bytearray)):
+        return _tagged(b'b', bytes(value))
+    if isinstance(value, _REPR_TYPES):
+        return _tagged(b'r', f'{type(value).__name__}:{value!r}'.encode())
+    if isinstance(value, dict):
+        items = sorted(encode_value(k) + encode_value(v) for k, v in value.items())
+        return _tagged(b'd', b''.join(items))
+    if isinstance(value, (list, tuple)):
+        items = [encode_value(item) for item in value]
+        return _tagged(b'l' if isinstance(value, list) else b't', b''.join(items))
+    if isinstance(value, (set, frozenset)):
+        return _tagged(b'e', b''.join(sorted(encode_value(item) for item in value)))
+
+    type_name = f'{type(value).__module__}.{type(value).__qualname__}'
+    return _tagged(b'o', f'{type_name}:{value!r}'.encode('utf-8', 'surrogatepass'))
+
+
+def _tagged(tag: bytes, payload: bytes) -> bytes:
+    return tag + _LENGTH.pack(len(payload)) + payload
@@ -0,0 +1,43 @@
+"""A single switch for the extended access to settings values.
+
+Settings values are read and written as plain attributes of the settings
+objects until a feature which changes the access is used:
+overrides, transactions, overlays, frozen settings or fingerprints.
+Thus reading and writing settings costs a single check of :data:`active`
+when none of these features is used.
+
+Overrides and transactions activate the extended access while their blocks
+are entered in any context. The other features rely on the state of
+settings objects, so they activate the extended access permanently.
+"""
+import threading
+
+#: True if settings values are accessed through the extended path
+active = False
+
+# number of overrides and transactions blocks entered in all contexts
+_blocks = 0
+# True if objects relying on the extended access have been created
+_used = False
+_lock = threading.Lock()
+
+
+def enter_block():
+    global _blocks, active
+    with _lock:
+        _blocks += 1
+        active = True
+
+
+def exit_block():
+    global _blocks, active
+    with _lock:
+        _blocks -= 1
+        active = _used or _blocks > 0
+
+
+def use():
+    """Activate the extended access permanently."""
+    global _used, active
+    with _lock:
+        _used = active = True
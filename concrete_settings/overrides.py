@@ -0,0 +1,83 @@
+"""Context-local overrides of settings values.
+
+See :meth:`Settings.overrides() <concrete_settings.Settings.overrides>`.
+
+Overrides are visible only in the context (thread or asyncio task)
+which has entered the overrides block and in the asyncio tasks
+started from it. Each block pushes a layer onto a linked stack
+of layers held by a context variable, so entering and exiting
+a block does not copy the outer layers.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from . import hooks
+
+#: Returned by :func:`lookup` for values which are not overridden
+NOT_OVERRIDDEN = object()
+
+# {(id(settings object), setting name): value}
+_LayerValues = Dict[Tuple[int, str], Any]
+
+# (values, outer layer)
+_Layer = Tuple[_LayerValues, Any]
+
+_layers: ContextVar[Optional[_Layer]] = ContextVar(
+    'concrete_settings_overrides', default=None
+)
+
+# Number of overrides blocks active in all contexts. Allows settings
+# reads to skip the context variable lookup when there are no overrides.
+active_count = 0
+_active_count_lock = threading.Lock()
+
+
+def is_active() -> bool:
+    """Return True if overrides are active in the current context."""
+    return _layers.get() is not None
+
+
+def lookup(owner: Any, name: str) -> Any:
+    """Return the value of setting `name` of `owner` overridden
+    in the current context or NOT_OVERRIDDEN."""
+    layer = _layers.get()
+    if layer is None:
+        return NOT_OVERRIDDEN
+
+    key = (id(owner), name)
+    while layer is not None:
+        values, layer = layer
+        value = values.get(key, NOT_OVERRIDDEN)
+        if value is not NOT_OVERRIDDEN:
+            return value
+    return NOT_OVERRIDDEN
+
+
+@contextmanager
+def push(values: _LayerValues) -> Iterator[None]:
+    """Override the values in the current context."""
+    global active_count
+
+    token = _layers.set((values, _layers.get()))
+    with _active_count_lock:
+        active_count += 1
+    hooks.enter_block()
+    try:
+        yield
+    finally:
+        _layers.reset(token)
+        with _active_count_lock:
+            active_count -= 1
+        hooks.exit_block()
+
+
+@contextmanager
+def suspended() -> Iterator[None]:
+    """Read the stored values, ignoring the overrides in the current context."""
+    token = _layers.set(None)
+    try:
+        yield
+    finally:
+        _layers.reset(token)
@@ -0,0 +1,67 @@
+"""Setting paths and path patterns.
+
+A setting path is a tuple of attribute names leading from a root
+Settings object to a setting, e.g. ``('DB', 'HOST')``.
+Its dotted form is ``'DB.HOST'``.
+
+Path patterns are dotted paths whose parts may contain
+shell-style wildcards (see :mod:`fnmatch`), e.g. ``'*.ALLOWED_*'``.
+A ``**`` part matches zero or more parts, e.g. ``'CACHES.**'``
+matches ``CACHES`` and all the settings nested in it.
+"""
+import fnmatch
+import re
+from typing import Callable, List, Optional, Tuple
+
+SettingPath = Tuple[str, ...]
+
+_WILDCARDS = frozenset('*?[')
+
+# None stands for "**"
+_PartMatcher = Optional[Callable[[str], object]]
+
+
+def is_pattern(dotted_path: str) -> bool:
+    """Return True if the dotted path contains wildcards."""
+    return not _WILDCARDS.isdisjoint(dotted_path)
+
+
+class PathPattern:
+    """A compiled setting path pattern."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._parts: List[_PartMatcher] = [
+            None if part == '**' else _compile_part(part) for part in pattern.split('.')
+        ]
+
+    def match(self, path: SettingPath) -> bool:
+        return _match_parts(self._parts, 0, path, 0)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.pattern!r})'
+
+
+def _compile_part(part: str) -> Callable[[str], object]:
+    if not is_pattern(part):
+        return part.__eq__
+    return re.compile(fnmatch.translate(part)).match
+
+
+def _match_parts(
+    parts: List[_PartMatcher], part_idx: int, path: SettingPath, path_idx: int
+) -> bool:
+    while part_idx < len(parts):
+        matcher = parts[part_idx]
+        if matcher is None:
+            # "**": try to match the rest of the pattern
+            # with every suffix of the path
+            return any(
+                _match_parts(parts, part_idx + 1, path, i)
+                for i in range(path_idx, len(path) + 1)
+            )
+        if path_idx == len(path) or not matcher(path[path_idx]):
+            return False
+        part_idx += 1
+        path_idx += 1
+    return path_idx == len(path)
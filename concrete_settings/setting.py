@@ -1,6 +1,8 @@
 import functools
 from typing import Any, Tuple, Optional, Union, Callable, TYPE_CHECKING, List
 
+from . import hooks, overrides, transaction
+from .exceptions import FrozenSettingsError
 from .types import GuessSettingType, Undefined
 from .validators import Validator
 
@@ -8,6 +10,8 @@ if TYPE_CHECKING:
     from .settings import Settings
     from .behaviors import Behavior
 
+_MISSING = object()
+
 
 class Setting:
     value: Any
@@ -50,14 +54,44 @@ class Setting:
         return self.get_value(owner)
 
     def get_value(self, owner):
-        return getattr(owner, f"__setting_{self.name}_value", self.value)
+        if not hooks.active:
+            return getattr(owner, f"__setting_{self.name}_value", self.value)
+
+        if overrides.active_count:
+            value = overrides.lookup(owner, self.name)
+            if value is not overrides.NOT_OVERRIDDEN:
+                return value
+        return self._get_stored_value(owner)
+
+    def _get_stored_value(self, owner):
+        if transaction.open_count:
+            owner = transaction.staged(owner)
+        value = getattr(owner, f"__setting_{self.name}_value", _MISSING)
+        if value is _MISSING:
+            # values which are not set in an overlay are read from its parent
+            parent = getattr(owner, '_overlay_parent', None)
+            value = self.value if parent is None else self.get_value(parent)
+        return value
 
     def __set__(self, owner: 'Settings', val):
         self.set_value(owner, val)
 
     def set_value(self, owner: 'Settings', val):
+        if not hooks.active:
+            setattr(owner, f"__setting_{self.name}_value", val)
+            return
+
+        if transaction.open_count:
+            owner = transaction.staged(owner)
+        if getattr(owner, '_frozen', False):
+            raise FrozenSettingsError(f"Can't set {self.name}: settings are frozen")
         setattr(owner, f"__setting_{self.name}_value", val)
 
+        # the value digest is recomputed by the next fingerprint() call
+        fingerprint_state = getattr(owner, '_fingerprint_state', None)
+        if fingerprint_state is not None:
+            fingerprint_state.dirty.add(self.name)
+
 
 class PropertySetting(Setting):
     def __init__(self, *args, **kwargs):
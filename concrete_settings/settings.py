@@ -1,12 +1,25 @@
+import asyncio
+import copy
+import gc
+import hashlib
 import logging
+import pickle
 import types
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import reduce
+from pathlib import Path
 from collections import defaultdict
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -14,10 +27,15 @@ from typing import (
 
 from .setting import Setting, PropertySetting
 from .setting_registry import registry
+from . import fingerprint, hooks, overrides, transaction
 from .docreader import extract_doc_comments_from_class_or_module
+from .fingerprint import FingerprintState
 from .exceptions import StructureError, ValidationError, ValidationErrorDetails
-from .sources import get_source, AnySource, Source, NotFound
+from .paths import PathPattern, SettingPath
+from .sources import get_source, AnySource, AsyncSource, Source, NotFound
+from .sources.converters import converters
 from .sources.strategies import Strategy, default as default_update_strategy
+from .sources.strategies import fold, resolve_strategies
 from .types import GuessSettingType, type_hints_equal
 from .validators import Validator, ValueTypeValidator
 
@@ -25,6 +43,45 @@ logger = logging.getLogger(__name__)
 
 INVALID_SETTINGS = '__invalid__settings__'
 
+_MISSING = object()
+
+
+class Change(NamedTuple):
+    """Old and new values of a changed setting."""
+
+    old: Any
+    new: Any
+
+
+#: {dotted setting name: change}
+ChangeSet = Dict[str, Change]
+
+# Max number of resolved strategies tables cached per Settings class
+STRATEGIES_TABLES_CACHE_SIZE = 32
+
+# Max length of a chain of overlays, see Settings.overlay()
+MAX_OVERLAY_DEPTH = 8
+
+# Max number of find() results cached per Settings class
+FIND_CACHE_SIZE = 32
+
+# Instance attributes which are not pickled: Setting.value refers
+# to the settings object itself, the overlay values are pickled
+# as the values of the settings object, the fingerprint state is a cache
+_NOT_PICKLED_ATTRIBUTES = frozenset(
+    (
+        'value',
+        '_overlay_parent',
+        '_overlay_depth',
+        '_overlay_base',
+        '_overlay_source',
+        '_fingerprint_state',
+    )
+)
+
+# Values of these types are shared by clones of settings
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), range, Decimal)
+
 
 class SettingsMeta(type):
     def __new__(mcs, name, bases, class_dict):
@@ -191,6 +248,35 @@ class Settings(Setting, metaclass=SettingsMeta):
 
     _errors: ValidationErrorDetails = {}
 
+    # settings of frozen objects cannot be set, see versioned.py
+    _frozen: bool = False
+
+    # values which are not set in an overlay are read from its parent,
+    # see overlay()
+    _overlay_parent: Optional['Settings'] = None
+    _overlay_depth: int = 0
+    # the settings object passed as the base of an overlay,
+    # the parent is a flattened copy of its chain if it is too deep
+    _overlay_base: Optional['Settings'] = None
+    # nested settings of an overlay are overlaid on the nested settings
+    # of this object, see _overlay_nested()
+    _overlay_source: Optional['Settings'] = None
+
+    # digests of values, see fingerprint()
+    _fingerprint_state: Optional[FingerprintState] = None
+
+    # per-class caches, see settings_paths(), schema_fingerprint(),
+    # _nested_settings_names(), _value_settings_names(), _path_index(),
+    # _update_attributes() and find()
+    _settings_paths: Tuple[Tuple[SettingPath, Setting], ...]
+    _update_attrs: Tuple[Tuple[str, Setting], ...]
+    _paths_index: Dict[str, SettingPath]
+    _found_paths: Dict[str, Tuple[Tuple[str, SettingPath], ...]]
+    _nested_names: Tuple[str, ...]
+    _value_names: FrozenSet[str]
+    _schema_fingerprint: str
+    _strategies_tables: Dict[Tuple, Dict[SettingPath, Strategy]]
+
     def __init__(self, **kwargs):
         assert (
             'value' not in kwargs
@@ -257,6 +343,157 @@ class Settings(Setting, metaclass=SettingsMeta):
             if isinstance(attr, Setting):
                 yield name, attr
 
+    @classmethod
+    def settings_paths(cls) -> Tuple[Tuple[SettingPath, Setting], ...]:
+        """Return (path, setting) pairs of all non-Settings settings
+           including the settings of nested Settings.
+
+           The result is computed once per class."""
+        paths = cls.__dict__.get('_settings_paths')
+        if paths is None:
+            paths = tuple(cls._walk_settings_paths(()))
+            cls._settings_paths = paths
+        return paths
+
+    @classmethod
+    def _walk_settings_paths(
+        cls, parents: SettingPath
+    ) -> Iterator[Tuple[SettingPath, Setting]]:
+        for name, setting in cls.settings_attributes():
+            path = (*parents, name)
+            if isinstance(setting, Settings):
+                yield from type(setting)._walk_settings_paths(path)
+            else:
+                yield path, setting
+
+    @classmethod
+    def schema_fingerprint(cls) -> str:
+        """Return a digest of settings paths, kinds and type hints."""
+        fingerprint = cls.__dict__.get('_schema_fingerprint')
+        if fingerprint is None:
+            digest = hashlib.sha256()
+            for path, setting in cls.settings_paths():
+                dotted_name = '.'.join(path)
+                kind = type(setting).__name__
+                digest.update(f'{dotted_name}:{kind}:{setting.type_hint!r}\n'.encode())
+            fingerprint = digest.hexdigest()
+            cls._schema_fingerprint = fingerprint
+        return fingerprint
+
+    def fingerprint(self) -> str:
+        """Return a stable digest of the schema and the values of settings.
+
+        The digests of values are cached per settings object and
+        recomputed only for the settings set since the last call."""
+        digest = hashlib.sha256(self.schema_fingerprint().encode())
+        self._update_fingerprint(digest)
+        return digest.hexdigest()
+
+    def _update_fingerprint(self, digest):
+        digests = self._settings_digests()
+        state = self._fingerprint_state
+        if state is not None and digests is state.digests:
+            total = state.total
+        else:
+            total = 0
+            for setting_digest in digests.values():
+                total = fingerprint.combine(total, setting_digest)
+        digest.update(fingerprint.total_bytes(total))
+
+        for name in self._nested_settings_names():
+            getattr(self, name)._update_fingerprint(digest)
+
+    def _settings_digests(self) -> Dict[str, int]:
+        """Return {setting name: digest of the name and the value}
+           of the settings which are not Settings or property settings."""
+        # values staged by a transaction or overridden
+        # in the current context are not cached
+        if (overrides.active_count and overrides.is_active()) or (
+            transaction.open_count and transaction.staged(self) is not self
+        ):
+            return {
+                name: fingerprint.setting_digest(name, getattr(self, name))
+                for name in self._value_settings_names()
+            }
+
+        state = self._refresh_fingerprint_state()
+        if self._overlay_parent is None:
+            return state.digests
+
+        # values which are not set in an overlay are read from its parent
+        parent_digests = self._overlay_parent._settings_digests()  # type: ignore
+        return {**parent_digests, **state.digests}
+
+    def _refresh_fingerprint_state(self) -> FingerprintState:
+        value_names = self._value_settings_names()
+        state = self._fingerprint_state
+        if state is None or state.owner_id != id(self):
+            state = FingerprintState(id(self), set(value_names))
+            self._fingerprint_state = state
+            # changed values are tracked when they are set
+            hooks.use()
+
+        dirty, state.dirty = state.dirty, set()
+        for name in dirty:
+            if name not in value_names:
+                continue
+            old_digest = state.digests.pop(name, None)
+            if old_digest is not None:
+                state.total = fingerprint.remove(state.total, old_digest)
+            if self._overlay_parent is not None and (
+                f'__setting_{name}_value' not in self.__dict__
+            ):
+                continue
+
+            new_digest = fingerprint.setting_digest(name, getattr(self, name))
+            state.digests[name] = new_digest
+            state.total = fingerprint.combine(state.total, new_digest)
+        return state
+
+    def diff(self, other: 'Settings') -> ChangeSet:
+        """Return a change-set of the settings whose values differ
+           between these and the `other` settings of the same schema.
+
+        The old value of a change is the value of these settings and
+        the new value is the value of the `other` settings."""
+        assert (
+            other.schema_fingerprint() == self.schema_fingerprint()
+        ), '`other` settings should have the same schema'
+
+        changes: ChangeSet = {}
+        self._diff(other, (), changes)
+        return changes
+
+    def _diff(self, other: 'Settings', parents: SettingPath, changes: ChangeSet):
+        if self is other:
+            return
+
+        # equal cached fingerprints mean equal values
+        total = self._cached_values_total()
+        if total is None or total != other._cached_values_total():
+            for name in sorted(self._value_settings_names()):
+                val, other_val = getattr(self, name), getattr(other, name)
+                if _value_changed(val, other_val):
+                    changes['.'.join((*parents, name))] = Change(val, other_val)
+
+        for name in self._nested_settings_names():
+            nested, other_nested = getattr(self, name), getattr(other, name)
+            nested._diff(other_nested, (*parents, name), changes)
+
+    def _cached_values_total(self) -> Optional[int]:
+        """Return the combined digest of values if it is up to date, otherwise None."""
+        state = self._fingerprint_state
+        if (
+            state is None
+            or state.owner_id != id(self)
+            or state.dirty
+            or self._overlay_parent is not None
+            or (overrides.active_count and overrides.is_active())
+            or (transaction.open_count and transaction.staged(self) is not self)
+        ):
+            return None
+        return state.total
+
     def is_valid(self, raise_exception=False) -> bool:
         self._errors = {}
         self._errors = self._run_validation(raise_exception)
@@ -324,46 +561,224 @@ class Settings(Setting, metaclass=SettingsMeta):
     def validate(self):
         pass
 
-    def update(self, source: AnySource, strategies: dict = None):
+    def preload(self, freeze_gc: bool = False):
+        """Prepare settings to be shared with forked processes.
+
+        Build the lazily computed per-class data of these and nested settings,
+        read all the values and validate the settings, so that the forked
+        processes do not write to the memory pages shared with the parent
+        process on first access to the settings.
+
+        If `freeze_gc` is True, move all the objects tracked by the garbage
+        collector to the permanent generation (see :func:`gc.freeze`),
+        so that collections in the forked processes do not write to them."""
+        self._preload()
+        self.is_valid(raise_exception=True)
+        # gc.freeze() is available in Python 3.7+
+        if freeze_gc and hasattr(gc, 'freeze'):
+            gc.freeze()
+
+    def _preload(self):
+        cls = type(self)
+        cls.settings_paths()
+        cls.schema_fingerprint()
+        cls._nested_settings_names()
+        cls._value_settings_names()
+        cls._path_index()
+        for name, setting in cls.settings_attributes():
+            # property settings are computed, nested settings are preloaded
+            value = getattr(self, name)
+            if isinstance(value, Settings):
+                value._preload()
+            else:
+                # converters used by sources which provide string values
+                converters.get_converter(setting.type_hint)
+
+    def update(
+        self, source: AnySource, strategies: dict = None, *, return_changes: bool = False
+    ) -> Optional[ChangeSet]:
+        """Update settings from the source.
+
+        If `return_changes` is True, return a change-set
+        of the settings whose values have changed."""
+        return self.update_many((source,), strategies, return_changes=return_changes)
+
+    def update_many(
+        self,
+        sources: Sequence[AnySource],
+        strategies: dict = None,
+        *,
+        return_changes: bool = False,
+    ) -> Optional[ChangeSet]:
+        strategies = strategies if strategies is not None else {}
+        assert isinstance(strategies, Mapping), '`strategies` type should be `dict`'
+        strategies_table = self._strategies_table(strategies)
+
+        source_objs = [get_source(source) for source in sources]
+        for source_obj in source_objs:
+            source_obj.prefetch()
+
+        changes: Optional[ChangeSet] = {} if return_changes else None
+        # values are folded with the stored values rather than
+        # the values overridden in the current context
+        with overrides.suspended():
+            self._update(self, source_objs, (), strategies_table, changes)
+        return changes
+
+    async def update_async(
+        self,
+        *sources: AnySource,
+        strategies: dict = None,
+        return_changes: bool = False,
+    ) -> Optional[ChangeSet]:
         strategies = strategies if strategies is not None else {}
         assert isinstance(strategies, Mapping), '`strategies` type should be `dict`'
+        strategies_table = self._strategies_table(strategies)
+
+        source_objs = [get_source(source) for source in sources]
+        await asyncio.gather(*(_prefetch_async(src) for src in source_objs))
 
-        source_obj = get_source(source)
-        self._update(self, source_obj, parents=(), strategies=strategies)
+        changes: Optional[ChangeSet] = {} if return_changes else None
+        # values are folded with the stored values rather than
+        # the values overridden in the current context
+        with overrides.suspended():
+            self._update(self, source_objs, (), strategies_table, changes)
+        return changes
+
+    @classmethod
+    def _strategies_table(
+        cls, strategies: Mapping[str, Strategy]
+    ) -> Dict[SettingPath, Strategy]:
+        """Resolve update strategies of all the settings paths.
+
+        The result is cached per class and strategies mapping,
+        so that patterns are matched once rather than on every update."""
+        if not strategies:
+            return {}
+
+        paths = (path for path, _ in cls.settings_paths())
+        key = tuple(strategies.items())
+        try:
+            hash(key)
+        except TypeError:
+            return resolve_strategies(strategies, paths)
+
+        tables = cls.__dict__.get('_strategies_tables')
+        if tables is None:
+            tables = cls._strategies_tables = {}
+
+        table = tables.get(key)
+        if table is None:
+            if len(tables) >= STRATEGIES_TABLES_CACHE_SIZE:
+                tables.clear()
+            table = tables[key] = resolve_strategies(strategies, paths)
+        return table
 
     @staticmethod
     def _update(
         settings: 'Settings',
-        source: Source,
-        parents: Tuple[str, ...] = (),
-        strategies: Dict[str, Strategy] = None,
+        sources: Sequence[Source],
+        parents: SettingPath = (),
+        strategies: Dict[SettingPath, Strategy] = None,
+        changes: Optional[ChangeSet] = None,
     ):
-        """Recursively update settings object from dictionary"""
+        """Recursively update settings object from the sources.
+
+        Values of each setting are read from all the sources in order
+        and folded by the update strategy, so that the setting is written once.
+        `strategies` map settings paths to non-default update strategies.
+        Changed values are recorded to `changes` unless it is None."""
         strategies = strategies or {}
 
-        for name, setting in settings.settings_attributes():
+        for name, setting in settings._update_attributes():
+            path = (*parents, name)
             if isinstance(setting, Settings):
-                settings._update(setting, source, (*parents, name), strategies)
+                nested_settings = getattr(settings, name)
+                settings._update(nested_settings, sources, path, strategies, changes)
             else:
-                full_setting_name = f'{".".join(parents) and "."}{name}'
-
-                if full_setting_name in strategies:
-                    update_strategy = strategies[full_setting_name]
+                update_strategy = strategies.get(path)
+                if update_strategy is not None:
                     logger.debug(
                         'Updating setting %s with strategy %s',
-                        full_setting_name,
+                        '.'.join(path),
                         getattr(update_strategy, '__qualname__', 'unknown strategy'),
                     )
                 else:
                     update_strategy = default_update_strategy
 
-                update_to_val = source.read(setting, parents)
-                if update_to_val is NotFound:
-                    continue
+                new_values: List[Any] = []
+                for source in sources:
+                    update_to_val = source.read(setting, parents)
+                    if update_to_val is not NotFound:
+                        new_values.append(update_to_val)
+
+                if new_values:
+                    current_val = getattr(settings, name)
+                    new_val = fold(update_strategy, current_val, new_values)
+                    setattr(settings, name, new_val)
+
+                    if changes is not None:
+                        # setting classes may convert values when they are set
+                        new_val = getattr(settings, name)
+                        if _value_changed(current_val, new_val):
+                            changes['.'.join(path)] = Change(current_val, new_val)
+
+    def get(self, path: str) -> Any:
+        """Return the value of a setting by its dotted path, e.g. ``'DB.HOST'``.
+
+        Raise KeyError if there is no such setting."""
+        value = self
+        for name in self._path_index()[path]:
+            value = getattr(value, name)
+        return value
+
+    def set(self, path: str, value: Any):
+        """Set the value of a setting by its dotted path, e.g. ``'DB.HOST'``.
+
+        Raise KeyError if there is no such setting."""
+        *parents, name = self._path_index()[path]
+        owner = self
+        for parent in parents:
+            owner = getattr(owner, parent)
+        setattr(owner, name, value)
+
+    def find(self, pattern: str) -> Dict[str, Any]:
+        """Return {dotted path: value} of the settings, which are not Settings,
+           matching the path pattern, e.g. ``'*.TIMEOUT'``.
+           See :mod:`concrete_settings.paths`."""
+        cls = type(self)
+        found = cls.__dict__.get('_found_paths')
+        if found is None:
+            found = cls._found_paths = {}
+
+        matches = found.get(pattern)
+        if matches is None:
+            path_pattern = PathPattern(pattern)
+            matches = tuple(
+                ('.'.join(path), path)
+                for path, _ in cls.settings_paths()
+                if path_pattern.match(path)
+            )
+            if len(found) >= FIND_CACHE_SIZE:
+                found.clear()
+            found[pattern] = matches
+
+        return {
+            dotted_path: reduce(getattr, path, self) for dotted_path, path in matches
+        }
 
-                current_val = getattr(settings, name)
-                new_val = update_strategy(current_val, update_to_val)
-                setattr(settings, name, new_val)
+    @classmethod
+    def _path_index(cls) -> Dict[str, SettingPath]:
+        """Return {dotted path: path} of all settings including nested Settings,
+           computed once per class."""
+        index = cls.__dict__.get('_paths_index')
+        if index is None:
+            index = {}
+            for path, _ in cls.settings_paths():
+                for depth in range(1, len(path) + 1):
+                    index.setdefault('.'.join(path[:depth]), path[:depth])
+            cls._paths_index = index
+        return index
 
     def extract_to(self, destination: Union[types.ModuleType, dict], prefix: str = ''):
         if prefix != '':
@@ -375,10 +790,322 @@ class Settings(Setting, metaclass=SettingsMeta):
         for name, attr in self.settings_attributes():
             var_name = prefix + name
             if isinstance(attr, Settings):  # nested settings
-                attr.extract_to(destination, var_name)
+                getattr(self, name).extract_to(destination, var_name)
             else:
                 destination[var_name] = getattr(self, name)
 
+    def dump_snapshot(self, path: Union[str, Path]):
+        """Write resolved values to a binary snapshot file."""
+        from .snapshot import dump_snapshot
+
+        dump_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path: Union[str, Path]) -> 'Settings':
+        """Create settings object with values restored from a snapshot file."""
+        from .snapshot import load_snapshot
+
+        return load_snapshot(cls, path)
+
+    @contextmanager
+    def transaction(self) -> Iterator['Settings']:
+        """Stage all changes of settings made in the block
+           and apply them at once when the block exits without errors.
+
+           The changes are discarded if an exception is raised."""
+        with transaction.stage(self) as staged:
+            yield self
+        self._commit(staged)
+
+    @contextmanager
+    def overrides(self, **values) -> Iterator['Settings']:
+        """Override settings values within the block in the current context
+           (thread or asyncio task).
+
+           Nested settings are overridden by dicts of values."""
+        layer: Dict[Tuple[int, str], Any] = {}
+        self._collect_overrides(values, layer)
+        with overrides.push(layer):
+            yield self
+
+    def _collect_overrides(
+        self, values: Mapping[str, Any], layer: Dict[Tuple[int, str], Any]
+    ):
+        cls = type(self)
+        for name, value in values.items():
+            setting = getattr(cls, name, None)
+            if not isinstance(setting, Setting):
+                raise AttributeError(f'{cls.__qualname__} has no setting {name}')
+            if isinstance(setting, PropertySetting):
+                raise AttributeError(f'Property setting {name} cannot be overridden')
+
+            if isinstance(setting, Settings) and isinstance(value, Mapping):
+                getattr(self, name)._collect_overrides(value, layer)
+            else:
+                layer[(id(self), name)] = value
+
+    def get_value(self, owner):
+        if not hooks.active:
+            return getattr(owner, f'__setting_{self.name}_value', self.value)
+
+        if overrides.active_count:
+            nested = overrides.lookup(owner, self.name)
+            if nested is not overrides.NOT_OVERRIDDEN:
+                return nested
+
+        # nested settings are copied on write in transactions
+        nested = self._get_stored_value(owner)
+        if transaction.open_count:
+            nested = transaction.stage_nested(owner, self, nested)
+        if owner._overlay_parent is not None:
+            nested = self._overlay_nested(owner, nested)
+        return nested
+
+    def _overlay_nested(self, owner: 'Settings', nested: 'Settings') -> 'Settings':
+        """Nested settings read by an overlay from its parent are overlaid
+           on first access, so that they can be changed independently.
+           The overlaid nested settings are moved onto the nested settings
+           of the source, when the source nested settings are replaced."""
+        if transaction.open_count:
+            owner = transaction.staged(owner)
+        if f'__setting_{self.name}_value' not in owner.__dict__:
+            parent: Settings = owner._overlay_parent  # type: ignore
+            nested = self._overlay_source_nested(parent, nested)
+            self.set_value(owner, nested)
+            return nested
+
+        source = nested._overlay_source
+        if source is not None:
+            source_nested: Settings = self.get_value(source)
+            if nested._overlay_base is not source_nested or (
+                # a flattened copy of the chain is overlaid on its root
+                nested._overlay_parent is not source_nested
+                and nested._overlay_parent._overlay_parent  # type: ignore
+                is not source_nested._overlay_root()
+            ):
+                nested._set_overlay_base(source_nested)
+        return nested
+
+    def _overlay_source_nested(
+        self, source: 'Settings', source_nested: 'Settings', **overrides
+    ) -> 'Settings':
+        """Overlay the nested settings of `source`."""
+        nested = type(source_nested).overlay(source_nested, **overrides)
+        nested._overlay_source = source
+        return nested
+
+    def _commit(self, staged: 'Settings'):
+        """Publish values of a staged copy."""
+        # Nested settings are swapped in as whole new objects via
+        # the staged root values, so a single dict.update()
+        # publishes all the changes at once.
+        current = self.__dict__
+        changes = {
+            key: val
+            for key, val in staged.__dict__.items()
+            if key.startswith('__setting_') and current.get(key, _MISSING) is not val
+        }
+        current.update(changes)
+
+        if self._fingerprint_state is not None:
+            prefix, suffix = len('__setting_'), len('_value')
+            self._fingerprint_state.dirty.update(key[prefix:-suffix] for key in changes)
+
+    @classmethod
+    def overlay(
+        cls, base: 'Settings', *, skip_unchanged: bool = False, **overrides
+    ) -> 'Settings':
+        """Create settings object which stores only the overridden values
+           and reads the other values from `base`.
+
+           Nested settings are overridden by dicts of values.
+           If `skip_unchanged` is True, overrides equal to the base values
+           are not stored."""
+        assert isinstance(base, cls), f'`base` should be an instance of {cls.__name__}'
+
+        settings = cls._new()
+        settings._set_overlay_base(base)
+
+        for name, value in overrides.items():
+            setting = getattr(cls, name, None)
+            if not isinstance(setting, Setting):
+                raise AttributeError(f'{cls.__qualname__} has no setting {name}')
+
+            base_value = getattr(base, name)
+            if isinstance(setting, Settings) and isinstance(value, Mapping):
+                value = setting._overlay_source_nested(
+                    base, base_value, skip_unchanged=skip_unchanged, **value
+                )
+            elif skip_unchanged and not _value_changed(base_value, value):
+                continue
+            setattr(settings, name, value)
+        return settings
+
+    def _set_overlay_base(self, base: 'Settings'):
+        """Read the values which are not set in this overlay from `base`."""
+        hooks.use()
+        self._overlay_base = base
+        if base._overlay_depth < MAX_OVERLAY_DEPTH:
+            self._overlay_parent = base
+            self._overlay_depth = base._overlay_depth + 1
+        else:
+            self._overlay_parent = base._flatten_overlay()
+            self._overlay_depth = 2
+
+    def _overlay_root(self) -> 'Settings':
+        root = self
+        while root._overlay_parent is not None:
+            root = root._overlay_parent  # type: ignore
+        return root
+
+    def _flatten_overlay(self) -> 'Settings':
+        """Return an overlay of the root of this overlays chain
+           with the values of the intermediate overlays copied."""
+        chain = []
+        root = self
+        while root._overlay_parent is not None:
+            chain.append(root)
+            root = root._overlay_parent  # type: ignore
+
+        flat = self._new()
+        for overlay in reversed(chain):
+            for key, value in overlay.__dict__.items():
+                if key.startswith('__setting_'):
+                    flat.__dict__[key] = value
+
+        # nested settings are overlaid on the nested settings of this overlay
+        for name in self._nested_settings_names():
+            key = f'__setting_{name}_value'
+            if key in flat.__dict__:
+                setting = getattr(type(self), name)
+                nested = getattr(self, name)
+                flat.__dict__[key] = setting._overlay_source_nested(self, nested)
+
+        flat._overlay_base = flat._overlay_parent = root
+        flat._overlay_depth = 1
+        return flat
+
+    def clone(self) -> 'Settings':
+        """Return a copy of settings which can be changed independently
+           of the original. Immutable values are shared with the original,
+           other values are deep-copied."""
+        return self._clone({})
+
+    def _clone(self, memo: Dict[int, Any]) -> 'Settings':
+        settings_clone = self._shallow_copy()
+        settings_clone._frozen = False
+        clone_dict = settings_clone.__dict__
+        for key, val in clone_dict.items():
+            if not key.startswith('__setting_') or _is_immutable(val):
+                continue
+            if isinstance(val, Settings):
+                clone_dict[key] = val._clone(memo)
+            else:
+                clone_dict[key] = copy.deepcopy(val, memo)
+
+        # nested settings shared by all instances of the class
+        for name in self._nested_settings_names():
+            key = f'__setting_{name}_value'
+            if key not in clone_dict:
+                clone_dict[key] = getattr(self, name)._clone(memo)
+        return settings_clone
+
+    def __reduce__(self):
+        # Only the explicitly set values are pickled, keyed
+        # by the index of the setting in settings_paths()
+        values = {}
+        owners: Dict[SettingPath, Settings] = {(): self}
+        for idx, (path, setting) in enumerate(self.settings_paths()):
+            if isinstance(setting, PropertySetting):
+                continue
+            parents = path[:-1]
+            owner = owners.get(parents)
+            if owner is None:
+                owner = owners[parents] = reduce(getattr, parents, self)
+            val = _explicit_value(owner, f'__setting_{path[-1]}_value')
+            if val is not _MISSING:
+                values[idx] = val
+
+        # other attributes, e.g. Setting arguments or attributes
+        # set by __init__() of a subclass
+        state = {
+            key: val
+            for key, val in self.__dict__.items()
+            if not key.startswith('__setting_') and key not in _NOT_PICKLED_ATTRIBUTES
+        }
+        return (
+            _restore_settings,
+            (self.__class__, self.schema_fingerprint(), values, state),
+        )
+
+    @classmethod
+    def _new(cls) -> 'Settings':
+        """Create settings object without verifying the structure
+           of the class, which has been verified by the original object
+           when restoring a copy."""
+        settings = object.__new__(cls)
+        Setting.__init__(settings, value=settings, type_hint=cls)
+        settings._is_being_validated = False
+        return settings
+
+    @classmethod
+    def _value_settings_names(cls) -> FrozenSet[str]:
+        """Return names of settings which are not Settings or property settings,
+           computed once per class."""
+        names = cls.__dict__.get('_value_names')
+        if names is None:
+            names = frozenset(
+                name
+                for name, setting in cls.settings_attributes()
+                if not isinstance(setting, (Settings, PropertySetting))
+            )
+            cls._value_names = names
+        return names
+
+    @classmethod
+    def _update_attributes(cls) -> Tuple[Tuple[str, Setting], ...]:
+        """Return (name, setting) pairs of settings updated from sources,
+           computed once per class."""
+        attrs = cls.__dict__.get('_update_attrs')
+        if attrs is None:
+            attrs = cls._update_attrs = tuple(cls.settings_attributes())
+        return attrs
+
+    @classmethod
+    def _nested_settings_names(cls) -> Tuple[str, ...]:
+        """Return names of nested Settings, computed once per class."""
+        names = cls.__dict__.get('_nested_names')
+        if names is None:
+            names = tuple(
+                name
+                for name, setting in cls.settings_attributes()
+                if isinstance(setting, Settings)
+            )
+            cls._nested_names = names
+        return names
+
+    def _copy_tree(self) -> 'Settings':
+        """Return an unfrozen copy of settings object with private copies
+           of nested settings. The values are shared with the original."""
+        settings_copy = self._shallow_copy()
+        settings_copy._frozen = False
+        for name in self._nested_settings_names():
+            setattr(settings_copy, name, getattr(self, name)._copy_tree())
+        return settings_copy
+
+    def _freeze(self):
+        for name in self._nested_settings_names():
+            getattr(self, name)._freeze()
+        hooks.use()
+        self._frozen = True
+
+    def _shallow_copy(self) -> 'Settings':
+        """Return a copy of settings object which shares the values
+           and nested settings with the original."""
+        settings_copy = object.__new__(self.__class__)
+        settings_copy.__dict__.update(self.__dict__)
+        return settings_copy
+
     @property
     def errors(self) -> ValidationErrorDetails:
         return self._errors
@@ -386,3 +1113,81 @@ class Settings(Setting, metaclass=SettingsMeta):
     @property
     def is_being_validated(self) -> bool:
         return self._is_being_validated
+
+
+def _value_changed(old_val: Any, new_val: Any) -> bool:
+    if old_val is new_val:
+        return False
+    try:
+        return bool(old_val != new_val)
+    except (TypeError, ValueError):
+        # e.g. ambiguous truth value of array comparison
+        return True
+
+
+def _explicit_value(settings: Optional[Settings], key: str) -> Any:
+    # overlays take the values which are not set from their parents
+    while settings is not None:
+        val = settings.__dict__.get(key, _MISSING)
+        if val is not _MISSING:
+            return val
+        settings = settings._overlay_parent  # type: ignore
+    return _MISSING
+
+
+def _is_immutable(val: Any) -> bool:
+    if isinstance(val, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(val, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in val)
+    return False
+
+
+def _restore_settings(
+    settings_cls: Type[Settings],
+    schema_fingerprint: str,
+    values: Dict[int, Any],
+    state: Dict[str, Any],
+) -> Settings:
+    if schema_fingerprint != settings_cls.schema_fingerprint():
+        raise pickle.UnpicklingError(
+            f'Pickled settings do not match the schema of {settings_cls.__qualname__}'
+        )
+
+    settings = settings_cls._new()
+    paths = settings_cls.settings_paths()
+    owners: Dict[SettingPath, Settings] = {(): settings}
+    for idx, val in values.items():
+        path = paths[idx][0]
+        owner = _private_owner(owners, path[:-1])
+        # the values have been converted by the settings when they were set,
+        # so they are restored as is
+        owner.__dict__[f'__setting_{path[-1]}_value'] = val
+
+    frozen = state.pop('_frozen', False)
+    settings.__dict__.update(state)
+    if frozen:
+        settings._freeze()
+    return settings
+
+
+def _private_owner(owners: Dict[SettingPath, Settings], path: SettingPath) -> Settings:
+    # nested settings are restored to private copies,
+    # rather than to the nested settings shared by all instances
+    owner = owners.get(path)
+    if owner is None:
+        parent = _private_owner(owners, path[:-1])
+        owner = getattr(parent, path[-1])._shallow_copy()
+        owner._frozen = False
+        parent.__dict__[f'__setting_{path[-1]}_value'] = owner
+        owners[path] = owner
+    return owner
+
+
+async def _prefetch_async(source: Source):
+    if isinstance(source, AsyncSource):
+        await source.prefetch_async()
+    else:
+        # blocking sources are prefetched in the default executor
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, source.prefetch)
@@ -0,0 +1,174 @@
+"""Binary snapshots of resolved settings values.
+
+A snapshot holds the values of all the settings of a Settings object
+together with the schema fingerprint of its class. Loading a snapshot
+restores the values without reading sources or applying strategies.
+
+Snapshots are pickle-based: load snapshots from trusted locations only.
+"""
+import os
+import pickle
+import struct
+import tempfile
+from functools import reduce
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, TypeVar, Union
+
+from .exceptions import ConcreteSettingsError
+from .setting import PropertySetting
+
+if TYPE_CHECKING:
+    from .settings import Settings, SettingPath
+
+SettingsT = TypeVar('SettingsT', bound='Settings')
+
+MAGIC = b'CSSNAP01'
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# pickle length, number of out-of-band buffers
+_HEADER = struct.Struct('<QI')
+_BUFFER_HEADER = struct.Struct('<Q')
+
+
+class SnapshotError(ConcreteSettingsError):
+    """Raised when a snapshot cannot be loaded."""
+
+
+def dump_snapshot(settings: 'Settings', path: Union[str, Path]):
+    """Write resolved settings values to a snapshot file.
+
+    The file is replaced atomically."""
+    chunks = snapshot_chunks(settings)
+
+    path = str(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix='.snapshot-'
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_snapshot(settings_cls: Type[SettingsT], path: Union[str, Path]) -> SettingsT:
+    """Create a Settings object and restore its values from a snapshot file.
+
+    Raise :class:`SnapshotError` if the snapshot was made for a different schema."""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError as e:
+        raise SnapshotError(f'Snapshot file {path} was not found') from e
+
+    return decode_snapshot(settings_cls, raw, str(path))
+
+
+def snapshot_chunks(settings: 'Settings') -> List[Union[bytes, memoryview]]:
+    """Serialize resolved settings values.
+
+    Return chunks of the snapshot, which should be written in order.
+    Out-of-band pickle buffers are returned as is, without copying."""
+    payload = {
+        'fingerprint': settings.schema_fingerprint(),
+        'values': [
+            reduce(getattr, setting_path, settings)
+            for setting_path, _ in _stored_settings_paths(type(settings))
+        ],
+    }
+    data, buffers = _pickle(payload)
+
+    chunks: List[Union[bytes, memoryview]] = [
+        MAGIC,
+        _HEADER.pack(len(data), len(buffers)),
+        data,
+    ]
+    for buf in buffers:
+        chunks.append(_BUFFER_HEADER.pack(buf.nbytes))
+        chunks.append(buf)
+    return chunks
+
+
+def decode_snapshot(
+    settings_cls: Type[SettingsT], raw: Union[bytes, memoryview], origin: str
+) -> SettingsT:
+    """Create a Settings object and restore its values from snapshot bytes.
+
+    Out-of-band pickle buffers are passed to unpickling as read-only
+    slices of `raw`, so that values which support zero-copy
+    unpickling refer to `raw` memory directly.
+    `origin` names the snapshot in error messages."""
+    payload = _unpickle(raw, origin)
+
+    fingerprint = settings_cls.schema_fingerprint()
+    if payload.get('fingerprint') != fingerprint:
+        raise SnapshotError(
+            f'Snapshot {origin} does not match the schema of {settings_cls.__qualname__}'
+        )
+
+    # nested settings are restored to private copies,
+    # rather than to the nested settings shared by all instances
+    settings: SettingsT = settings_cls()._copy_tree()  # type: ignore
+    paths = _stored_settings_paths(settings_cls)
+    for (setting_path, _), value in zip(paths, payload['values']):
+        *parents, name = setting_path
+        owner = reduce(getattr, parents, settings)
+        # the values are resolved, so they are not set
+        # through the settings, which could convert them again
+        owner.__dict__[f'__setting_{name}_value'] = value
+    return settings
+
+
+def _stored_settings_paths(
+    settings_cls: Type['Settings'],
+) -> List[Tuple['SettingPath', Any]]:
+    # property settings are computed, not stored
+    return [
+        (setting_path, setting)
+        for setting_path, setting in settings_cls.settings_paths()
+        if not isinstance(setting, PropertySetting)
+    ]
+
+
+def _pickle(payload: Dict[str, Any]) -> Tuple[bytes, List[memoryview]]:
+    buffers: List[memoryview] = []
+    if PICKLE_PROTOCOL >= 5:
+        data = pickle.dumps(
+            payload,
+            protocol=PICKLE_PROTOCOL,
+            buffer_callback=lambda buf: buffers.append(buf.raw()),  # type: ignore
+        )
+    else:  # pragma: no cover
+        data = pickle.dumps(payload, protocol=PICKLE_PROTOCOL)
+    return data, buffers
+
+
+def _unpickle(raw: Union[bytes, memoryview], origin: str) -> Dict[str, Any]:
+    view = memoryview(raw)
+    if PICKLE_PROTOCOL >= 5:
+        view = view.toreadonly()  # type: ignore
+    try:
+        if view[:len(MAGIC)] != MAGIC:
+            raise SnapshotError(f'{origin} is not a settings snapshot')
+
+        offset = len(MAGIC)
+        data_len, buffers_count = _HEADER.unpack_from(view, offset)
+        offset += _HEADER.size
+        data = view[offset:offset + data_len]
+        offset += data_len
+
+        buffers = []
+        for _ in range(buffers_count):
+            (buf_len,) = _BUFFER_HEADER.unpack_from(view, offset)
+            offset += _BUFFER_HEADER.size
+            buffers.append(view[offset:offset + buf_len])
+            offset += buf_len
+
+        if buffers:
+            return pickle.loads(data, buffers=buffers)  # type: ignore
+        return pickle.loads(data)
+    except (struct.error, pickle.UnpicklingError, EOFError) as e:
+        raise SnapshotError(f'Snapshot {origin} is corrupted: {e}') from e
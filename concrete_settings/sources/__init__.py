@@ -1,25 +1,85 @@
+import asyncio
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Type, Optional, Union
+from typing import Any, Dict, Iterator, List, Tuple, Type, Optional, Union
 from typing import TYPE_CHECKING
 
 from ..exceptions import ConcreteSettingsError
 from . import strategies  # noqa: F401 # imported but unused
+from .cache import FileCache
+from .converters import ConverterRegistry, converters
 
 if TYPE_CHECKING:
     from ..setting import Setting
 
-_registered_sources = set()
-
 AnySource = Union[Dict[str, Any], str, 'Source', Path]
 
+# Registered sources dispatch tables:
+# file extension -> file source class
+_extension_sources: Dict[str, Type['Source']] = {}
+# source type -> source class
+_type_sources: Dict[type, Type['Source']] = {}
+# (-priority, registration number, source class) sorted list
+# of sources which decide whether to accept a source in get_source()
+_predicate_sources: List[Tuple[int, int, Type['Source']]] = []
+
+# URLs, such as "http://host/settings.json", are not dispatched
+# by the file extension
+_URL_SCHEME = re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]+://')
+
 
 class NotFound:
     pass
 
 
-def register_source(source_cls: Type['Source']):
-    global _registered_sources
-    _registered_sources.add(source_cls)
+def unshared_value(val: Any) -> Any:
+    """Return a copy of `val` with lists, dicts and sets copied recursively.
+
+    Sources which share parsed documents with each other, e.g. via
+    :class:`FileCache`, hand out such copies, so that modifying the value
+    of one settings object in-place does not change the values of the others.
+    Other objects are not copied."""
+    val_type = type(val)
+    if val_type is dict:
+        return {key: unshared_value(item) for key, item in val.items()}
+    if val_type is list:
+        return [unshared_value(item) for item in val]
+    if val_type is set:
+        return set(val)
+    return val
+
+
+def register_source(
+    source_cls: Optional[Type['Source']] = None, *, priority: int = 0
+) -> Any:
+    """Register a source class so that `get_source()` can find it.
+
+    File sources are looked up by file extension and sources with
+    `source_types` by the exact type of the source object.
+    All other sources are asked in order of descending `priority`
+    and then in order of registration.
+    A source registered later overrides an earlier one
+    registered for the same extension or type.
+
+    Can be used both as `@register_source`
+    and `@register_source(priority=...)` decorator."""
+    if source_cls is None:
+        return functools.partial(register_source, priority=priority)
+
+    extensions = getattr(source_cls, 'extensions', ())
+    if extensions:
+        for ext in extensions:
+            _extension_sources[ext] = source_cls
+    elif source_cls.source_types:
+        for source_type in source_cls.source_types:
+            _type_sources[source_type] = source_cls
+    else:
+        _predicate_sources.append((-priority, len(_predicate_sources), source_cls))
+        _predicate_sources.sort(key=lambda entry: entry[:2])
+
+    _source_class_for_type.cache_clear()
     return source_cls
 
 
@@ -35,7 +95,7 @@ def get_source(src: AnySource) -> 'Source':
     if isinstance(src, Source):
         return src
 
-    for src_cls in _registered_sources:
+    for src_cls in _candidate_source_classes(src):
         source = src_cls.get_source(src)
         if source is not None:
             return source
@@ -43,7 +103,47 @@ def get_source(src: AnySource) -> 'Source':
     raise NoSuitableSourceFound(src)
 
 
+def _candidate_source_classes(src: AnySource) -> Iterator[Type['Source']]:
+    if isinstance(src, Path) or (
+        isinstance(src, str) and not _URL_SCHEME.match(src)
+    ):
+        src_cls = _source_class_for_path(str(src))
+        if src_cls is not None:
+            yield src_cls
+
+    src_type: type = type(src)
+    src_cls = _source_class_for_type(src_type)
+    if src_cls is not None:
+        yield src_cls
+
+    for _, _, src_cls in _predicate_sources:
+        yield src_cls
+
+
+def _source_class_for_path(path: str) -> Optional[Type['Source']]:
+    # try the longest extension first, e.g. ".tar.gz" before ".gz"
+    name = os.path.basename(path)
+    dot = name.find('.')
+    while dot != -1:
+        src_cls = _extension_sources.get(name[dot:])
+        if src_cls is not None:
+            return src_cls
+        dot = name.find('.', dot + 1)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _source_class_for_type(src_type: type) -> Optional[Type['Source']]:
+    for t in src_type.__mro__:
+        if t in _type_sources:
+            return _type_sources[t]
+    return None
+
+
 class Source:
+    #: Types of source objects handled by the source class
+    source_types: Tuple[type, ...] = ()
+
     @staticmethod
     def get_source(src: AnySource) -> Optional['Source']:
         return None
@@ -53,27 +153,43 @@ class Source:
     ) -> Union[Type[NotFound], Any]:
         pass
 
+    def prefetch(self):
+        """Read the underlying data in advance, before settings are read."""
+        pass
+
+
+class AsyncSource(Source):
+    """A source which fetches its data asynchronously."""
+
+    async def prefetch_async(self):
+        """Fetch the underlying data, before settings are read."""
+        raise NotImplementedError()
+
+    def prefetch(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.prefetch_async())
+        finally:
+            loop.close()
+
 
 class StringSourceMixin:
     """Extends source by providing a string value to required type
        conversion method."""
 
-    @staticmethod
-    def convert_value(val: str, type_hint: Any = None) -> Any:
-        """Convert given string value to type based on `type_hint`"""
-        if type_hint in (int, float):
-            return type_hint(val)
-        elif type_hint is bool:
-            if val.lower() == 'true':
-                return True
-            elif val.lower() == 'false':
-                return False
+    #: Registry of string to type converters
+    converters: ConverterRegistry = converters
 
-        return val
+    @classmethod
+    def convert_value(cls, val: str, type_hint: Any = None) -> Any:
+        """Convert given string value to type based on `type_hint`"""
+        return cls.converters.get_converter(type_hint)(val)
 
 
 @register_source
 class DictSource(Source):
+    source_types = (dict,)
+
     def __init__(self, s: dict):
         self.data: dict = s
 
@@ -100,10 +216,18 @@ class DictSource(Source):
 class FileSource(Source):
     extensions: List[str] = []
 
+    #: A :class:`FileCache` shared by all file sources.
+    #: Caching is disabled when set to ``None``.
+    cache: Optional[FileCache] = None
+
+    #: Parsed files are dicts of values nested the same way as settings
+    nested_documents = True
+
     path: str
 
     def __init__(self, path):
         self.path = path
+        self._data = None
 
     @classmethod
     def get_source(cls, src) -> Optional['FileSource']:
@@ -119,3 +243,35 @@ class FileSource(Source):
                     return cls(src)
 
         return None
+
+    def read(
+        self, setting: 'Setting', parents: Tuple[str, ...] = ()
+    ) -> Union[Type[NotFound], Any]:
+        self.prefetch()
+
+        d = self._data
+        for key in parents:
+            d = d[key]
+
+        # parsed files are shared by all the sources when cached
+        return unshared_value(d.get(setting.name, NotFound))
+
+    def prefetch(self):
+        if self._data is None:
+            self._data = self._load_data()
+
+    def _load_data(self):
+        if self.cache is None:
+            return self._parse_file(self.path)
+        return self.cache.get(self.path, self._parse_file, self._cache_variant())
+
+    def _parse_file(self, path: str) -> Dict[str, Any]:
+        """Parse file according to the source options"""
+        return self._read_file(path)
+
+    def _cache_variant(self) -> Tuple:
+        return (self.__class__,)
+
+    @staticmethod
+    def _read_file(path: str) -> Dict[str, Any]:
+        raise NotImplementedError()
@@ -0,0 +1,99 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_Stamp = Tuple[int, int]
+_Key = Tuple[str, Hashable]
+
+
+class FileCache:
+    """A process-wide LRU cache of parsed source files.
+
+    Entries are keyed by the resolved file path and validated against
+    the file's modification time and size on every access, so a file
+    which has changed on disk is parsed again.
+    The cache is bounded by the number of entries and (optionally)
+    by the total size of the cached files in bytes.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: Dict[_Key, Tuple[_Stamp, Any]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, load: Callable[[str], Any], variant: Hashable = ()) -> Any:
+        """Return parsed contents of file at `path`.
+
+        `load(path)` is called to parse the file if there is no valid
+        entry in the cache. `variant` distinguishes between
+        different parsers of the same file."""
+        resolved = os.path.realpath(path)
+        try:
+            st = os.stat(resolved)
+        except OSError:
+            # let the loader report the error in its own terms
+            return load(path)
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = (resolved, variant)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == stamp:
+                    self._entries.move_to_end(key)  # type: ignore
+                    return entry[1]
+                self._discard(key)
+
+        data = load(path)
+
+        with self._lock:
+            self._store(key, stamp, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        resolved = os.path.realpath(path)
+        return any(key[0] == resolved for key in self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached files."""
+        return self._bytes
+
+    def _store(self, key: _Key, stamp: _Stamp, data: Any):
+        size = stamp[1]
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._discard(key)
+
+        self._entries[key] = (stamp, data)
+        self._bytes += size
+
+        while self._overflows():
+            oldest_key = next(iter(self._entries))
+            self._discard(oldest_key)
+
+    def _overflows(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _discard(self, key: _Key):
+        stamp, _ = self._entries.pop(key)
+        self._bytes -= stamp[1]
@@ -0,0 +1,193 @@
+"""String values to typed values conversion.
+
+Used by sources which provide setting values as strings,
+such as environmental variables. A converter is compiled once
+per type hint and cached.
+"""
+import json
+import threading
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, TypeVar, Union
+
+Converter = Callable[[str], Any]
+
+#: Strings converted to None for Optional[...] type hints
+NONE_VALUES = ('', 'null', 'none')
+
+_UNION_TYPES: Tuple[Any, ...] = (Union,)
+try:
+    from types import UnionType  # type: ignore # Python 3.10+
+
+    _UNION_TYPES += (UnionType,)
+except ImportError:  # pragma: no cover
+    pass
+
+_SEQUENCE_TYPES = (list, tuple, set, frozenset)
+
+
+def convert_int(val: str) -> int:
+    return int(val)
+
+
+def convert_float(val: str) -> float:
+    return float(val)
+
+
+def convert_bool(val: str) -> Union[bool, str]:
+    if val.lower() == 'true':
+        return True
+    elif val.lower() == 'false':
+        return False
+    return val
+
+
+def convert_identity(val: str) -> Any:
+    return val
+
+
+class ConverterRegistry:
+    def __init__(self):
+        self._converters: Dict[Any, Converter] = {}
+        self._compiled: Dict[Any, Converter] = {}
+        self._lock = threading.Lock()
+
+    def register(self, type_hint: Any, converter: Converter):
+        """Register a converter for the exact type hint."""
+        with self._lock:
+            self._converters[type_hint] = converter
+            self._compiled.clear()
+
+    def get_converter(self, type_hint: Any) -> Converter:
+        try:
+            return self._compiled[type_hint]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable type hint
+            return self._compile(type_hint)
+
+        converter = self._compile(type_hint)
+        with self._lock:
+            self._compiled[type_hint] = converter
+        return converter
+
+    def convert(self, val: str, type_hint: Any) -> Any:
+        return self.get_converter(type_hint)(val)
+
+    def _compile(self, type_hint: Any) -> Converter:
+        try:
+            return self._converters[type_hint]
+        except (KeyError, TypeError):
+            pass
+
+        origin = _origin(type_hint)
+        args = tuple(
+            Any if isinstance(arg, TypeVar) else arg
+            for arg in getattr(type_hint, '__args__', None) or ()
+        )
+
+        if origin in _UNION_TYPES or isinstance(type_hint, _UNION_TYPES[1:]):
+            return self._compile_union(args)
+        if origin in _SEQUENCE_TYPES:
+            return self._compile_sequence(origin, args)
+        if origin is dict:
+            return self._compile_dict(args)
+        # values of other types, including the types of registered setting
+        # classes, are left to the setting and its validators
+        return convert_identity
+
+    def _compile_union(self, args: Tuple[Any, ...]) -> Converter:
+        optional = type(None) in args
+        converters = [self.get_converter(arg) for arg in args if arg is not type(None)]
+
+        def convert_union(val: str) -> Any:
+            if optional and val.lower() in NONE_VALUES:
+                return None
+            for converter in converters:
+                try:
+                    return converter(val)
+                except (ValueError, TypeError):
+                    continue
+            return val
+
+        return convert_union
+
+    def _compile_sequence(self, container: type, args: Tuple[Any, ...]) -> Converter:
+        if container is tuple and args and args[-1] is not Ellipsis:
+            item_converters = [self.get_converter(arg) for arg in args]
+        else:
+            item_converters = [self.get_converter(args[0] if args else Any)]
+
+        def convert_item(i: int, item: Any) -> Any:
+            if not isinstance(item, str):
+                return item
+            return item_converters[min(i, len(item_converters) - 1)](item)
+
+        def convert_sequence(val: str) -> Any:
+            stripped = val.strip()
+            if stripped.startswith('['):
+                try:
+                    items = json.loads(stripped)
+                except ValueError:
+                    return val
+                if not isinstance(items, list):
+                    return val
+            elif stripped:
+                items = [item.strip() for item in val.split(',')]
+            else:
+                items = []
+            return container(convert_item(i, item) for i, item in enumerate(items))
+
+        return convert_sequence
+
+    def _compile_dict(self, args: Tuple[Any, ...]) -> Converter:
+        value_converter = self.get_converter(args[1] if len(args) == 2 else Any)
+
+        def convert_dict(val: str) -> Any:
+            try:
+                d = json.loads(val)
+            except ValueError:
+                return val
+            if not isinstance(d, dict):
+                return val
+            return {
+                k: value_converter(v) if isinstance(v, str) else v for k, v in d.items()
+            }
+
+        return convert_dict
+
+
+def _origin(type_hint: Any) -> Any:
+    if type_hint in _SEQUENCE_TYPES or type_hint is dict:
+        return type_hint
+
+    origin = getattr(type_hint, '__origin__', None)
+    if origin is None:
+        # Python 3.6: bare typing.List, typing.Dict, etc.
+        return getattr(type_hint, '__extra__', None)
+
+    # Python 3.6: typing.List[int].__origin__ is typing.List
+    return getattr(origin, '__extra__', origin)
+
+
+def _make_constructor_converter(type_hint: type) -> Converter:
+    def convert_by_constructor(val: str) -> Any:
+        try:
+            return type_hint(val)
+        except (ValueError, TypeError, ArithmeticError):
+            # leave the value to setting validators
+            return val
+
+    convert_by_constructor.__qualname__ = f'convert_{type_hint.__name__}'
+    return convert_by_constructor
+
+
+converters = ConverterRegistry()
+converters.register(int, convert_int)
+converters.register(float, convert_float)
+converters.register(bool, convert_bool)
+converters.register(str, convert_identity)
+converters.register(Any, convert_identity)
+converters.register(Path, _make_constructor_converter(Path))
+converters.register(Decimal, _make_constructor_converter(Decimal))
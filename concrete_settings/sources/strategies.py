@@ -2,11 +2,22 @@
 
 This module contains the basic and default update strategies used
 when calling `concrete_settings.Settings.update`
+
+In the complexity notes below, *n* stands for the size of the current
+value and *m* for the size of the new value.
 """
 import abc
+import functools
+import itertools
+from typing import Any, Dict, Iterable, Mapping, Sequence
 
 from typing_extensions import Protocol
 
+from ..paths import PathPattern, SettingPath, is_pattern
+
+_MISSING = object()
+_SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+
 
 class Strategy(Protocol):
     @abc.abstractmethod
@@ -15,15 +26,136 @@ class Strategy(Protocol):
 
 
 def overwrite(current_val, new_value):
+    """Replace the current value by the new value. O(1)."""
     return new_value
 
 
 def append(current_val, new_value):
+    """Return ``current_val + new_value``. O(n + m) for sequences.
+
+    When a setting is updated from several sources at once
+    (see :meth:`Settings.update_many`), the values are concatenated
+    in a single pass, i.e. in time linear in the size of the result,
+    rather than copying the growing value for each source."""
     return current_val + new_value
 
 
 def prepend(current_value, new_value):
+    """Return ``new_value + current_value``. O(n + m) for sequences.
+
+    Folds values of several sources in a single pass, like :func:`append`."""
     return new_value + current_value
 
 
+def deep_merge(current_value, new_value):
+    """Recursively merge the new dict into the current dict.
+
+    Keys of the new dict override the keys of the current one,
+    except that nested dicts are merged. Values which are not dicts
+    on both sides are overwritten.
+
+    Neither value is modified: the dicts along the changed paths
+    are shallow-copied, while unchanged subtrees of the current value
+    and the subtrees of the new value are shared with the result.
+    The result is the current value itself if nothing has changed.
+    O(m + k), where k is the number of keys in the copied dicts."""
+    if not isinstance(current_value, dict) or not isinstance(new_value, dict):
+        return new_value
+
+    merged = None
+    for key, new_item in new_value.items():
+        current_item = current_value.get(key, _MISSING)
+        if current_item is _MISSING:
+            merged_item = new_item
+        else:
+            merged_item = deep_merge(current_item, new_item)
+            if _same(current_item, merged_item):
+                continue
+
+        if merged is None:
+            merged = dict(current_value)
+        merged[key] = merged_item
+
+    return current_value if merged is None else merged
+
+
+def _same(current_item, merged_item) -> bool:
+    if current_item is merged_item:
+        return True
+    return (
+        type(current_item) is type(merged_item)
+        and isinstance(current_item, _SCALAR_TYPES)
+        and current_item == merged_item
+    )
+
+
+def _fold_append(current_value, new_values: Sequence[Any]):
+    value_type = type(current_value)
+    if all(type(v) is value_type for v in new_values):
+        if value_type in (list, tuple):
+            return value_type(itertools.chain(current_value, *new_values))
+        if value_type in (str, bytes):
+            return value_type().join((current_value, *new_values))
+    return functools.reduce(append, new_values, current_value)
+
+
+def _fold_prepend(current_value, new_values: Sequence[Any]):
+    # prepend(...prepend(current, v1)..., vN) == vN + ... + v1 + current
+    value_type = type(current_value)
+    if all(type(v) is value_type for v in new_values):
+        values = (*reversed(new_values), current_value)
+        if value_type in (list, tuple):
+            return value_type(itertools.chain(*values))
+        if value_type in (str, bytes):
+            return value_type().join(values)
+    return functools.reduce(prepend, new_values, current_value)
+
+
+def fold(strategy: Strategy, current_value, new_values: Sequence[Any]):
+    """Apply `strategy` to the current value and each of the new values in turn.
+
+    Strategies may provide a faster equivalent
+    as a ``fold(current_value, new_values)`` attribute."""
+    if len(new_values) == 1:
+        return strategy(current_value, new_values[0])
+
+    strategy_fold = getattr(strategy, 'fold', None)
+    if strategy_fold is not None:
+        return strategy_fold(current_value, new_values)
+    return functools.reduce(strategy, new_values, current_value)
+
+
+def resolve_strategies(
+    strategies: Mapping[str, Strategy], paths: Iterable[SettingPath]
+) -> Dict[SettingPath, Strategy]:
+    """Map each of the setting paths to its update strategy.
+
+    `strategies` keys are dotted setting names or path patterns,
+    see :mod:`concrete_settings.paths`. An exact name takes precedence
+    over patterns, otherwise the first matching pattern wins.
+    Paths updated by the default strategy are omitted."""
+    exact: Dict[str, Strategy] = {}
+    patterns = []
+    for key, strategy in strategies.items():
+        if is_pattern(key):
+            patterns.append((PathPattern(key), strategy))
+        else:
+            exact[key] = strategy
+
+    table = {}
+    for path in paths:
+        dotted_name = '.'.join(path)
+        if dotted_name in exact:
+            table[path] = exact[dotted_name]
+            continue
+        for pattern, strategy in patterns:
+            if pattern.match(path):
+                table[path] = strategy
+                break
+    return table
+
+
+append.fold = _fold_append  # type: ignore
+prepend.fold = _fold_prepend  # type: ignore
+
 default: Strategy = overwrite
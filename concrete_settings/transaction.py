@@ -0,0 +1,95 @@
+"""Copy-on-write staging of settings changes.
+
+See :meth:`Settings.transaction() <concrete_settings.Settings.transaction>`.
+
+While a transaction is active, reads and writes of a Settings object
+are redirected to its shallow copy. Nested Settings objects are copied
+lazily, when they are first accessed in the transaction.
+The staging is visible only in the context (thread or asyncio task)
+which has started the transaction.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from . import hooks
+from .exceptions import ConcreteSettingsError
+
+if TYPE_CHECKING:
+    from .settings import Settings
+
+# {id(settings object): staged copy} of the transactions active
+# in the current context. Staged copies are mapped to themselves.
+_staged: ContextVar[Optional[Dict[int, 'Settings']]] = ContextVar(
+    'concrete_settings_staged', default=None
+)
+
+# Number of transactions active in all contexts. Allows settings reads
+# to skip the context variable lookup when there are no transactions.
+open_count = 0
+_open_count_lock = threading.Lock()
+
+
+class TransactionError(ConcreteSettingsError):
+    pass
+
+
+def staged(owner: Any) -> Any:
+    """Return the staged copy of `owner` in the current context
+    or `owner` itself if it does not take part in a transaction."""
+    staged_map = _staged.get()
+    if staged_map is None:
+        return owner
+    return staged_map.get(id(owner), owner)
+
+
+def stage_nested(owner: Any, setting: 'Settings', nested: 'Settings') -> 'Settings':
+    """Return a staged copy of `nested` settings read from `owner`.
+
+    The copy is made on first access and is assigned to the staged owner,
+    so that changes of the nested settings are staged as well."""
+    staged_map = _staged.get()
+    if staged_map is None:
+        return nested
+
+    staged_owner = staged_map.get(id(owner))
+    if staged_owner is None:
+        return nested
+
+    nested_copy = staged_map.get(id(nested))
+    if nested_copy is None:
+        nested_copy = nested._shallow_copy()
+        staged_map[id(nested)] = nested_copy
+        staged_map[id(nested_copy)] = nested_copy
+        setting.set_value(staged_owner, nested_copy)
+    return nested_copy
+
+
+@contextmanager
+def stage(settings: 'Settings') -> Iterator['Settings']:
+    """Redirect access to `settings` to a staged copy in the current context.
+
+    Yield the staged copy."""
+    global open_count
+
+    outer_map = _staged.get()
+    if outer_map is not None and id(settings) in outer_map:
+        raise TransactionError('Settings are already in a transaction')
+
+    settings_copy = settings._shallow_copy()
+    staged_map = dict(outer_map or {})
+    staged_map[id(settings)] = settings_copy
+    staged_map[id(settings_copy)] = settings_copy
+
+    token = _staged.set(staged_map)
+    with _open_count_lock:
+        open_count += 1
+    hooks.enter_block()
+    try:
+        yield settings_copy
+    finally:
+        _staged.reset(token)
+        with _open_count_lock:
+            open_count -= 1
+        hooks.exit_block()
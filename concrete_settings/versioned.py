@@ -0,0 +1,89 @@
+"""Versioned settings for lock-free reading during updates.
+
+A :class:`VersionedSettings` object holds an immutable (frozen) version
+of settings. Writers build a new version from a copy of the current one
+and publish it by a single reference assignment, so readers always see
+a complete and consistent version without taking any locks.
+A version which is not referenced anymore is garbage collected.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Generic, Iterator, Optional, Tuple, TypeVar
+
+from .settings import ChangeSet, Settings
+from .sources import AnySource
+
+SettingsT = TypeVar('SettingsT', bound=Settings)
+
+
+class VersionedSettings(Generic[SettingsT]):
+    """A handle of the current version of settings.
+
+    Readers should get the :attr:`current` version once and
+    read all the values they need from it::
+
+        settings = versioned_settings.current
+        connect(settings.DB.HOST, settings.DB.PORT)
+
+    The version stays consistent, no matter how many
+    new versions are published in the meantime.
+    """
+
+    def __init__(self, settings: SettingsT):
+        settings = settings._copy_tree()  # type: ignore
+        settings._freeze()
+
+        # (version number, settings) are swapped together
+        self._state: Tuple[int, SettingsT] = (0, settings)
+        self._write_lock = threading.Lock()
+
+    @property
+    def current(self) -> SettingsT:
+        """The current version of settings."""
+        return self._state[1]
+
+    @property
+    def version(self) -> int:
+        """The number of the current version, increased on every publish."""
+        return self._state[0]
+
+    def pin(self) -> Tuple[int, SettingsT]:
+        """Return the current (version number, settings) pair."""
+        return self._state
+
+    @contextmanager
+    def write(self) -> Iterator[SettingsT]:
+        """Yield a draft copy of the current version.
+
+        The draft is published as a new version when the block
+        exits without errors, otherwise it is discarded.
+        Writers are serialized, readers are never blocked."""
+        with self._write_lock:
+            version, settings = self._state
+            draft = settings._copy_tree()
+            yield draft  # type: ignore
+            draft._freeze()
+            self._state = (version + 1, draft)  # type: ignore
+
+    def update(
+        self,
+        *sources: AnySource,
+        strategies: Optional[dict] = None,
+        validate: bool = True,
+        return_changes: bool = False,
+    ) -> Optional[ChangeSet]:
+        """Publish a new version updated from the sources.
+
+        The new version is validated unless `validate` is False.
+        If validation fails, the current version is left intact."""
+        with self.write() as draft:
+            changes = draft.update_many(
+                sources, strategies or {}, return_changes=return_changes
+            )
+            if validate:
+                draft.is_valid(raise_exception=True)
+        return changes
+
+    def __repr__(self) -> str:
+        version, settings = self._state
+        return f'<{self.__class__.__name__} of {type(settings).__qualname__} v{version}>'
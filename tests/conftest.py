@@ -7,7 +7,7 @@ import pytest
 from factory import fuzzy
 from pyfakefs.fake_filesystem_unittest import Patcher
 
-from concrete_settings import Validator
+from concrete_settings import Settings, Validator, setting
 from concrete_settings.exceptions import ValidationError
 
 seed = random.randint(1, 1e9)
@@ -19,6 +19,34 @@ factory.random.reseed_random(seed)
 Patcher.SKIPNAMES.add('django')
 
 
+class DBSettings(Settings):
+    HOST: str = 'localhost'
+    PORT: int = 5432
+    OPTIONS: dict = {}
+
+
+class AppSettings(Settings):
+    DEBUG: bool = False
+    ALLOWED_HOSTS: list = []
+    DB = DBSettings()
+
+    @setting
+    def URL(self) -> str:
+        return f'http://{self.DB.HOST}'
+
+    def validate(self):
+        if self.DB.PORT < 1024:
+            raise ValidationError('Privileged DB port')
+
+
+@pytest.fixture
+def app_settings():
+    """AppSettings with nested settings which are not shared with the class"""
+    settings = AppSettings()
+    settings.DB = DBSettings()
+    return settings
+
+
 @pytest.fixture
 def v_int():
     return fuzzy.FuzzyInteger(-10e10, 10e10).fuzz()
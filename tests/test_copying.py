@@ -0,0 +1,155 @@
+import copy
+import pickle
+import uuid
+
+import pytest
+
+from concrete_settings import Settings, Validator
+from concrete_settings.contrib.settings.uuid import UUIDSetting
+
+from .conftest import AppSettings
+
+
+class TaggedSettings(Settings):
+    DEBUG: bool = False
+
+    def __init__(self, tag='', **kwargs):
+        super().__init__(**kwargs)
+        self.tag = tag
+
+
+class InstanceSettings(Settings):
+    ID = UUIDSetting(uuid.UUID(int=0))
+
+
+class NoopValidator(Validator):
+    def __call__(self, value, **ignore):
+        pass
+
+
+@pytest.fixture
+def app_settings(app_settings):
+    app_settings.update(
+        {
+            'ALLOWED_HOSTS': ['example.com'],
+            'DB': {'HOST': 'db.example.com', 'OPTIONS': {'timeouts': [1, 2]}},
+        }
+    )
+    return app_settings
+
+
+def test_pickle_stores_explicitly_set_values_only(app_settings):
+    _, (settings_cls, fingerprint, values, state) = app_settings.__reduce__()
+    paths = [path for path, _ in AppSettings.settings_paths()]
+
+    assert settings_cls is AppSettings
+    assert fingerprint == AppSettings.schema_fingerprint()
+    assert not any(key.startswith('__setting_') for key in state)
+    assert {paths[idx]: val for idx, val in values.items()} == {
+        ('ALLOWED_HOSTS',): ['example.com'],
+        ('DB', 'HOST'): 'db.example.com',
+        ('DB', 'OPTIONS'): {'timeouts': [1, 2]},
+    }
+
+
+def test_pickle_roundtrip(app_settings):
+    restored = pickle.loads(pickle.dumps(app_settings))
+
+    assert restored.DEBUG is False
+    assert restored.ALLOWED_HOSTS == ['example.com']
+    assert restored.DB.HOST == 'db.example.com'
+    assert restored.DB.OPTIONS == {'timeouts': [1, 2]}
+    assert restored.URL == 'http://db.example.com'
+    assert restored.is_valid()
+
+
+def test_unpickled_nested_settings_are_private(app_settings):
+    restored = pickle.loads(pickle.dumps(app_settings))
+    restored.DB.HOST = 'other.example.com'
+
+    assert restored.DB is not AppSettings.DB
+    assert AppSettings.DB.HOST == 'localhost'
+    assert app_settings.DB.HOST == 'db.example.com'
+
+
+@pytest.mark.parametrize(
+    'copy_settings', [copy.deepcopy, lambda s: pickle.loads(pickle.dumps(s))]
+)
+def test_copy_keeps_instance_attributes(copy_settings):
+    validator = NoopValidator()
+    settings = TaggedSettings(tag='tenant', validators=(validator,), override=True)
+    settings.DEBUG = True
+
+    settings_copy = copy_settings(settings)
+    assert settings_copy.tag == 'tenant'
+    assert len(settings_copy.validators) == 1
+    assert settings_copy.override is True
+    assert settings_copy.value is settings_copy
+    assert settings_copy.DEBUG is True
+
+
+@pytest.mark.parametrize(
+    'copy_settings', [copy.deepcopy, lambda s: pickle.loads(pickle.dumps(s))]
+)
+def test_copy_does_not_convert_values_again(copy_settings):
+    instance_id = uuid.uuid4()
+    settings = InstanceSettings()
+    settings.ID = str(instance_id)
+
+    assert copy_settings(settings).ID == instance_id
+
+
+def test_copy_keeps_frozen_settings_frozen(app_settings):
+    app_settings._freeze()
+    settings_copy = copy.deepcopy(app_settings)
+
+    assert settings_copy._frozen
+    assert settings_copy.DB._frozen
+
+
+def test_unpickling_different_schema_fails(app_settings, mocker):
+    data = pickle.dumps(app_settings)
+    mocker.patch.object(AppSettings, 'schema_fingerprint', return_value='changed')
+
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(data)
+
+
+def test_unpickling_does_not_verify_structure(app_settings, mocker):
+    data = pickle.dumps(app_settings)
+    verify_structure = mocker.patch.object(AppSettings, '_verify_structure')
+
+    pickle.loads(data)
+    verify_structure.assert_not_called()
+
+
+def test_deepcopy(app_settings):
+    settings_copy = copy.deepcopy(app_settings)
+
+    assert settings_copy.DB.OPTIONS == app_settings.DB.OPTIONS
+    assert settings_copy.DB.OPTIONS is not app_settings.DB.OPTIONS
+
+
+def test_clone_copies_mutable_values(app_settings):
+    settings_clone = app_settings.clone()
+    settings_clone.ALLOWED_HOSTS.append('www.example.com')
+    settings_clone.DB.OPTIONS['timeouts'].append(3)
+
+    assert app_settings.ALLOWED_HOSTS == ['example.com']
+    assert app_settings.DB.OPTIONS == {'timeouts': [1, 2]}
+
+
+def test_clone_shares_immutable_values(app_settings):
+    app_settings.DEBUG = True
+    settings_clone = app_settings.clone()
+
+    assert settings_clone.DEBUG is True
+    assert settings_clone.DB.HOST is app_settings.DB.HOST
+
+
+def test_clone_has_private_nested_settings():
+    settings_clone = AppSettings().clone()
+    settings_clone.DB.HOST = 'db.example.com'
+
+    assert settings_clone.DB is not AppSettings.DB
+    assert AppSettings.DB.HOST == 'localhost'
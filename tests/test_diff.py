@@ -0,0 +1,59 @@
+import pytest
+
+from concrete_settings import Settings
+from concrete_settings.settings import Change
+
+from .conftest import AppSettings, DBSettings
+
+
+def test_diff_of_equal_settings_is_empty(app_settings):
+    assert app_settings.diff(app_settings) == {}
+    assert app_settings.diff(app_settings.clone()) == {}
+
+
+def test_diff_returns_changed_paths(app_settings):
+    other_settings = app_settings.clone()
+    other_settings.DEBUG = True
+    other_settings.DB.PORT = 6432
+
+    assert app_settings.diff(other_settings) == {
+        'DEBUG': Change(False, True),
+        'DB.PORT': Change(5432, 6432),
+    }
+    assert other_settings.diff(app_settings) == {
+        'DEBUG': Change(True, False),
+        'DB.PORT': Change(6432, 5432),
+    }
+
+
+def test_diff_skips_shared_nested_settings(app_settings, mocker):
+    other_settings = AppSettings.overlay(app_settings, DEBUG=True)
+    other_settings.DB = app_settings.DB
+    cached_values_total = mocker.spy(DBSettings, '_cached_values_total')
+
+    assert app_settings.diff(other_settings) == {'DEBUG': Change(False, True)}
+    cached_values_total.assert_not_called()
+
+
+def test_diff_compares_values_by_cached_fingerprints(app_settings, mocker):
+    other_settings = app_settings.clone()
+    other_settings.DB.HOST = 'db.example.com'
+    app_settings.fingerprint()
+    other_settings.fingerprint()
+    value_changed = mocker.patch(
+        'concrete_settings.settings._value_changed', wraps=lambda a, b: a != b
+    )
+
+    assert app_settings.diff(other_settings) == {
+        'DB.HOST': Change('localhost', 'db.example.com')
+    }
+    # top-level values have equal fingerprints and are not compared
+    assert value_changed.call_count == len(DBSettings._value_settings_names())
+
+
+def test_diff_of_different_schemas_fails(app_settings):
+    class OtherSettings(Settings):
+        DEBUG: bool = False
+
+    with pytest.raises(AssertionError):
+        app_settings.diff(OtherSettings())
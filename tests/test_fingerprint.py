@@ -0,0 +1,85 @@
+from concrete_settings import Settings
+from concrete_settings.fingerprint import encode_value
+
+from .conftest import AppSettings, DBSettings
+
+
+def test_fingerprint_is_stable(app_settings):
+    other_settings = AppSettings()
+    other_settings.DB = DBSettings()
+
+    assert app_settings.fingerprint() == app_settings.fingerprint()
+    assert app_settings.fingerprint() == other_settings.fingerprint()
+
+
+def test_fingerprint_depends_on_schema(app_settings):
+    class OtherSettings(Settings):
+        DEBUG: bool = False
+        ALLOWED_HOSTS: list = []
+        DB = DBSettings()
+        EXTRA: int = 0
+
+    assert OtherSettings().fingerprint() != app_settings.fingerprint()
+
+
+def test_fingerprint_changes_when_setting_is_set(app_settings):
+    fingerprint = app_settings.fingerprint()
+
+    app_settings.DEBUG = True
+    assert app_settings.fingerprint() != fingerprint
+
+    app_settings.DEBUG = False
+    assert app_settings.fingerprint() == fingerprint
+
+
+def test_fingerprint_changes_when_nested_setting_is_set(app_settings):
+    fingerprint = app_settings.fingerprint()
+    app_settings.DB.HOST = 'db.example.com'
+    assert app_settings.fingerprint() != fingerprint
+
+
+def test_fingerprint_recomputes_changed_settings_only(app_settings, mocker):
+    app_settings.fingerprint()
+    setting_digest = mocker.patch(
+        'concrete_settings.fingerprint.setting_digest', return_value=1
+    )
+
+    app_settings.DEBUG = True
+    app_settings.fingerprint()
+    setting_digest.assert_called_once_with('DEBUG', True)
+
+
+def test_fingerprint_after_transaction(app_settings):
+    fingerprint = app_settings.fingerprint()
+
+    with app_settings.transaction():
+        app_settings.DEBUG = True
+        staged_fingerprint = app_settings.fingerprint()
+        assert staged_fingerprint != fingerprint
+
+    assert app_settings.fingerprint() == staged_fingerprint
+
+
+def test_fingerprint_with_overrides(app_settings):
+    fingerprint = app_settings.fingerprint()
+    with app_settings.overrides(DEBUG=True):
+        assert app_settings.fingerprint() != fingerprint
+    assert app_settings.fingerprint() == fingerprint
+
+
+def test_overlay_fingerprint_follows_base(app_settings):
+    tenant = AppSettings.overlay(app_settings, DEBUG=True)
+    fingerprint = tenant.fingerprint()
+
+    app_settings.ALLOWED_HOSTS = ['example.com']
+    assert tenant.fingerprint() != fingerprint
+    other_tenant = AppSettings.overlay(app_settings, DEBUG=True)
+    assert tenant.fingerprint() == other_tenant.fingerprint()
+
+
+def test_encode_value_is_canonical():
+    assert encode_value({'a': 1, 'b': 2}) == encode_value({'b': 2, 'a': 1})
+    assert encode_value({'x', 'y', 'z'}) == encode_value({'z', 'y', 'x'})
+    assert encode_value(1) != encode_value(True)
+    assert encode_value(['a', 'b']) != encode_value(['ab'])
+    assert encode_value([1]) != encode_value((1,))
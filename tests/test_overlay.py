@@ -0,0 +1,117 @@
+import pickle
+
+import pytest
+
+from concrete_settings.settings import MAX_OVERLAY_DEPTH
+
+from .conftest import AppSettings, DBSettings
+
+
+class TenantSettings(AppSettings):
+    NAME: str = ''
+
+
+@pytest.fixture
+def base():
+    settings = TenantSettings()
+    settings.DB = DBSettings()
+    settings.update({'NAME': 'base', 'DB': {'HOST': 'db.example.com'}})
+    return settings
+
+
+def _stored_keys(settings):
+    return {key for key in settings.__dict__ if key.startswith('__setting_')}
+
+
+def test_overlay_reads_values_from_base(base):
+    tenant = TenantSettings.overlay(base, DEBUG=True)
+
+    assert tenant.DEBUG is True
+    assert tenant.NAME == 'base'
+    assert tenant.DB.HOST == 'db.example.com'
+    assert tenant.is_valid()
+
+
+def test_overlay_stores_overrides_equal_to_base_values(base):
+    tenant = TenantSettings.overlay(base, DEBUG=True, NAME='base')
+    assert _stored_keys(tenant) == {'__setting_DEBUG_value', '__setting_NAME_value'}
+
+    base.NAME = 'changed'
+    assert tenant.NAME == 'base'
+
+
+def test_overlay_skip_unchanged_stores_only_changed_values(base):
+    tenant = TenantSettings.overlay(base, skip_unchanged=True, DEBUG=True, NAME='base')
+    assert _stored_keys(tenant) == {'__setting_DEBUG_value'}
+
+
+def test_overlay_reflects_base_changes(base):
+    tenant = TenantSettings.overlay(base)
+    base.NAME = 'changed'
+    assert tenant.NAME == 'changed'
+
+
+def test_overlay_changes_do_not_affect_base(base):
+    tenant = TenantSettings.overlay(base)
+    tenant.NAME = 'tenant'
+    tenant.DB.HOST = 'tenant-db.example.com'
+
+    assert base.NAME == 'base'
+    assert base.DB.HOST == 'db.example.com'
+    assert tenant.DB.PORT == 5432
+
+
+def test_overlay_nested_settings(base):
+    tenant = TenantSettings.overlay(base, DB={'PORT': 6432})
+
+    assert tenant.DB.HOST == 'db.example.com'
+    assert tenant.DB.PORT == 6432
+    assert base.DB.PORT == 5432
+
+
+def test_overlay_nested_settings_follow_replaced_base_nested_settings(base):
+    tenant = TenantSettings.overlay(base)
+    tenant_with_port = TenantSettings.overlay(base, DB={'PORT': 6432})
+    assert tenant.DB.HOST == 'db.example.com'
+
+    with base.transaction():
+        base.update({'DEBUG': True, 'DB': {'HOST': 'new-db.example.com'}})
+
+    assert tenant.DEBUG is True
+    assert tenant.DB.HOST == 'new-db.example.com'
+    assert tenant_with_port.DB.HOST == 'new-db.example.com'
+    assert tenant_with_port.DB.PORT == 6432
+
+    tenant.DB.PORT = 7432
+    base.DB = DBSettings()
+    assert tenant.DB.HOST == 'localhost'
+    assert tenant.DB.PORT == 7432
+
+
+def test_overlay_unknown_setting_fails(base):
+    with pytest.raises(AttributeError):
+        TenantSettings.overlay(base, UNKNOWN=True)
+
+
+def test_overlay_chain_depth_is_bounded(base):
+    settings = base
+    for i in range(MAX_OVERLAY_DEPTH * 2):
+        settings = TenantSettings.overlay(settings, NAME=f'tenant-{i}', DB={'PORT': i})
+        assert settings._overlay_depth <= MAX_OVERLAY_DEPTH
+
+    assert settings.NAME == f'tenant-{MAX_OVERLAY_DEPTH * 2 - 1}'
+    assert settings.DB.HOST == 'db.example.com'
+    assert settings.DB.PORT == MAX_OVERLAY_DEPTH * 2 - 1
+    assert settings.DB._overlay_depth <= MAX_OVERLAY_DEPTH
+
+    base.DB = DBSettings()
+    assert settings.DB.HOST == 'localhost'
+
+
+def test_pickled_overlay_includes_base_values(base):
+    tenant = TenantSettings.overlay(base, DEBUG=True)
+    restored = pickle.loads(pickle.dumps(tenant))
+
+    assert restored.DEBUG is True
+    assert restored.NAME == 'base'
+    assert restored.DB.HOST == 'db.example.com'
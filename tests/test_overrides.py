@@ -0,0 +1,126 @@
+import asyncio
+import threading
+
+import pytest
+
+from concrete_settings import Settings, setting
+from concrete_settings import overrides
+from concrete_settings.sources import strategies
+
+
+class DBSettings(Settings):
+    HOST: str = 'localhost'
+    TIMEOUT: int = 30
+
+
+class AppSettings(Settings):
+    DEBUG: bool = False
+    FEATURE_ENABLED: bool = False
+    ALLOWED_HOSTS: list = []
+    DB = DBSettings()
+
+    @setting
+    def MODE(self) -> str:
+        return 'debug' if self.DEBUG else 'production'
+
+
+def test_overrides_are_active_within_block():
+    settings = AppSettings()
+    with settings.overrides(DEBUG=True, DB={'TIMEOUT': 5}):
+        assert settings.DEBUG is True
+        assert settings.MODE == 'debug'
+        assert settings.DB.TIMEOUT == 5
+        assert settings.DB.HOST == 'localhost'
+
+    assert settings.DEBUG is False
+    assert settings.DB.TIMEOUT == 30
+    assert overrides.active_count == 0
+
+
+def test_overrides_do_not_change_settings():
+    settings = AppSettings()
+    with settings.overrides(DEBUG=True):
+        pass
+    assert '__setting_DEBUG_value' not in settings.__dict__
+
+
+def test_overrides_apply_to_settings_object_only():
+    settings = AppSettings()
+    other_settings = AppSettings()
+    with settings.overrides(DEBUG=True):
+        assert other_settings.DEBUG is False
+
+
+def test_nested_overrides_blocks():
+    settings = AppSettings()
+    with settings.overrides(DEBUG=True, FEATURE_ENABLED=True):
+        with settings.overrides(DEBUG=False):
+            assert settings.DEBUG is False
+            assert settings.FEATURE_ENABLED is True
+        assert settings.DEBUG is True
+
+
+def test_update_within_overrides_block_updates_stored_values():
+    settings = AppSettings()
+    settings.DB = DBSettings()
+    settings.fingerprint()
+    with settings.overrides(ALLOWED_HOSTS=['override.example.com'], DB={'TIMEOUT': 5}):
+        changes = settings.update(
+            {'ALLOWED_HOSTS': ['example.com'], 'DB': {'TIMEOUT': 10}},
+            strategies={'ALLOWED_HOSTS': strategies.append},
+            return_changes=True,
+        )
+        assert settings.ALLOWED_HOSTS == ['override.example.com']
+        assert settings.DB.TIMEOUT == 5
+
+    assert settings.ALLOWED_HOSTS == ['example.com']
+    assert settings.DB.TIMEOUT == 10
+    assert changes['ALLOWED_HOSTS'].old == []
+    assert changes['DB.TIMEOUT'].old == 30
+
+    expected = AppSettings()
+    expected.DB = DBSettings()
+    expected.update({'ALLOWED_HOSTS': ['example.com'], 'DB': {'TIMEOUT': 10}})
+    assert settings.fingerprint() == expected.fingerprint()
+
+
+def test_overrides_unknown_or_property_setting_fails():
+    settings = AppSettings()
+    with pytest.raises(AttributeError):
+        with settings.overrides(UNKNOWN=True):
+            pass
+
+    with pytest.raises(AttributeError):
+        with settings.overrides(MODE='test'):
+            pass
+
+
+def test_overrides_are_not_visible_in_other_threads():
+    settings = AppSettings()
+    seen = []
+
+    with settings.overrides(DEBUG=True):
+        thread = threading.Thread(target=lambda: seen.append(settings.DEBUG))
+        thread.start()
+        thread.join()
+
+    assert seen == [False]
+
+
+def test_overrides_in_concurrent_tasks():
+    settings = AppSettings()
+
+    async def handle_request(timeout):
+        with settings.overrides(DB={'TIMEOUT': timeout}):
+            await asyncio.sleep(0)
+            return settings.DB.TIMEOUT
+
+    async def main():
+        return await asyncio.gather(*(handle_request(t) for t in (1, 2, 3)))
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(main()) == [1, 2, 3]
+    finally:
+        loop.close()
+    assert settings.DB.TIMEOUT == 30
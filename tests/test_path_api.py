@@ -0,0 +1,85 @@
+import pytest
+
+from concrete_settings import Settings, setting
+
+
+class CacheSettings(Settings):
+    BACKEND: str = 'locmem'
+    TIMEOUT: int = 300
+
+
+class CachesSettings(Settings):
+    DEFAULT = CacheSettings()
+    SESSIONS = CacheSettings()
+
+
+class AppSettings(Settings):
+    TIMEOUT: int = 30
+    CACHES = CachesSettings()
+
+    @setting
+    def DEFAULT_CACHE_TIMEOUT(self) -> int:
+        return self.CACHES.DEFAULT.TIMEOUT
+
+
+@pytest.fixture
+def app_settings():
+    settings = AppSettings()
+    settings.CACHES = CachesSettings()
+    settings.CACHES.DEFAULT = CacheSettings()
+    settings.CACHES.SESSIONS = CacheSettings()
+    return settings
+
+
+def test_get(app_settings):
+    assert app_settings.get('TIMEOUT') == 30
+    assert app_settings.get('CACHES.DEFAULT.BACKEND') == 'locmem'
+    assert app_settings.get('CACHES.DEFAULT') is app_settings.CACHES.DEFAULT
+    assert app_settings.get('DEFAULT_CACHE_TIMEOUT') == 300
+
+
+def test_get_unknown_path_fails(app_settings):
+    with pytest.raises(KeyError):
+        app_settings.get('CACHES.UNKNOWN')
+
+
+def test_set(app_settings):
+    app_settings.set('CACHES.SESSIONS.TIMEOUT', 60)
+
+    assert app_settings.CACHES.SESSIONS.TIMEOUT == 60
+    assert app_settings.CACHES.DEFAULT.TIMEOUT == 300
+
+
+def test_set_unknown_path_fails(app_settings):
+    with pytest.raises(KeyError):
+        app_settings.set('CACHES.SESSIONS.UNKNOWN', 60)
+
+
+def test_find(app_settings):
+    app_settings.CACHES.SESSIONS.TIMEOUT = 60
+
+    assert app_settings.find('*.*.TIMEOUT') == {
+        'CACHES.DEFAULT.TIMEOUT': 300,
+        'CACHES.SESSIONS.TIMEOUT': 60,
+    }
+    assert app_settings.find('**.TIMEOUT') == {
+        'CACHES.DEFAULT.TIMEOUT': 300,
+        'CACHES.SESSIONS.TIMEOUT': 60,
+        'TIMEOUT': 30,
+    }
+    assert app_settings.find('CACHES.DEFAULT.**') == {
+        'CACHES.DEFAULT.BACKEND': 'locmem',
+        'CACHES.DEFAULT.TIMEOUT': 300,
+    }
+    assert app_settings.find('UNKNOWN.*') == {}
+
+
+def test_find_results_are_cached_per_class(app_settings, mocker):
+    app_settings.find('**.BACKEND')
+    settings_paths = mocker.spy(AppSettings, 'settings_paths')
+
+    assert AppSettings().find('**.BACKEND') == {
+        'CACHES.DEFAULT.BACKEND': 'locmem',
+        'CACHES.SESSIONS.BACKEND': 'locmem',
+    }
+    settings_paths.assert_not_called()
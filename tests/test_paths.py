@@ -0,0 +1,36 @@
+import pytest
+
+from concrete_settings.paths import PathPattern, is_pattern
+
+
+@pytest.mark.parametrize(
+    'pattern, path, matches',
+    [
+        ('DB.HOST', ('DB', 'HOST'), True),
+        ('DB.HOST', ('DB',), False),
+        ('DB.HOST', ('DB', 'HOST', 'NAME'), False),
+        ('*.ALLOWED_*', ('APP', 'ALLOWED_HOSTS'), True),
+        ('*.ALLOWED_*', ('ALLOWED_HOSTS',), False),
+        ('*.ALLOWED_*', ('A', 'B', 'ALLOWED_HOSTS'), False),
+        ('DB.PO?T', ('DB', 'PORT'), True),
+        ('DB.[HP]OST', ('DB', 'HOST'), True),
+        ('CACHES.**', ('CACHES',), True),
+        ('CACHES.**', ('CACHES', 'DEFAULT', 'TIMEOUT'), True),
+        ('CACHES.**', ('DB', 'HOST'), False),
+        ('**.TIMEOUT', ('TIMEOUT',), True),
+        ('**.TIMEOUT', ('A', 'B', 'TIMEOUT'), True),
+        ('**.TIMEOUT', ('A', 'TIMEOUT', 'B'), False),
+        ('A.**.C', ('A', 'C'), True),
+        ('A.**.C', ('A', 'B', 'B', 'C'), True),
+        ('A.**.C', ('A', 'B', 'D'), False),
+    ],
+)
+def test_path_pattern_match(pattern, path, matches):
+    assert PathPattern(pattern).match(path) is matches
+
+
+def test_is_pattern():
+    assert is_pattern('*.HOST')
+    assert is_pattern('DB.PO?T')
+    assert is_pattern('CACHES.**')
+    assert not is_pattern('DB.HOST')
@@ -398,3 +398,38 @@ def test_nested_settings_extract_to_dict():
     MySettings().extract_to(d)
     assert d['DB_USERNAME'] == 'alex'
     assert d['DB_PASSWORD'] == 'secret_password'
+
+
+def test_preload_builds_nested_settings_caches():
+    class DBSettings(Settings):
+        HOST = 'localhost'
+
+    class MySettings(Settings):
+        DEBUG = False
+        DB = DBSettings()
+
+    MySettings().preload()
+    assert '_settings_paths' in MySettings.__dict__
+    assert '_schema_fingerprint' in MySettings.__dict__
+    assert '_settings_paths' in DBSettings.__dict__
+
+
+def test_preload_validates_settings():
+    class MySettings(Settings):
+        PORT: int = 'not a number'
+
+    with pytest.raises(ValidationError):
+        MySettings().preload()
+
+
+def test_preload_freezes_gc(mocker):
+    freeze = mocker.patch('gc.freeze', create=True)
+
+    class MySettings(Settings):
+        DEBUG = False
+
+    MySettings().preload()
+    freeze.assert_not_called()
+
+    MySettings().preload(freeze_gc=True)
+    freeze.assert_called_once_with()
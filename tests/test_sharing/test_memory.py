@@ -0,0 +1,55 @@
+import multiprocessing
+import sys
+
+import pytest
+
+from concrete_settings import Settings
+from concrete_settings.contrib.sharing import (
+    MemoryUsage,
+    SettingsMemoryProbe,
+    process_memory_usage,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform != 'linux', reason='requires /proc')
+
+
+class DBSettings(Settings):
+    HOST: str = 'localhost'
+
+
+class AppSettings(Settings):
+    ALLOWED_HOSTS: list = [f'host-{i}.example.com' for i in range(1000)]
+    DB = DBSettings()
+
+
+def test_process_memory_usage():
+    usage = process_memory_usage()
+    assert isinstance(usage, MemoryUsage)
+    assert usage.shared > 0
+    assert usage.private > 0
+
+
+def test_settings_memory_is_private_before_fork():
+    probe = SettingsMemoryProbe(AppSettings())
+    usage = probe.measure()
+    assert usage.private > 0
+    assert usage.shared == 0
+
+
+def _measure_in_worker(probe, queue):
+    queue.put(probe.measure())
+
+
+def test_settings_memory_is_shared_after_fork():
+    app_settings = AppSettings()
+    app_settings.preload()
+    probe = SettingsMemoryProbe(app_settings)
+
+    ctx = multiprocessing.get_context('fork')
+    queue = ctx.Queue()
+    worker = ctx.Process(target=_measure_in_worker, args=(probe, queue))
+    worker.start()
+    worker.join(10)
+
+    assert worker.exitcode == 0
+    assert queue.get(timeout=1).shared > 0
@@ -0,0 +1,148 @@
+import multiprocessing
+import pickle
+import sys
+import uuid
+
+import pytest
+
+from concrete_settings import Settings
+from concrete_settings.contrib.sharing import SharedSettings, SharedSettingsPublisher
+from concrete_settings.contrib.sharing.shared_memory import SharedSettingsError
+from concrete_settings.exceptions import FrozenSettingsError
+from concrete_settings.snapshot import SnapshotError
+
+
+class Table:
+    """A value which supports zero-copy pickling"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        return Table, (pickle.PickleBuffer(self.data),)
+
+
+class DBSettings(Settings):
+    HOST: str = 'localhost'
+
+
+class AppSettings(Settings):
+    DEBUG: bool = False
+    ALLOWED_HOSTS: list = []
+    TABLE: Table = Table(bytearray(b'\0' * 16))
+    DB = DBSettings()
+
+
+@pytest.fixture
+def name():
+    return f'cs-test-{uuid.uuid4().hex[:12]}'
+
+
+@pytest.fixture
+def publisher(name):
+    with SharedSettingsPublisher(name) as publisher:
+        yield publisher
+
+
+@pytest.fixture
+def app_settings():
+    settings = AppSettings()
+    settings.update(
+        {
+            'DEBUG': True,
+            'ALLOWED_HOSTS': ['example.com'],
+            'TABLE': Table(bytearray(b'lookup table')),
+            'DB': {'HOST': 'db.example.com'},
+        }
+    )
+    return settings
+
+
+def test_attach_published_settings(name, publisher, app_settings):
+    assert publisher.publish(app_settings) == 1
+
+    with SharedSettings(AppSettings, name) as shared:
+        settings = shared.settings
+        assert shared.generation == 1
+        assert isinstance(settings, AppSettings)
+        assert settings.DEBUG is True
+        assert settings.ALLOWED_HOSTS == ['example.com']
+        assert settings.DB.HOST == 'db.example.com'
+
+
+def test_attached_settings_are_read_only(name, publisher, app_settings):
+    publisher.publish(app_settings)
+
+    with SharedSettings(AppSettings, name) as shared:
+        with pytest.raises(FrozenSettingsError):
+            shared.settings.DEBUG = False
+        with pytest.raises(FrozenSettingsError):
+            shared.settings.DB.HOST = 'localhost'
+
+
+def test_out_of_band_values_refer_to_shared_memory(name, publisher, app_settings):
+    publisher.publish(app_settings)
+
+    with SharedSettings(AppSettings, name) as shared:
+        data = shared.settings.TABLE.data
+        assert isinstance(data, memoryview)
+        assert data.readonly
+        assert bytes(data) == b'lookup table'
+        del data
+
+
+def test_refresh_attaches_new_generation(name, publisher, app_settings):
+    publisher.publish(app_settings)
+
+    with SharedSettings(AppSettings, name) as shared:
+        old_settings = shared.settings
+        assert not shared.changed()
+        assert not shared.refresh()
+
+        app_settings.DEBUG = False
+        assert publisher.publish(app_settings) == 2
+
+        assert shared.changed()
+        assert shared.refresh()
+        assert shared.generation == 2
+        assert shared.settings.DEBUG is False
+        assert old_settings.DEBUG is True
+        assert not shared.changed()
+
+
+def test_attach_before_publishing(name, publisher, app_settings):
+    with SharedSettings(AppSettings, name) as shared:
+        with pytest.raises(SharedSettingsError):
+            shared.settings
+
+        publisher.publish(app_settings)
+        assert shared.refresh()
+        assert shared.settings.DEBUG is True
+
+
+def test_attach_with_different_schema_fails(name, publisher, app_settings):
+    class OtherSettings(Settings):
+        DEBUG: bool = False
+
+    publisher.publish(app_settings)
+    with pytest.raises(SnapshotError):
+        SharedSettings(OtherSettings, name)
+
+
+def _read_in_worker(name, queue):
+    with SharedSettings(AppSettings, name) as shared:
+        queue.put((shared.generation, shared.settings.DB.HOST))
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='requires fork start method')
+def test_attach_in_forked_worker(name, publisher, app_settings):
+    publisher.publish(app_settings)
+
+    ctx = multiprocessing.get_context('fork')
+    queue = ctx.Queue()
+    worker = ctx.Process(target=_read_in_worker, args=(name, queue))
+    worker.start()
+    worker.join(10)
+
+    assert worker.exitcode == 0
+    assert queue.get(timeout=1) == (1, 'db.example.com')
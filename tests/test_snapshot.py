@@ -0,0 +1,115 @@
+import uuid
+
+import pytest
+
+from concrete_settings import Settings, setting
+from concrete_settings.contrib.settings.uuid import UUIDSetting
+from concrete_settings.snapshot import SnapshotError
+
+
+class DBSettings(Settings):
+    HOST: str = 'localhost'
+    PORT: int = 5432
+
+
+class AppSettings(Settings):
+    DEBUG: bool = False
+    PAYLOAD: bytes = b''
+    DB = DBSettings()
+
+    @setting
+    def URL(self) -> str:
+        return f'{self.DB.HOST}:{self.DB.PORT}'
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / 'settings.snapshot'
+
+
+def test_settings_paths_flatten_nested_settings():
+    paths = [path for path, _ in AppSettings.settings_paths()]
+    assert paths == [('DB', 'HOST'), ('DB', 'PORT'), ('DEBUG',), ('PAYLOAD',), ('URL',)]
+
+
+def test_schema_fingerprint_depends_on_structure():
+    class OtherSettings(Settings):
+        DEBUG: bool = False
+        PAYLOAD: bytes = b''
+        DB = DBSettings()
+
+    class SameSettings(Settings):
+        DEBUG: bool = True
+        PAYLOAD: bytes = b'value'
+        DB = DBSettings()
+
+        @setting
+        def URL(self) -> str:
+            return ''
+
+    assert AppSettings.schema_fingerprint() == SameSettings.schema_fingerprint()
+    assert AppSettings.schema_fingerprint() != OtherSettings.schema_fingerprint()
+
+
+def test_snapshot_round_trip(snapshot_path):
+    settings = AppSettings()
+    settings.update({'DEBUG': True, 'PAYLOAD': b'x' * 1024, 'DB': {'PORT': 6432}})
+    settings.dump_snapshot(snapshot_path)
+
+    loaded = AppSettings.load_snapshot(snapshot_path)
+    assert isinstance(loaded, AppSettings)
+    assert loaded.DEBUG is True
+    assert loaded.PAYLOAD == b'x' * 1024
+    assert loaded.DB.HOST == 'localhost'
+    assert loaded.DB.PORT == 6432
+    assert loaded.URL == 'localhost:6432'
+
+
+def test_load_snapshot_does_not_convert_values_again(snapshot_path):
+    class InstanceSettings(Settings):
+        ID = UUIDSetting(uuid.UUID(int=0))
+
+    instance_id = uuid.uuid4()
+    settings = InstanceSettings()
+    settings.ID = str(instance_id)
+    settings.dump_snapshot(snapshot_path)
+
+    assert InstanceSettings.load_snapshot(snapshot_path).ID == instance_id
+
+
+def test_load_snapshot_with_mismatched_schema_fails(snapshot_path):
+    class OtherSettings(Settings):
+        DEBUG: int = 0
+
+    AppSettings().dump_snapshot(snapshot_path)
+    with pytest.raises(SnapshotError, match='does not match the schema'):
+        OtherSettings.load_snapshot(snapshot_path)
+
+
+def test_load_invalid_snapshot_fails(snapshot_path):
+    snapshot_path.write_bytes(b'{"DEBUG": true}')
+    with pytest.raises(SnapshotError, match='not a settings snapshot'):
+        AppSettings.load_snapshot(snapshot_path)
+
+
+def test_load_truncated_snapshot_fails(snapshot_path):
+    AppSettings().dump_snapshot(snapshot_path)
+    snapshot_path.write_bytes(snapshot_path.read_bytes()[:20])
+    with pytest.raises(SnapshotError, match='corrupted'):
+        AppSettings.load_snapshot(snapshot_path)
+
+
+def test_load_missing_snapshot_fails(snapshot_path):
+    with pytest.raises(SnapshotError, match='not found'):
+        AppSettings.load_snapshot(snapshot_path)
+
+
+def test_load_snapshot_does_not_alter_shared_nested_settings(snapshot_path):
+    settings = AppSettings()
+    settings.DB = DBSettings()
+    settings.DB.HOST = 'db.example.com'
+    settings.dump_snapshot(snapshot_path)
+
+    loaded = AppSettings.load_snapshot(snapshot_path)
+    assert loaded.DB.HOST == 'db.example.com'
+    assert AppSettings.DB.HOST == 'localhost'
@@ -0,0 +1,142 @@
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+from uuid import UUID
+
+import pytest
+
+from concrete_settings import Settings
+from concrete_settings.contrib.settings.uuid import UUIDSetting  # noqa: F401
+from concrete_settings.contrib.sources import EnvVarSource
+from concrete_settings.sources import StringSourceMixin
+from concrete_settings.sources.converters import ConverterRegistry, converters
+
+
+def convert(val, type_hint):
+    return StringSourceMixin.convert_value(val, type_hint)
+
+
+@pytest.mark.parametrize(
+    'val, type_hint, expected',
+    [
+        ('10', int, 10),
+        ('10.25', float, 10.25),
+        ('True', bool, True),
+        ('yes', bool, 'yes'),
+        ('abc', str, 'abc'),
+        ('abc', Any, 'abc'),
+        ('abc', None, 'abc'),
+        ('/etc/app', Path, Path('/etc/app')),
+        ('1.10', Decimal, Decimal('1.10')),
+    ],
+)
+def test_convert_scalars(val, type_hint, expected):
+    assert convert(val, type_hint) == expected
+
+
+@pytest.mark.parametrize(
+    'val, type_hint, expected',
+    [
+        ('a, b ,c', List[str], ['a', 'b', 'c']),
+        ('1,2,3', List[int], [1, 2, 3]),
+        ('[1, 2, 3]', List[int], [1, 2, 3]),
+        ('["1", "2"]', List[int], [1, 2]),
+        ('', List[int], []),
+        ('a,b', list, ['a', 'b']),
+        ('1,2', Tuple[int, ...], (1, 2)),
+        ('1,abc', Tuple[int, str], (1, 'abc')),
+        ('1,2,2', Set[int], {1, 2}),
+        ('1,2', FrozenSet[int], frozenset({1, 2})),
+        ('{"a": "1", "b": 2}', Dict[str, int], {'a': 1, 'b': 2}),
+        ('{"a": 1}', dict, {'a': 1}),
+        ('not json', Dict[str, int], 'not json'),
+        ('[1, 2', List[int], '[1, 2'),
+    ],
+)
+def test_convert_containers(val, type_hint, expected):
+    assert convert(val, type_hint) == expected
+
+
+@pytest.mark.parametrize(
+    'val, type_hint, expected',
+    [
+        ('10', Optional[int], 10),
+        ('', Optional[int], None),
+        ('null', Optional[int], None),
+        ('None', Optional[str], None),
+        ('abc', Optional[int], 'abc'),
+        ('10', Union[int, str], 10),
+        ('abc', Union[int, str], 'abc'),
+        ('1,2', Optional[List[int]], [1, 2]),
+    ],
+)
+def test_convert_unions(val, type_hint, expected):
+    assert convert(val, type_hint) == expected
+
+
+def test_registered_setting_type_is_left_to_setting_class():
+    uuid_str = '12345678-1234-5678-1234-567812345678'
+    assert convert(uuid_str, UUID) == uuid_str
+    assert convert(uuid_str, Optional[UUID]) == uuid_str
+
+
+def test_env_var_source_updates_uuid_setting(monkeypatch):
+    uuid_str = '12345678-1234-5678-1234-567812345678'
+    monkeypatch.setenv('INSTANCE_ID', uuid_str)
+
+    class AppSettings(Settings):
+        INSTANCE_ID: UUID = UUID(int=0)
+
+    app_settings = AppSettings()
+    app_settings.update(EnvVarSource())
+    assert app_settings.INSTANCE_ID == UUID(uuid_str)
+
+
+def test_converter_is_compiled_once(mocker):
+    registry = ConverterRegistry()
+    compile_spy = mocker.spy(registry, '_compile')
+
+    converter = registry.get_converter(List[int])
+    assert registry.get_converter(List[int]) is converter
+    assert compile_spy.call_count == 2  # List[int] and int
+
+
+def test_register_custom_converter():
+    registry = ConverterRegistry()
+    registry.register(int, lambda val: int(val, 16))
+    assert registry.convert('ff', int) == 255
+    assert registry.convert('ff,10', List[int]) == [255, 16]
+
+
+def test_register_converter_invalidates_compiled_converters():
+    registry = ConverterRegistry()
+    assert registry.convert('10', List[int]) == ['10']
+
+    registry.register(int, int)
+    assert registry.convert('10', List[int]) == [10]
+
+
+def test_env_var_source_converts_typed_settings(monkeypatch):
+    monkeypatch.setenv('ALLOWED_HOSTS', 'a.example.com,b.example.com')
+    monkeypatch.setenv('LIMITS', '{"cpu": 2}')
+    monkeypatch.setenv('TIMEOUT', '')
+    monkeypatch.setenv('ROOT', '/var/app')
+
+    class AppSettings(Settings):
+        ALLOWED_HOSTS: List[str] = []
+        LIMITS: Dict[str, int] = {}
+        TIMEOUT: Optional[int] = 10
+        ROOT: Path = Path('/')
+
+    app_settings = AppSettings()
+    app_settings.update(EnvVarSource())
+
+    assert app_settings.is_valid(), app_settings.errors
+    assert app_settings.ALLOWED_HOSTS == ['a.example.com', 'b.example.com']
+    assert app_settings.LIMITS == {'cpu': 2}
+    assert app_settings.TIMEOUT is None
+    assert app_settings.ROOT == Path('/var/app')
+
+
+def test_default_registry_is_shared_by_string_sources():
+    assert StringSourceMixin.converters is converters
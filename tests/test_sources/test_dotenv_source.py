@@ -0,0 +1,129 @@
+from typing import List
+
+import pytest
+
+from concrete_settings import Setting, Settings
+from concrete_settings.contrib.sources import DotEnvSource
+from concrete_settings.exceptions import ConcreteSettingsError
+from concrete_settings.sources import get_source, NotFound
+
+
+def S(name: str, type_hint=str) -> Setting:
+    """A helper function which creates a setting and assigns it a name."""
+    s = Setting(type_hint=type_hint)
+    s.__set_name__(s, name)
+    return s
+
+
+def dotenv_source(fs, contents: str, **kwargs) -> DotEnvSource:
+    fs.create_file('/test/.env', contents=contents)
+    return DotEnvSource('/test/.env', **kwargs)
+
+
+@pytest.mark.parametrize('path', ['/test/.env', '/test/production.env'])
+def test_get_dotenv_file_returns_dotenv_source(path):
+    assert isinstance(get_source(path), DotEnvSource)
+
+
+def test_dotenv_source_read_unquoted_value(fs):
+    src = dotenv_source(fs, 'A=abc\nB = 10  \n')
+    assert src.read(S('A')) == 'abc'
+    assert src.read(S('B', int)) == 10
+    assert src.read(S('C')) is NotFound
+
+
+def test_dotenv_source_skips_comments_and_blank_lines(fs):
+    src = dotenv_source(fs, '# comment\n\n  \nA=1 # inline comment\nB=a#b\n')
+    assert src.read(S('A')) == '1'
+    assert src.read(S('B')) == 'a#b'
+
+
+def test_dotenv_source_export_prefix(fs):
+    src = dotenv_source(fs, 'export A=1\n')
+    assert src.read(S('A')) == '1'
+
+
+def test_dotenv_source_single_quoted_value_is_literal(fs):
+    src = dotenv_source(fs, "A=1\nB=' ${A} \\n # ' # comment\n")
+    assert src.read(S('B')) == ' ${A} \\n # '
+
+
+def test_dotenv_source_double_quoted_value_escapes(fs):
+    src = dotenv_source(fs, r'A="a\nb\t\"c\" \\ \$"' + '\n')
+    assert src.read(S('A')) == 'a\nb\t"c" \\ $'
+
+
+def test_dotenv_source_multiline_double_quoted_value(fs):
+    src = dotenv_source(fs, 'A="first\nsecond"\nB=2\n')
+    assert src.read(S('A')) == 'first\nsecond'
+    assert src.read(S('B')) == '2'
+
+
+def test_dotenv_source_crlf_line_endings(fs):
+    src = dotenv_source(fs, 'A=1\r\n\r\nB="2"\r\n')
+    assert src.read(S('A')) == '1'
+    assert src.read(S('B')) == '2'
+
+
+def test_dotenv_source_expands_references(fs, monkeypatch):
+    monkeypatch.setenv('HOME_DIR', '/home/alex')
+    monkeypatch.delenv('MISSING', raising=False)
+    src = dotenv_source(
+        fs,
+        'NAME=app\n'
+        'DIR=${HOME_DIR}/${NAME}\n'
+        'LOG="${DIR}/log \\${NAME}"\n'
+        'EMPTY=${MISSING}\n',
+    )
+    assert src.read(S('DIR')) == '/home/alex/app'
+    assert src.read(S('LOG')) == '/home/alex/app/log ${NAME}'
+    assert src.read(S('EMPTY')) == ''
+
+
+def test_dotenv_source_without_expansion(fs):
+    src = dotenv_source(fs, 'A=1\nB=${A}\n', expand=False)
+    assert src.read(S('B')) == '${A}'
+
+
+def test_dotenv_source_later_value_overrides_earlier(fs):
+    src = dotenv_source(fs, 'A=1\nB=${A}\nA=2\n')
+    assert src.read(S('A')) == '2'
+    assert src.read(S('B')) == '1'
+
+
+def test_dotenv_source_invalid_line_raises_error(fs):
+    src = dotenv_source(fs, 'A=1\nnot a variable\n')
+    with pytest.raises(ConcreteSettingsError, match='at line 2'):
+        src.read(S('A'))
+
+
+def test_dotenv_source_parse_file_returns_dict(fs, monkeypatch):
+    monkeypatch.setenv('USER', 'alex')
+    src = dotenv_source(fs, 'A=1\nGREETING="Hello, ${USER}"\n')
+    assert src._parse_file('/test/.env') == {'A': '1', 'GREETING': 'Hello, alex'}
+
+
+def test_dotenv_source_nested_keys_match_env_var_source(fs):
+    src = dotenv_source(fs, 'DB_HOST=db.example.com\nDB_PORT=6432\n')
+    assert src.read(S('HOST'), ('db',)) == 'db.example.com'
+    assert src.read(S('PORT', int), ('DB',)) == 6432
+
+
+def test_settings_update_from_dotenv_file(fs):
+    fs.create_file(
+        '/test/.env', contents='DEBUG=true\nHOSTS=a.com,b.com\nDB_PORT=6432\n'
+    )
+
+    class DBSettings(Settings):
+        PORT: int = 5432
+
+    class AppSettings(Settings):
+        DEBUG: bool = False
+        HOSTS: List[str] = []
+        DB = DBSettings()
+
+    settings = AppSettings()
+    settings.update('/test/.env')
+    assert settings.DEBUG is True
+    assert settings.HOSTS == ['a.com', 'b.com']
+    assert settings.DB.PORT == 6432
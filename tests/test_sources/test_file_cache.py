@@ -0,0 +1,135 @@
+import pytest
+
+from concrete_settings import Setting, Settings
+from concrete_settings.sources import FileCache, FileSource, get_source
+
+
+def S(name: str, type_hint=str) -> Setting:
+    """A helper function which creates a setting and assigns it a name."""
+    s = Setting(type_hint=type_hint)
+    s.__set_name__(s, name)
+    return s
+
+
+@pytest.fixture
+def file_cache(monkeypatch):
+    cache = FileCache()
+    monkeypatch.setattr(FileSource, 'cache', cache)
+    return cache
+
+
+@pytest.fixture
+def read_file_spy(mocker):
+    from concrete_settings.contrib.sources import JsonSource
+
+    return mocker.spy(JsonSource, '_read_file')
+
+
+def test_file_cache_is_disabled_by_default():
+    assert FileSource.cache is None
+
+
+def test_file_source_without_cache_parses_file_for_each_source(fs, read_file_spy):
+    fs.create_file('/test/settings.json', contents='{"A": 10}')
+
+    class AppSettings(Settings):
+        A: int = 0
+
+    AppSettings().update('/test/settings.json')
+    AppSettings().update('/test/settings.json')
+    assert read_file_spy.call_count == 2
+
+
+def test_file_cache_shares_parsed_file_between_sources(fs, file_cache, read_file_spy):
+    fs.create_file('/test/settings.json', contents='{"A": 10}')
+
+    class AppSettings(Settings):
+        A: int = 0
+
+    s1 = AppSettings()
+    s1.update('/test/settings.json')
+    s2 = AppSettings()
+    s2.update('/test/settings.json')
+
+    assert s1.A == s2.A == 10
+    assert read_file_spy.call_count == 1
+    assert '/test/settings.json' in file_cache
+
+
+def test_file_cache_invalidates_changed_file(fs, file_cache, read_file_spy):
+    f = fs.create_file('/test/settings.json', contents='{"A": 10}')
+
+    class AppSettings(Settings):
+        A: int = 0
+
+    AppSettings().update('/test/settings.json')
+    f.set_contents('{"A": 200}')
+
+    s = AppSettings()
+    s.update('/test/settings.json')
+    assert s.A == 200
+    assert read_file_spy.call_count == 2
+    assert len(file_cache) == 1
+
+
+def test_file_cache_values_are_not_shared_between_settings(fs, file_cache):
+    fs.create_file('/test/settings.json', contents='{"HOSTS": ["a"], "DB": {}}')
+
+    class AppSettings(Settings):
+        HOSTS: list = []
+        DB: dict = {}
+
+    s1 = AppSettings()
+    s1.update('/test/settings.json')
+    s1.HOSTS.append('b')
+    s1.DB['HOST'] = 'b'
+
+    s2 = AppSettings()
+    s2.update('/test/settings.json')
+    assert s2.HOSTS == ['a']
+    assert s2.DB == {}
+
+
+def test_file_cache_evicts_least_recently_used_entry(fs, file_cache):
+    file_cache.max_entries = 2
+    for name in 'abc':
+        fs.create_file(f'/test/{name}.json', contents='{}')
+
+    get_source('/test/a.json').read(S('A'))
+    get_source('/test/b.json').read(S('A'))
+    get_source('/test/a.json').read(S('A'))
+    get_source('/test/c.json').read(S('A'))
+
+    assert '/test/a.json' in file_cache
+    assert '/test/b.json' not in file_cache
+    assert '/test/c.json' in file_cache
+
+
+def test_file_cache_evicts_entries_by_total_size(fs, file_cache):
+    file_cache.max_bytes = 20
+    fs.create_file('/test/a.json', contents='{"A": 1000000}')
+    fs.create_file('/test/b.json', contents='{"A": 2000000}')
+
+    get_source('/test/a.json').read(S('A'))
+    get_source('/test/b.json').read(S('A'))
+
+    assert '/test/a.json' not in file_cache
+    assert '/test/b.json' in file_cache
+    assert file_cache.size == 14
+
+
+def test_file_cache_does_not_store_file_larger_than_max_bytes(fs, file_cache):
+    file_cache.max_bytes = 4
+    fs.create_file('/test/a.json', contents='{"A": 10}')
+
+    assert get_source('/test/a.json').read(S('A')) == 10
+    assert len(file_cache) == 0
+
+
+def test_file_cache_clear(fs, file_cache):
+    fs.create_file('/test/a.json', contents='{}')
+    get_source('/test/a.json').read(S('A'))
+
+    file_cache.clear()
+    assert len(file_cache) == 0
+    assert file_cache.size == 0
@@ -0,0 +1,181 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from concrete_settings import Setting, Settings
+from concrete_settings.contrib.sources import HttpSource
+from concrete_settings.exceptions import ConcreteSettingsError
+from concrete_settings.sources import get_source, NotFound
+
+
+def S(name: str, type_hint=str) -> Setting:
+    """A helper function which creates a setting and assigns it a name."""
+    s = Setting(type_hint=type_hint)
+    s.__set_name__(s, name)
+    return s
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class ConfigServer:
+    def __init__(self):
+        self.documents = {}
+        self.requests = []
+        self.client_ports = set()
+        self.drop_connections = False
+
+        config_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                config_server.requests.append((self.path, dict(self.headers)))
+                config_server.client_ports.add(self.client_address[1])
+
+                if self.path not in config_server.documents:
+                    self._respond(404)
+                    return
+
+                body = json.dumps(config_server.documents[self.path]).encode()
+                etag = f'"{hash(body)}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self._respond(304, headers={'ETag': etag})
+                else:
+                    self._respond(200, body, {'ETag': etag})
+
+            def _respond(self, status, body=b'', headers=None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                # close the connection without notifying the client
+                self.close_connection = config_server.drop_connections
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def config_server(monkeypatch):
+    monkeypatch.setattr(HttpSource, 'response_cache', {})
+    server = ConfigServer()
+    server.start()
+    yield server
+    HttpSource.pool.clear()
+    server.stop()
+
+
+def test_get_http_url_returns_http_source():
+    assert isinstance(get_source('http://localhost/settings'), HttpSource)
+    assert isinstance(get_source('https://localhost/settings'), HttpSource)
+
+
+def test_get_http_url_with_file_extension_returns_http_source():
+    src = get_source('http://config.local/app/settings.json')
+    assert isinstance(src, HttpSource)
+
+
+def test_http_source_reads_values(config_server):
+    config_server.documents['/settings'] = {'A': 10, 'DB': {'HOST': 'db'}}
+    src = get_source(config_server.url + '/settings')
+
+    assert src.read(S('A')) == 10
+    assert src.read(S('HOST'), parents=('DB',)) == 'db'
+    assert src.read(S('NOT_EXISTS')) == NotFound
+
+
+def test_http_source_fetches_document_once(config_server):
+    config_server.documents['/settings'] = {'A': 10, 'B': 20, 'C': 30}
+
+    class AppSettings(Settings):
+        A: int = 0
+        B: int = 0
+        C: int = 0
+
+    app_settings = AppSettings()
+    app_settings.update(config_server.url + '/settings')
+
+    assert (app_settings.A, app_settings.B, app_settings.C) == (10, 20, 30)
+    assert len(config_server.requests) == 1
+
+
+def test_http_source_reuses_connections(config_server):
+    config_server.documents['/a'] = {'A': 1}
+    config_server.documents['/b'] = {'A': 2}
+
+    get_source(config_server.url + '/a').prefetch()
+    get_source(config_server.url + '/b').prefetch()
+
+    assert len(config_server.requests) == 2
+    assert len(config_server.client_ports) == 1
+
+
+def test_http_source_unchanged_document_is_not_modified(config_server):
+    config_server.documents['/settings'] = {'A': 10}
+
+    assert get_source(config_server.url + '/settings').read(S('A')) == 10
+    assert get_source(config_server.url + '/settings').read(S('A')) == 10
+
+    _, second_request_headers = config_server.requests[1]
+    assert 'If-None-Match' in second_request_headers
+
+
+def test_http_source_cached_values_are_not_shared(config_server):
+    config_server.documents['/settings'] = {'HOSTS': ['a']}
+
+    hosts = get_source(config_server.url + '/settings').read(S('HOSTS'))
+    hosts.append('b')
+
+    assert get_source(config_server.url + '/settings').read(S('HOSTS')) == ['a']
+
+
+def test_http_source_changed_document_is_fetched(config_server):
+    config_server.documents['/settings'] = {'A': 10}
+    get_source(config_server.url + '/settings').prefetch()
+
+    config_server.documents['/settings'] = {'A': 20}
+    assert get_source(config_server.url + '/settings').read(S('A')) == 20
+
+
+def test_http_source_reconnects_when_idle_connection_is_closed(config_server):
+    config_server.documents['/settings'] = {'A': 10}
+    config_server.drop_connections = True
+    get_source(config_server.url + '/settings').prefetch()
+
+    config_server.drop_connections = False
+    assert get_source(config_server.url + '/settings').read(S('A')) == 10
+
+
+def test_http_source_error_status_raises(config_server):
+    src = get_source(config_server.url + '/not-found')
+    with pytest.raises(ConcreteSettingsError):
+        src.prefetch()
+
+
+def test_http_source_connection_error_raises():
+    src = HttpSource('http://127.0.0.1:1/settings')
+    with pytest.raises(ConcreteSettingsError):
+        src.prefetch()
@@ -1,8 +1,11 @@
+import os
 from pathlib import Path
 
-from concrete_settings import Setting
+import pytest
+
+from concrete_settings import Setting, Settings
 from concrete_settings.contrib.sources import PythonSource
-from concrete_settings.sources import get_source, NotFound
+from concrete_settings.sources import FileCache, FileSource, get_source, NotFound
 
 MY_DIR = Path(__file__).parent
 PYTHON_SOURCE_PATH = str(MY_DIR / 'python_settings_fixture.py')
@@ -65,3 +68,77 @@ def test_python_source_read_non_existing_setting_returns_not_found():
     src = get_source(PYTHON_SOURCE_PATH)
     setting = S('NOT_EXISTS')
     assert src.read(setting) == NotFound
+
+
+@pytest.fixture
+def counting_settings_module(tmp_path, monkeypatch):
+    """A settings module which counts its executions in os.environ"""
+    monkeypatch.setenv('CS_TEST_EXEC_COUNT', '0')
+    path = tmp_path / 'counting_settings.py'
+    path.write_text(
+        'import os\n'
+        "count = int(os.environ['CS_TEST_EXEC_COUNT']) + 1\n"
+        "os.environ['CS_TEST_EXEC_COUNT'] = str(count)\n"
+        'DEBUG = True\n'
+    )
+    return path
+
+
+def exec_count():
+    return int(os.environ['CS_TEST_EXEC_COUNT'])
+
+
+def test_python_source_compiles_unchanged_file_once(
+    counting_settings_module, monkeypatch, mocker
+):
+    monkeypatch.setattr(PythonSource, 'code_cache', FileCache())
+    compile_spy = mocker.spy(PythonSource, '_compile')
+
+    get_source(str(counting_settings_module)).read(S('DEBUG'))
+    get_source(str(counting_settings_module)).read(S('DEBUG'))
+
+    assert compile_spy.call_count == 1
+    assert exec_count() == 2
+
+
+def test_python_source_recompiles_changed_file(counting_settings_module, monkeypatch):
+    monkeypatch.setattr(PythonSource, 'code_cache', FileCache())
+
+    get_source(str(counting_settings_module)).read(S('DEBUG'))
+    counting_settings_module.write_text('DEBUG = False\n')
+
+    assert get_source(str(counting_settings_module)).read(S('DEBUG')) is False
+
+
+def test_python_source_without_code_cache_compiles_every_time(
+    counting_settings_module, monkeypatch, mocker
+):
+    monkeypatch.setattr(PythonSource, 'code_cache', None)
+    compile_spy = mocker.spy(PythonSource, '_compile')
+
+    get_source(str(counting_settings_module)).read(S('DEBUG'))
+    get_source(str(counting_settings_module)).read(S('DEBUG'))
+
+    assert compile_spy.call_count == 2
+
+
+def test_python_source_with_file_cache_reuses_namespace(
+    counting_settings_module, monkeypatch
+):
+    monkeypatch.setattr(FileSource, 'cache', FileCache())
+
+    class AppSettings(Settings):
+        DEBUG: bool = False
+
+    for _ in range(3):
+        app_settings = AppSettings()
+        app_settings.update(str(counting_settings_module))
+        assert app_settings.DEBUG is True
+
+    assert exec_count() == 1
+
+
+def test_python_source_module_attributes():
+    src = get_source(PYTHON_SOURCE_PATH)
+    assert src.read(S('__file__')) == PYTHON_SOURCE_PATH
+    assert src.read(S('__name__')) == 'python_settings_fixture'
@@ -1,6 +1,11 @@
+from uuid import UUID, uuid4
+
 import pytest
 from concrete_settings import Setting, Settings
+from concrete_settings.contrib.settings.uuid import UUIDSetting
+from concrete_settings.settings import Change
 from concrete_settings import sources
+from concrete_settings.paths import PathPattern
 from concrete_settings.sources import strategies, NotFound
 
 from ..utils import Match
@@ -11,6 +16,96 @@ def test_get_source_fail_for_unknown_source():
         assert sources.get_source('/test/dummy')
 
 
+@pytest.fixture
+def source_registry(monkeypatch):
+    """Isolate source registrations made by a test"""
+    monkeypatch.setattr(sources, '_extension_sources', dict(sources._extension_sources))
+    monkeypatch.setattr(sources, '_type_sources', dict(sources._type_sources))
+    monkeypatch.setattr(sources, '_predicate_sources', list(sources._predicate_sources))
+    sources._source_class_for_type.cache_clear()
+    yield
+    sources._source_class_for_type.cache_clear()
+
+
+def test_get_source_for_path_object(fs):
+    from pathlib import Path
+    from concrete_settings.contrib.sources import JsonSource
+
+    fs.create_file('/test/settings.json', contents='{}')
+    assert isinstance(sources.get_source(Path('/test/settings.json')), JsonSource)
+
+
+def test_get_source_for_dict_subclass():
+    from collections import OrderedDict
+
+    assert isinstance(sources.get_source(OrderedDict()), sources.DictSource)
+
+
+def test_register_source_overrides_extension(source_registry):
+    @sources.register_source
+    class MyJsonSource(sources.FileSource):
+        extensions = ['.json']
+
+    assert isinstance(sources.get_source('/test/settings.json'), MyJsonSource)
+
+
+def test_get_source_prefers_longest_extension(source_registry):
+    @sources.register_source
+    class GzSource(sources.FileSource):
+        extensions = ['.gz']
+
+    @sources.register_source
+    class TarGzSource(sources.FileSource):
+        extensions = ['.tar.gz']
+
+    assert isinstance(sources.get_source('/test/settings.tar.gz'), TarGzSource)
+    assert isinstance(sources.get_source('/test/settings.gz'), GzSource)
+
+
+def test_get_source_for_dotfile(source_registry):
+    @sources.register_source
+    class DotEnvLikeSource(sources.FileSource):
+        extensions = ['.env']
+
+    assert isinstance(sources.get_source('/test/.env'), DotEnvLikeSource)
+
+
+def test_predicate_sources_are_asked_by_priority(source_registry):
+    def make_source_cls(prefix):
+        class PrefixSource(sources.Source):
+            @classmethod
+            def get_source(cls, src):
+                if isinstance(src, str) and src.startswith(prefix):
+                    return cls()
+                return None
+
+        return PrefixSource
+
+    sources.register_source(make_source_cls('mem://'))
+    HighPrioritySource = sources.register_source(priority=10)(
+        make_source_cls('mem://')
+    )
+
+    assert isinstance(sources.get_source('mem://a'), HighPrioritySource)
+
+
+def test_predicate_sources_with_same_priority_are_asked_in_registration_order(
+    source_registry,
+):
+    class FirstSource(sources.Source):
+        @staticmethod
+        def get_source(src):
+            return FirstSource() if src == 'mem://' else None
+
+    class SecondSource(sources.Source):
+        @staticmethod
+        def get_source(src):
+            return SecondSource() if src == 'mem://' else None
+
+    sources.register_source(FirstSource)
+    sources.register_source(SecondSource)
+    assert isinstance(sources.get_source('mem://'), FirstSource)
+
 #
 # StringSourceMixin
 #
@@ -227,3 +322,302 @@ def test_update_strategy_prepend():
     assert s.TPL == (3, 4, 1, 2)
     assert s.STR == '3412'
     assert s.INT == 46
+
+
+def test_update_strategy_of_nested_setting():
+    class DBSettings(Settings):
+        OPTIONS: list = ['a']
+
+    class S(Settings):
+        OPTIONS: list = ['a']
+        DB = DBSettings()
+
+    s = S()
+    s.update(
+        {'OPTIONS': ['b'], 'DB': {'OPTIONS': ['b']}},
+        strategies={'DB.OPTIONS': strategies.append},
+    )
+    assert s.OPTIONS == ['b']
+    assert s.DB.OPTIONS == ['a', 'b']
+
+
+def test_update_strategy_patterns():
+    class CacheSettings(Settings):
+        ALLOWED_HOSTS: list = ['a']
+        ALLOWED_IPS: list = ['a']
+        BLOCKED_HOSTS: list = ['a']
+
+    class S(Settings):
+        ALLOWED_HOSTS: list = ['a']
+        CACHES = CacheSettings()
+
+    s = S()
+    s.update(
+        {
+            'ALLOWED_HOSTS': ['b'],
+            'CACHES': {
+                'ALLOWED_HOSTS': ['b'],
+                'ALLOWED_IPS': ['b'],
+                'BLOCKED_HOSTS': ['b'],
+            },
+        },
+        strategies={
+            'CACHES.ALLOWED_IPS': strategies.overwrite,
+            '*.ALLOWED_*': strategies.append,
+            'CACHES.**': strategies.prepend,
+        },
+    )
+    assert s.ALLOWED_HOSTS == ['b']
+    assert s.CACHES.ALLOWED_HOSTS == ['a', 'b']
+    assert s.CACHES.ALLOWED_IPS == ['b']
+    assert s.CACHES.BLOCKED_HOSTS == ['b', 'a']
+
+
+def test_update_strategies_are_resolved_once(mocker):
+    class S(Settings):
+        A: list = []
+        B: list = []
+
+    update_strategies = {'*': strategies.append}
+    match_spy = mocker.spy(PathPattern, 'match')
+
+    s = S()
+    for _ in range(3):
+        s.update({'A': [1], 'B': [2]}, strategies=update_strategies)
+
+    assert s.A == [1, 1, 1]
+    assert s.B == [2, 2, 2]
+    assert match_spy.call_count == 2
+
+
+def test_update_strategy_deep_merge():
+    class S(Settings):
+        CACHES: dict = {
+            'default': {'BACKEND': 'locmem', 'OPTIONS': {'TIMEOUT': 60}},
+            'sessions': {'BACKEND': 'locmem'},
+        }
+
+    s = S()
+    current = s.CACHES
+    s.update(
+        {'CACHES': {'default': {'OPTIONS': {'MAX_ENTRIES': 100}}, 'extra': {}}},
+        strategies={'CACHES': strategies.deep_merge},
+    )
+
+    assert s.CACHES == {
+        'default': {'BACKEND': 'locmem', 'OPTIONS': {'TIMEOUT': 60, 'MAX_ENTRIES': 100}},
+        'sessions': {'BACKEND': 'locmem'},
+        'extra': {},
+    }
+    assert current == S.CACHES.value, 'current value must not be modified'
+    assert s.CACHES['sessions'] is current['sessions']
+
+
+def test_deep_merge_shares_unchanged_subtrees():
+    current = {'A': {'B': {'C': 1}}, 'D': {'E': [1, 2]}}
+    new = {'A': {'B': {'C': 1}}, 'F': {'G': 1}}
+
+    merged = strategies.deep_merge(current, new)
+    assert merged == {'A': {'B': {'C': 1}}, 'D': {'E': [1, 2]}, 'F': {'G': 1}}
+    assert merged['A'] is current['A']
+    assert merged['D'] is current['D']
+    assert merged['F'] is new['F']
+
+    assert strategies.deep_merge(current, {'A': {'B': {}}}) is current
+
+
+@pytest.mark.parametrize(
+    'current, new', [({'A': 1}, [1]), ([1], {'A': 1}), ({'A': {'B': 1}}, {'A': 2})]
+)
+def test_deep_merge_overwrites_non_dict_values(current, new):
+    assert strategies.deep_merge(current, new) == new
+    if isinstance(current, dict) and isinstance(new, dict):
+        assert strategies.deep_merge(current, new) == {'A': 2}
+
+
+@pytest.mark.parametrize(
+    'strategy, current, new_values',
+    [
+        (strategies.append, [1], [[2], [3, 4], []]),
+        (strategies.append, (1,), [(2,), (3, 4)]),
+        (strategies.append, 'a', ['b', 'cd']),
+        (strategies.append, 1, [2, 3]),
+        (strategies.prepend, [1], [[2], [3, 4], []]),
+        (strategies.prepend, (1,), [(2,), (3, 4)]),
+        (strategies.prepend, b'a', [b'b', b'cd']),
+        (strategies.prepend, 1, [2, 3]),
+        (strategies.deep_merge, {'A': {'B': 1}}, [{'A': {'C': 2}}, {'A': {'B': 3}}]),
+        (strategies.overwrite, 1, [2, 3]),
+    ],
+)
+def test_fold_equals_successive_strategy_calls(strategy, current, new_values):
+    expected = current
+    for new_value in new_values:
+        expected = strategy(expected, new_value)
+
+    assert strategies.fold(strategy, current, new_values) == expected
+
+
+def test_update_many_uses_strategy_fold(mocker):
+    class S(Settings):
+        LST: list = [1]
+
+    def concat(current_value, new_value):
+        return current_value + new_value
+
+    concat.fold = mocker.Mock(return_value=[1, 2, 3])
+
+    s = S()
+    s.update_many([{'LST': [2]}, {}, {'LST': [3]}], strategies={'LST': concat})
+    assert s.LST == [1, 2, 3]
+    concat.fold.assert_called_once_with([1], [[2], [3]])
+
+
+def test_update_returns_nothing_by_default():
+    class S(Settings):
+        A: int = 0
+
+    assert S().update({'A': 1}) is None
+
+
+def test_update_returns_changes():
+    class DBSettings(Settings):
+        HOST: str = 'localhost'
+        PORT: int = 5432
+
+    class S(Settings):
+        DEBUG: bool = False
+        NAME: str = 'app'
+        DB = DBSettings()
+
+    s = S()
+    changes = s.update(
+        {'DEBUG': True, 'NAME': 'app', 'DB': {'PORT': 6432}}, return_changes=True
+    )
+    assert changes == {
+        'DEBUG': Change(old=False, new=True),
+        'DB.PORT': Change(old=5432, new=6432),
+    }
+
+
+def test_update_changes_reflect_strategies():
+    class S(Settings):
+        LST: list = [1]
+
+    s = S()
+    changes = s.update_many(
+        [{'LST': [2]}, {'LST': [3]}],
+        strategies={'LST': strategies.append},
+        return_changes=True,
+    )
+    assert changes == {'LST': Change([1], [1, 2, 3])}
+    assert s.update({'LST': []}, {'LST': strategies.append}, return_changes=True) == {}
+
+
+def test_update_changes_hold_values_converted_by_setting():
+    instance_id = uuid4()
+
+    class S(Settings):
+        ID = UUIDSetting(instance_id)
+
+    s = S()
+    assert s.update({'ID': str(instance_id)}, return_changes=True) == {}
+
+    other_id = uuid4()
+    changes = s.update({'ID': str(other_id)}, return_changes=True)
+    assert changes == {'ID': Change(instance_id, other_id)}
+    assert isinstance(changes['ID'].new, UUID)
+
+
+#
+# Updating from many sources
+#
+
+
+def test_update_many_equals_chained_updates(fs):
+    fs.create_file('/test/settings.json', contents='{"LST": [5], "NESTED": {"T": 30}}')
+
+    class Nested(Settings):
+        T: int = 10
+
+    class S(Settings):
+        LST: list = [1, 2]
+        STR: str = 'a'
+        NESTED = Nested()
+
+    srcs = [
+        {'LST': [3], 'STR': 'b', 'NESTED': {'T': 20}},
+        '/test/settings.json',
+        {'STR': 'c', 'NESTED': {}},
+    ]
+    update_strategies = {'LST': strategies.append}
+
+    chained = S()
+    for src in srcs:
+        chained.update(src, strategies=update_strategies)
+    chained_values = {}
+    chained.extract_to(chained_values)
+
+    many = S()
+    many.update_many(srcs, strategies=update_strategies)
+    many_values = {}
+    many.extract_to(many_values)
+
+    assert many_values == chained_values
+    assert many_values == {'LST': [1, 2, 3, 5], 'STR': 'c', 'NESTED_T': 30}
+
+
+def test_update_many_writes_each_setting_once(mocker):
+    class S(Settings):
+        A: int = 0
+        B: int = 0
+
+    set_value_spy = mocker.spy(S.A, 'set_value')
+
+    s = S()
+    s.update_many([{'A': 1}, {'A': 2, 'B': 2}, {'A': 3}])
+
+    assert s.A == 3
+    assert s.B == 2
+    set_value_spy.assert_called_once_with(s, 3)
+
+
+def test_update_many_reads_sources_in_order(mocker):
+    class S(Settings):
+        A: int = 0
+
+    read_order = []
+
+    def make_source(n):
+        src = mocker.Mock(spec=sources.Source)
+        src.read = mocker.MagicMock(
+            side_effect=lambda *ignore: read_order.append(n) or n
+        )
+        return src
+
+    s = S()
+    s.update_many([make_source(1), make_source(2), make_source(3)])
+
+    assert read_order == [1, 2, 3]
+    assert s.A == 3
+
+
+def test_update_many_does_not_write_setting_not_found_in_sources(mocker):
+    class S(Settings):
+        A: int = 0
+
+    set_value_spy = mocker.spy(S.A, 'set_value')
+
+    s = S()
+    s.update_many([{}, {}])
+
+    set_value_spy.assert_not_called()
+
+
+def test_file_source_without_read_file_fails(fs):
+    class TextSource(sources.FileSource):
+        extensions = ['.txt']
+
+    fs.create_file('/test/settings.txt', contents='')
+    with pytest.raises(NotImplementedError):
+        TextSource('/test/settings.txt').read(Setting())
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+
+import pytest
+
+from concrete_settings import Settings
+from concrete_settings.sources import AsyncSource, DictSource, NotFound, strategies
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class SlowDictSource(AsyncSource):
+    def __init__(self, data, delay, events):
+        self.data = None
+        self._raw = data
+        self._delay = delay
+        self._events = events
+
+    async def prefetch_async(self):
+        self._events.append(('start', self._raw))
+        await asyncio.sleep(self._delay)
+        self.data = self._raw
+        self._events.append(('end', self._raw))
+
+    def read(self, setting, parents=()):
+        return self.data.get(setting.name, NotFound)
+
+
+class AppSettings(Settings):
+    HOST: str = 'localhost'
+    PORT: int = 80
+    ADMINS: list = ['alex']
+
+
+def test_update_async_fetches_sources_concurrently():
+    events = []
+    app_settings = AppSettings()
+
+    run(
+        app_settings.update_async(
+            SlowDictSource({'HOST': 'a'}, 0.05, events),
+            SlowDictSource({'PORT': 8080}, 0.01, events),
+        )
+    )
+
+    assert [e[0] for e in events] == ['start', 'start', 'end', 'end']
+    assert app_settings.HOST == 'a'
+    assert app_settings.PORT == 8080
+
+
+def test_update_async_applies_sources_in_given_order():
+    events = []
+    app_settings = AppSettings()
+
+    # The first source finishes fetching last,
+    # yet the second one takes precedence.
+    run(
+        app_settings.update_async(
+            SlowDictSource({'HOST': 'a', 'PORT': 1}, 0.05, events),
+            SlowDictSource({'HOST': 'b'}, 0.0, events),
+        )
+    )
+
+    assert app_settings.HOST == 'b'
+    assert app_settings.PORT == 1
+
+
+def test_update_async_matches_sequential_updates():
+    sources = [
+        {'ADMINS': ['bob'], 'HOST': 'a'},
+        {'ADMINS': ['carl']},
+        {'HOST': 'b', 'PORT': 8080},
+    ]
+    update_strategies = {'ADMINS': strategies.append}
+
+    sequential = AppSettings()
+    for src in sources:
+        sequential.update(src, strategies=update_strategies)
+
+    concurrent = AppSettings()
+    run(concurrent.update_async(*sources, strategies=update_strategies))
+
+    assert concurrent.ADMINS == sequential.ADMINS == ['alex', 'bob', 'carl']
+    assert concurrent.HOST == sequential.HOST
+    assert concurrent.PORT == sequential.PORT
+
+
+def test_update_async_prefetches_blocking_sources_in_executor():
+    main_thread = threading.current_thread()
+    prefetch_threads = []
+
+    class BlockingSource(DictSource):
+        def prefetch(self):
+            prefetch_threads.append(threading.current_thread())
+
+    app_settings = AppSettings()
+    run(app_settings.update_async(BlockingSource({'PORT': 10})))
+
+    assert app_settings.PORT == 10
+    assert prefetch_threads and prefetch_threads[0] is not main_thread
+
+
+def test_update_async_loads_file_sources(fs):
+    fs.create_file('/test/settings.json', contents='{"HOST": "example.com"}')
+    app_settings = AppSettings()
+
+    run(app_settings.update_async('/test/settings.json', {'PORT': 443}))
+
+    assert app_settings.HOST == 'example.com'
+    assert app_settings.PORT == 443
+
+
+def test_update_with_async_source_prefetches_it():
+    events = []
+    app_settings = AppSettings()
+    app_settings.update(SlowDictSource({'HOST': 'a'}, 0, events))
+    assert app_settings.HOST == 'a'
+
+
+def test_update_async_strategy_requires_dict():
+    app_settings = AppSettings()
+    with pytest.raises(AssertionError):
+        run(app_settings.update_async({}, strategies=strategies.append))
+
+
+def test_update_async_returns_changes():
+    app_settings = AppSettings()
+    changes = run(
+        app_settings.update_async(
+            {'PORT': 80}, {'HOST': 'example.com'}, return_changes=True
+        )
+    )
+    assert list(changes) == ['HOST']
+    assert changes['HOST'].old == 'localhost'
+    assert changes['HOST'].new == 'example.com'
+
+
+def test_async_source_without_prefetch_async_fails():
+    with pytest.raises(NotImplementedError):
+        AsyncSource().prefetch()
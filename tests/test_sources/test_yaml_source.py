@@ -109,3 +109,99 @@ def test_yaml_source_read_non_existing_setting_returns_not_found(fs):
 
     setting = S('NOT_EXISTS')
     assert ysrc.read(setting) == NotFound
+
+
+def test_yaml_source_uses_libyaml_loader_when_available():
+    import yaml
+
+    if not yaml.__with_libyaml__:
+        pytest.skip('PyYAML is built without libyaml')
+    assert YamlSource.loader() is yaml.CSafeLoader
+
+
+def test_yaml_source_falls_back_to_pure_python_loader(monkeypatch):
+    import yaml
+
+    monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+    assert YamlSource.loader() is yaml.SafeLoader
+
+
+def test_yaml_source_libyaml_can_be_disabled(monkeypatch):
+    import yaml
+
+    monkeypatch.setattr(YamlSource, 'use_libyaml', False)
+    assert YamlSource.loader() is yaml.SafeLoader
+
+
+@pytest.mark.parametrize('use_libyaml', [True, False])
+def test_yaml_source_loaders_read_same_values(fs, monkeypatch, use_libyaml):
+    monkeypatch.setattr(YamlSource, 'use_libyaml', use_libyaml)
+    fs.create_file(
+        '/test/settings.yaml',
+        contents='''
+    A:
+      B: [1, 2.5, true, null, abc]
+    ''',
+    )
+    ysrc = get_source('/test/settings.yaml')
+    assert ysrc.read(S('B'), parents=('A',)) == [1, 2.5, True, None, 'abc']
+
+
+PROFILES_YAML = '''
+profile: dev
+DEBUG: true
+DB:
+  HOST: localhost
+---
+profile: prod
+DEBUG: false
+DB:
+  HOST: db.example.com
+'''
+
+
+@pytest.mark.parametrize('use_libyaml', [True, False])
+def test_yaml_source_reads_profile_document(fs, monkeypatch, use_libyaml):
+    monkeypatch.setattr(YamlSource, 'use_libyaml', use_libyaml)
+    fs.create_file('/test/settings.yaml', contents=PROFILES_YAML)
+
+    ysrc = YamlSource('/test/settings.yaml', profile='prod')
+    assert ysrc.read(S('DEBUG')) is False
+    assert ysrc.read(S('HOST'), parents=('DB',)) == 'db.example.com'
+    assert ysrc.read(S('profile')) == NotFound
+
+
+def test_yaml_source_profile_does_not_parse_following_documents(fs):
+    fs.create_file(
+        '/test/settings.yaml', contents=PROFILES_YAML + '---\n  - [invalid: yaml\n'
+    )
+    ysrc = YamlSource('/test/settings.yaml', profile='dev')
+    assert ysrc.read(S('DEBUG')) is True
+
+
+def test_yaml_source_profile_constructs_selected_document_only(fs, mocker):
+    fs.create_file('/test/settings.yaml', contents=PROFILES_YAML)
+    construct_spy = mocker.spy(YamlSource.loader(), 'construct_document')
+
+    YamlSource('/test/settings.yaml', profile='prod').prefetch()
+    construct_spy.assert_called_once()
+
+
+def test_yaml_source_missing_profile_raises(fs):
+    fs.create_file('/test/settings.yaml', contents=PROFILES_YAML)
+    ysrc = YamlSource('/test/settings.yaml', profile='staging')
+
+    with pytest.raises(ConcreteSettingsError):
+        ysrc.read(S('DEBUG'))
+
+
+def test_yaml_source_profiles_are_cached_separately(fs, monkeypatch):
+    from concrete_settings.sources import FileCache, FileSource
+
+    monkeypatch.setattr(FileSource, 'cache', FileCache())
+    fs.create_file('/test/settings.yaml', contents=PROFILES_YAML)
+
+    dev = YamlSource('/test/settings.yaml', profile='dev')
+    prod = YamlSource('/test/settings.yaml', profile='prod')
+    assert dev.read(S('DEBUG')) is True
+    assert prod.read(S('DEBUG')) is False
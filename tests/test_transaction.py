@@ -0,0 +1,113 @@
+import asyncio
+import threading
+
+import pytest
+
+from concrete_settings.exceptions import ValidationError
+from concrete_settings.transaction import TransactionError
+
+from .conftest import AppSettings
+
+
+def test_transaction_commits_changes():
+    settings = AppSettings()
+    with settings.transaction():
+        settings.update({'DEBUG': True, 'DB': {'PORT': 6432}})
+        assert settings.DEBUG is True
+        assert settings.DB.PORT == 6432
+        settings.is_valid(raise_exception=True)
+
+    assert settings.DEBUG is True
+    assert settings.DB.PORT == 6432
+
+
+def test_transaction_discards_changes_on_error():
+    settings = AppSettings()
+    with pytest.raises(ValidationError):
+        with settings.transaction():
+            settings.update({'DEBUG': True, 'DB': {'HOST': 'db', 'PORT': 1}})
+            settings.is_valid(raise_exception=True)
+
+    assert settings.DEBUG is False
+    assert settings.DB.HOST == 'localhost'
+    assert settings.DB.PORT == 5432
+
+
+def test_transaction_does_not_modify_shared_nested_settings():
+    settings = AppSettings()
+    with settings.transaction():
+        settings.DB.PORT = 6432
+
+    assert settings.DB.PORT == 6432
+    assert AppSettings().DB.PORT == 5432
+    assert AppSettings.DB.PORT == 5432
+
+
+def test_transaction_stages_writes_via_references_to_nested_settings():
+    settings = AppSettings()
+    db = settings.DB
+    with pytest.raises(RuntimeError):
+        with settings.transaction():
+            settings.DB.HOST = 'db'
+            db.PORT = 6432
+            assert db.PORT == 6432
+            raise RuntimeError()
+
+    assert db.HOST == 'localhost'
+    assert db.PORT == 5432
+
+
+def test_transaction_changes_are_invisible_to_other_threads():
+    settings = AppSettings()
+    seen = []
+
+    def read_settings():
+        seen.append((settings.DEBUG, settings.DB.PORT))
+
+    with settings.transaction():
+        settings.update({'DEBUG': True, 'DB': {'PORT': 6432}})
+        reader = threading.Thread(target=read_settings)
+        reader.start()
+        reader.join()
+
+    read_settings()
+    assert seen == [(False, 5432), (True, 6432)]
+
+
+def test_transaction_changes_are_visible_to_tasks_started_in_transaction():
+    settings = AppSettings()
+
+    async def read_debug():
+        return settings.DEBUG
+
+    async def update():
+        with settings.transaction():
+            settings.DEBUG = True
+            return await asyncio.ensure_future(read_debug())
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(update()) is True
+    finally:
+        loop.close()
+
+
+def test_nested_transaction_of_the_same_settings_fails():
+    settings = AppSettings()
+    with settings.transaction():
+        with pytest.raises(TransactionError):
+            with settings.transaction():
+                pass
+
+
+def test_transactions_of_different_settings_can_be_nested():
+    first, second = AppSettings(), AppSettings()
+    with first.transaction():
+        first.DEBUG = True
+        with pytest.raises(RuntimeError):
+            with second.transaction():
+                second.DEBUG = True
+                raise RuntimeError()
+
+    assert first.DEBUG is True
+    assert second.DEBUG is False
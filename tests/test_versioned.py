@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from concrete_settings.exceptions import FrozenSettingsError, ValidationError
+from concrete_settings.versioned import VersionedSettings
+
+from .conftest import AppSettings
+
+
+def test_versioned_settings_current_version_is_frozen_copy():
+    settings = AppSettings()
+    versioned = VersionedSettings(settings)
+
+    current = versioned.current
+    assert versioned.version == 0
+    assert current is not settings
+    assert current.DB is not settings.DB
+    assert current.DB.PORT == 5432
+
+    with pytest.raises(FrozenSettingsError):
+        current.DEBUG = True
+    with pytest.raises(FrozenSettingsError):
+        current.DB.PORT = 6432
+
+    settings.DEBUG = True
+    assert current.DEBUG is False
+
+
+def test_versioned_settings_update_publishes_new_version():
+    versioned = VersionedSettings(AppSettings())
+    pinned = versioned.current
+
+    changes = versioned.update({'DB': {'PORT': 6432}}, return_changes=True)
+
+    assert changes == {'DB.PORT': (5432, 6432)}
+    assert versioned.version == 1
+    assert versioned.current.DB.PORT == 6432
+    assert pinned.DB.PORT == 5432, 'pinned version must not change'
+    assert AppSettings.DB.PORT == 5432
+
+
+def test_versioned_settings_invalid_update_keeps_current_version():
+    versioned = VersionedSettings(AppSettings())
+    current = versioned.current
+
+    with pytest.raises(ValidationError):
+        versioned.update({'DEBUG': True, 'DB': {'PORT': 1}})
+
+    assert versioned.current is current
+    assert versioned.version == 0
+
+
+def test_versioned_settings_write_block():
+    versioned = VersionedSettings(AppSettings())
+    with versioned.write() as draft:
+        draft.DEBUG = True
+        draft.DB.HOST = 'db'
+        assert versioned.current.DEBUG is False
+
+    version, current = versioned.pin()
+    assert version == 1
+    assert (current.DEBUG, current.DB.HOST) == (True, 'db')
+
+    with pytest.raises(RuntimeError):
+        with versioned.write() as draft:
+            draft.DEBUG = False
+            raise RuntimeError()
+    assert versioned.pin() == (1, current)
+
+
+def test_versioned_settings_readers_see_consistent_versions():
+    versioned = VersionedSettings(AppSettings())
+    stop = threading.Event()
+    inconsistent = []
+
+    def read():
+        while not stop.is_set():
+            settings = versioned.current
+            if settings.DB.HOST != f'host-{settings.DB.PORT}':
+                inconsistent.append((settings.DB.HOST, settings.DB.PORT))
+
+    versioned.update({'DB': {'HOST': 'host-2000', 'PORT': 2000}})
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+
+    for port in range(2001, 2201):
+        versioned.update({'DB': {'HOST': f'host-{port}', 'PORT': port}})
+
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert inconsistent == []
+    assert versioned.version == 201
@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+
+import pytest
+
+from concrete_settings import Settings, validate
+from concrete_settings.contrib.watchers import FileWatcher
+from concrete_settings.contrib.watchers.file_watcher import _Inotify, diff_documents
+from concrete_settings.exceptions import ConcreteSettingsError, ValidationError
+from concrete_settings.sources import strategies
+
+
+class DatabaseSettings(Settings):
+    HOST: str = 'localhost'
+    PORT: int = 5432
+
+
+def is_positive(value, **kwargs):
+    if value <= 0:
+        raise ValidationError('Value should be positive')
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    path = tmp_path / 'settings.json'
+
+    def write(data):
+        path.write_text(json.dumps(data))
+        # guarantee that the change is visible to stat() on coarse-grained file systems
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        return str(path)
+
+    return write
+
+
+@pytest.fixture
+def AppSettings():
+    class AppSettings(Settings):
+        DEBUG: bool = False
+        TIMEOUT: int = 10 @ validate(is_positive)
+        ADMINS: list = ['alex']
+        DB = DatabaseSettings()
+
+    return AppSettings
+
+
+def test_diff_documents():
+    old = {'A': 1, 'B': {'C': 2, 'D': 3}, 'E': 4, 'F': 1}
+    new = {'A': 1, 'B': {'C': 20, 'D': 3}, 'G': 5, 'F': True}
+    assert diff_documents(old, new) == {('B', 'C'), ('E',), ('F',), ('G',)}
+
+
+def test_watching_file_not_structured_as_settings_fails(AppSettings, tmp_path):
+    path = tmp_path / '.env'
+    path.write_text('DEBUG=true\n')
+
+    with pytest.raises(ConcreteSettingsError, match='not structured as settings'):
+        FileWatcher(AppSettings(), path)
+
+
+def test_reload_applies_only_changed_settings(AppSettings, settings_file):
+    path = settings_file({'DEBUG': True, 'TIMEOUT': 10, 'DB': {}})
+    app_settings = AppSettings()
+    app_settings.update(path)
+    watcher = FileWatcher(app_settings, path)
+
+    app_settings.DEBUG = False
+    settings_file({'DEBUG': True, 'TIMEOUT': 20, 'DB': {}})
+
+    assert watcher.reload() == ['TIMEOUT']
+    assert app_settings.TIMEOUT == 20
+    assert app_settings.DEBUG is False
+
+
+def test_reload_nested_settings(AppSettings, settings_file):
+    path = settings_file({'DB': {'HOST': 'db1', 'PORT': 1234}})
+    app_settings = AppSettings()
+    app_settings.update(path)
+    watcher = FileWatcher(app_settings, path)
+    db_before = app_settings.DB
+
+    settings_file({'DB': {'HOST': 'db2', 'PORT': 1234}})
+
+    assert watcher.reload() == ['DB.HOST']
+    assert app_settings.DB.HOST == 'db2'
+    assert app_settings.DB.PORT == 1234
+    # nested settings are swapped, not modified in-place
+    assert db_before.HOST == 'db1'
+
+
+def test_reload_does_not_modify_settings_of_other_instances(AppSettings, settings_file):
+    path = settings_file({'DB': {'HOST': 'db1'}})
+    app_settings = AppSettings()
+    other_settings = AppSettings()
+    watcher = FileWatcher(app_settings, path)
+
+    settings_file({'DB': {'HOST': 'db2'}})
+    watcher.reload()
+
+    assert app_settings.DB.HOST == 'db2'
+    assert other_settings.DB.HOST == 'localhost'
+
+
+def test_reload_applies_strategies_to_changed_settings(AppSettings, settings_file):
+    path = settings_file({'ADMINS': []})
+    app_settings = AppSettings()
+    watcher = FileWatcher(app_settings, path, strategies={'ADMINS': strategies.append})
+
+    settings_file({'ADMINS': ['bob']})
+    watcher.reload()
+    assert app_settings.ADMINS == ['alex', 'bob']
+
+
+def test_reload_with_invalid_value_leaves_settings_intact(AppSettings, settings_file):
+    path = settings_file({'DEBUG': False, 'TIMEOUT': 10})
+    app_settings = AppSettings()
+    watcher = FileWatcher(app_settings, path)
+
+    settings_file({'DEBUG': True, 'TIMEOUT': -1})
+    with pytest.raises(ValidationError):
+        watcher.reload()
+
+    assert app_settings.DEBUG is False
+    assert app_settings.TIMEOUT == 10
+
+
+def test_reload_after_invalid_value_diffs_against_applied_document(
+    AppSettings, settings_file
+):
+    path = settings_file({'TIMEOUT': 10})
+    app_settings = AppSettings()
+    watcher = FileWatcher(app_settings, path)
+
+    settings_file({'TIMEOUT': -1})
+    with pytest.raises(ValidationError):
+        watcher.reload()
+
+    settings_file({'TIMEOUT': 30})
+    assert watcher.reload() == ['TIMEOUT']
+    assert app_settings.TIMEOUT == 30
+
+
+def test_reload_runs_validate_of_affected_settings(settings_file):
+    class AppSettings(Settings):
+        MIN: int = 0
+        MAX: int = 10
+
+        def validate(self):
+            if self.MIN > self.MAX:
+                raise ValidationError('MIN should be less than MAX')
+
+    path = settings_file({'MIN': 0})
+    app_settings = AppSettings()
+    watcher = FileWatcher(app_settings, path)
+
+    settings_file({'MIN': 20})
+    with pytest.raises(ValidationError):
+        watcher.reload()
+    assert app_settings.MIN == 0
+
+
+def test_check_reloads_modified_file_only(AppSettings, settings_file, mocker):
+    path = settings_file({'TIMEOUT': 10})
+    watcher = FileWatcher(AppSettings(), path)
+    reload_spy = mocker.spy(watcher, 'reload')
+
+    assert watcher.check() == []
+    reload_spy.assert_not_called()
+
+    settings_file({'TIMEOUT': 20})
+    assert watcher.check() == ['TIMEOUT']
+    reload_spy.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'use_inotify',
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not _Inotify.is_available(), reason='inotify is not available'
+            ),
+        ),
+    ],
+)
+def test_watcher_thread_reloads_changed_file(
+    AppSettings, settings_file, use_inotify
+):
+    path = settings_file({'TIMEOUT': 10})
+    app_settings = AppSettings()
+    changed = threading.Event()
+
+    with FileWatcher(
+        app_settings,
+        path,
+        interval=0.05,
+        use_inotify=use_inotify,
+        on_change=lambda names: changed.set(),
+    ):
+        settings_file({'TIMEOUT': 20})
+        assert changed.wait(timeout=5)
+
+    assert app_settings.TIMEOUT == 20
+
+
+def test_watcher_thread_reports_errors(AppSettings, settings_file):
+    path = settings_file({'TIMEOUT': 10})
+    errors = []
+    error_reported = threading.Event()
+
+    def on_error(e):
+        errors.append(e)
+        error_reported.set()
+
+    with FileWatcher(
+        AppSettings(), path, interval=0.05, use_inotify=False, on_error=on_error
+    ):
+        settings_file({'TIMEOUT': -1})
+        assert error_reported.wait(timeout=5)
+
+    assert isinstance(errors[0], ValidationError)